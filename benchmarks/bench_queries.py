@@ -0,0 +1,65 @@
+"""Compare cached World.query iteration against the legacy per-call dict scan.
+
+Run from the repository root:
+    python benchmarks/bench_queries.py
+"""
+from __future__ import annotations
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from ecs.world import World
+from ecs.components import Position, Barrier, HP, DieFaces
+
+
+def legacy_entities_with(world: World, *comp_types):
+    """The pre-query implementation: walk the first store, probe every other store."""
+    first = world.get_component(comp_types[0])
+    for eid in first.keys():
+        ok = True
+        for ct in comp_types[1:]:
+            if eid not in world.get_component(ct):
+                ok = False
+                break
+        if ok:
+            yield eid
+
+
+def build_world(n: int) -> World:
+    world = World()
+    for k in range(n):
+        eid = world.create_entity()
+        world.add_component(eid, Position(k % 512, k // 512))
+        if k % 10 == 0:
+            world.add_component(eid, Barrier())
+        if k % 50 == 0:
+            world.add_component(eid, HP(current=5, max=5))
+            world.add_component(eid, DieFaces({}))
+    return world
+
+
+def _time(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def bench(n: int, repeat: int = 20):
+    world = build_world(n)
+    cases = [(Position, Barrier), (Position, HP, DieFaces)]
+    for types in cases:
+        world.query(*types)  # build once, outside the timed loop
+        legacy = _time(lambda: sum(1 for _ in legacy_entities_with(world, *types)), repeat)
+        cached = _time(lambda: sum(1 for _ in world.query(*types)), repeat)
+        names = '+'.join(t.__name__ for t in types)
+        print(f"n={n:>7} {names:<24} legacy {legacy * 1e3:8.3f} ms   query {cached * 1e3:8.3f} ms   x{legacy / cached:6.1f}")
+
+
+if __name__ == '__main__':
+    for n in (10_000, 100_000):
+        bench(n)
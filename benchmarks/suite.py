@@ -0,0 +1,338 @@
+"""Headless benchmark suite for the ECS systems, queries and cube projection math.
+
+Each case times one call of the code under test (setup excluded) over a range of
+scales (grid size, enemy count, barrier count) and reports median / min milliseconds.
+Results are written as JSON and can be compared against a saved baseline:
+
+    python benchmarks/suite.py                                  # print table
+    python benchmarks/suite.py --out results.json               # save results
+    python benchmarks/suite.py --baseline benchmarks/baseline.json --fail-on-regression
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+
+No window is opened; ecs.rendering is imported only for its projection helpers.
+"""
+from __future__ import annotations
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from ecs.world import World
+from ecs.components import Position, DieFaces, GridMove, TumbleAnim, TurnState, Barrier, GridGeometry, RenderCube, TileOccupancy
+from ecs.events import Event as ECSEvent, MOVE_REQUEST, MOVE_COMPLETE
+from ecs.die_factory import create_enemy_die, create_player_die
+from ecs.systems import movement_request_system, orientation_system, attack_effect_system, enemy_planning_system
+from ecs.rendering import cube_face_polygons
+from ecs.tumble import tumble_face_polygons
+from dicewalk.simulation import build_geometry, HEADLESS_SCREEN
+
+# (grid size, enemies, barriers); grid 8 matches the shipped game.
+SCALES: Tuple[Tuple[int, int, int], ...] = (
+    (8, 1, 3),
+    (8, 8, 8),
+    (64, 64, 256),
+    (256, 512, 4096),
+    (1024, 2048, 16384),
+)
+QUICK_SCALES = SCALES[:3]
+DEFAULT_REPEAT = 15
+DEFAULT_THRESHOLD = 1.25  # ratio vs baseline median counted as a regression
+DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+@dataclass
+class Scenario:
+    grid: int
+    world: World
+    geom: GridGeometry
+    enemies: List[int]
+    player: int
+    turn: TurnState
+
+
+def build_scenario(grid: int, enemies: int, barriers: int, seed: int = 0,
+                   systems: Sequence[Callable] = ()) -> Scenario:
+    """World with geometry, a player, `enemies` patrolling dice and `barriers` barriers
+    on distinct random tiles. Only `systems` are registered, so events a case emits are
+    read by the system under test and nothing else."""
+    rng = random.Random(seed)
+    cells = rng.sample(range(grid * grid), min(grid * grid, enemies + barriers + 1))
+    world = World()
+    geom = build_geometry(grid, *HEADLESS_SCREEN)
+    world.add_component(world.create_entity(), geom)
+    for fn in systems:
+        world.add_system(fn)
+    player = create_player_die(world, *divmod(cells[0], grid))
+    enemy_ids = []
+    for cell in cells[1:enemies + 1]:
+        eid = create_enemy_die(world, *divmod(cell, grid), ai=True)
+        enemy_ids.append(eid)
+    for cell in cells[enemies + 1:]:
+        beid = world.create_entity()
+        world.add_component(beid, Position(*divmod(cell, grid)))
+        world.add_component(beid, Barrier())
+    turn_eid = world.create_entity()
+    turn = TurnState()
+    world.add_component(turn_eid, turn)
+    return Scenario(grid, world, geom, enemy_ids, player, turn)
+
+
+def _measure(setup: Callable[[], None], run: Callable[[], object], repeat: int) -> List[float]:
+    times = []
+    clock = time.perf_counter
+    for _ in range(repeat):
+        setup()
+        start = clock()
+        run()
+        times.append(clock() - start)
+    return times
+
+
+def _noop():
+    pass
+
+
+# --- Cases: each returns (setup, run) for a scenario ---
+def case_movement_request(sc: Scenario):
+    world = sc.world
+    moves = world.get_component(GridMove)
+    anims = world.get_component(TumbleAnim)
+
+    def setup():
+        moves.clear()
+        anims.clear()
+        for n, eid in enumerate(sc.enemies):
+            di, dj = DIRS[n % 4]
+            world.emit(ECSEvent(type=MOVE_REQUEST, entity=eid, data={'di': di, 'dj': dj}))
+    return setup, lambda: movement_request_system(world, 0.016)
+
+
+def _emit_completes(sc: Scenario):
+    world = sc.world
+    pos = world.get_component(Position)
+
+    def setup():
+        for n, eid in enumerate(sc.enemies):
+            di, dj = DIRS[n % 4]
+            p = pos[eid]
+            world.emit(ECSEvent(type=MOVE_COMPLETE, entity=eid, data={'i': p.i, 'j': p.j, 'di': di, 'dj': dj}))
+    return setup
+
+
+def case_orientation(sc: Scenario):
+    return _emit_completes(sc), lambda: orientation_system(sc.world, 0.016)
+
+
+def case_attack_effect(sc: Scenario):
+    return _emit_completes(sc), lambda: attack_effect_system(sc.world, 0.016)
+
+
+def case_attack_effect_occupancy(sc: Scenario):
+    # Every enemy finishes a move in the same frame; victims come from TileOccupancy.
+    sc.world.add_component(sc.world.create_entity(), TileOccupancy())
+    return _emit_completes(sc), lambda: attack_effect_system(sc.world, 0.016)
+
+
+def case_occupancy_move(sc: Scenario):
+    # Every enemy steps one tile; cost per move should not grow with occupied tiles.
+    world = sc.world
+    world.add_component(world.create_entity(), TileOccupancy())
+    pos = world.get_component(Position)
+    grid = sc.grid
+
+    def run():
+        for eid in sc.enemies:
+            p = pos[eid]
+            world.set_position(eid, (p.i + 1) % grid, p.j)
+    return _noop, run
+
+
+def case_world_fork(sc: Scenario):
+    # Fork + discard; copy-on-write, so cost should not grow with the entity count.
+    world = sc.world
+
+    def run():
+        world.fork().discard()
+    return _noop, run
+
+
+def case_enemy_planning(sc: Scenario):
+    turn = sc.turn
+
+    def setup():
+        turn.phase = 'planning'
+        turn.planned.clear()
+    return setup, lambda: enemy_planning_system(sc.world, 0.016)
+
+
+def case_entities_with(sc: Scenario):
+    world = sc.world
+    return _noop, lambda: sum(1 for _ in world.entities_with(Position, DieFaces))
+
+
+def _dice_tiles(sc: Scenario):
+    pos = sc.world.get_component(Position)
+    cubes = sc.world.get_component(RenderCube)
+    return [(pos[e].i, pos[e].j, cubes[e].scale) for e in [sc.player] + sc.enemies]
+
+
+def case_cube_projection_cold(sc: Scenario):
+    geom = sc.geom
+    tiles = _dice_tiles(sc)
+
+    def run():
+        for i, j, scale in tiles:
+            cube_face_polygons(geom, i, j, scale)
+    return geom.invalidate, run
+
+
+def case_cube_projection_warm(sc: Scenario):
+    geom = sc.geom
+    tiles = _dice_tiles(sc)
+
+    def run():
+        for i, j, scale in tiles:
+            cube_face_polygons(geom, i, j, scale)
+    run()
+    return _noop, run
+
+
+def case_tumble_projection(sc: Scenario):
+    geom = sc.geom
+    tiles = _dice_tiles(sc)
+
+    def run():
+        for n, (i, j, scale) in enumerate(tiles):
+            di, dj = DIRS[n % 4]
+            tumble_face_polygons(geom, i, j, di, dj, scale, 0.37)
+    return _noop, run
+
+
+CASES: Dict[str, Tuple[Callable, Sequence[Callable]]] = {
+    'movement_request_system': (case_movement_request, (movement_request_system,)),
+    'orientation_system': (case_orientation, (orientation_system,)),
+    'attack_effect_system': (case_attack_effect, (attack_effect_system,)),
+    'attack_effect_occupancy': (case_attack_effect_occupancy, (attack_effect_system,)),
+    'occupancy_move': (case_occupancy_move, ()),
+    'world_fork': (case_world_fork, ()),
+    'enemy_planning_system': (case_enemy_planning, ()),
+    'entities_with': (case_entities_with, ()),
+    'cube_projection_cold': (case_cube_projection_cold, ()),
+    'cube_projection_warm': (case_cube_projection_warm, ()),
+    'tumble_projection': (case_tumble_projection, ()),
+}
+
+
+def result_key(case: str, grid: int, enemies: int, barriers: int) -> str:
+    return f"{case}[grid={grid},enemies={enemies},barriers={barriers}]"
+
+
+def run_suite(scales: Iterable[Tuple[int, int, int]] = SCALES, cases: Optional[Iterable[str]] = None,
+              repeat: int = DEFAULT_REPEAT, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Run every case at every scale; returns {result_key: {median_ms, min_ms, repeat}}."""
+    names = list(cases) if cases is not None else list(CASES)
+    results: Dict[str, Dict[str, float]] = {}
+    for grid, enemies, barriers in scales:
+        for name in names:
+            factory, systems = CASES[name]
+            sc = build_scenario(grid, enemies, barriers, seed, systems)
+            setup, run = factory(sc)
+            times = _measure(setup, run, repeat)
+            results[result_key(name, grid, enemies, barriers)] = {
+                'median_ms': statistics.median(times) * 1e3,
+                'min_ms': min(times) * 1e3,
+                'repeat': repeat,
+            }
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float = DEFAULT_THRESHOLD) -> Dict[str, Dict[str, float]]:
+    """{key: {baseline_ms, current_ms, ratio, regressed}} for keys present in both."""
+    out = {}
+    for key, cur in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        b = base['median_ms']
+        ratio = cur['median_ms'] / b if b > 0 else float('inf')
+        out[key] = {
+            'baseline_ms': b,
+            'current_ms': cur['median_ms'],
+            'ratio': ratio,
+            'regressed': ratio > threshold,
+        }
+    return out
+
+
+def _meta() -> Dict[str, str]:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def load_results(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path, encoding='utf-8') as fh:
+        return json.load(fh)['results']
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Headless ECS / render-math benchmarks.")
+    parser.add_argument('--quick', action='store_true', help="only the small scales")
+    parser.add_argument('--scale', action='append', metavar='GRID,ENEMIES,BARRIERS',
+                        help="custom scale (repeatable); replaces the default set")
+    parser.add_argument('--case', action='append', choices=sorted(CASES), help="run only these cases")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help="write results JSON here")
+    parser.add_argument('--baseline', help="compare against this results JSON")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="median ratio above which a case counts as regressed")
+    parser.add_argument('--fail-on-regression', action='store_true')
+    parser.add_argument('--save-baseline', help="write results as the new baseline")
+    args = parser.parse_args(argv)
+
+    if args.scale:
+        scales = [tuple(int(x) for x in s.split(',')) for s in args.scale]
+    else:
+        scales = QUICK_SCALES if args.quick else SCALES
+    results = run_suite(scales, args.case, args.repeat, args.seed)
+    doc = {'meta': _meta(), 'results': results}
+
+    comparison = compare(results, load_results(args.baseline), args.threshold) if args.baseline else {}
+    if comparison:
+        doc['comparison'] = comparison
+    for key, res in results.items():
+        line = f"{key:<72} {res['median_ms']:10.4f} ms (min {res['min_ms']:.4f})"
+        cmp = comparison.get(key)
+        if cmp:
+            flag = '  REGRESSED' if cmp['regressed'] else ''
+            line += f"  x{cmp['ratio']:.2f} vs baseline{flag}"
+        print(line)
+
+    for path in (args.out, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as fh:
+                json.dump(doc if path == args.out else {'meta': doc['meta'], 'results': results}, fh, indent=2)
+    regressed = [k for k, c in comparison.items() if c['regressed']]
+    if regressed:
+        print(f"{len(regressed)} case(s) slower than {args.threshold:.2f}x baseline")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,13 @@
 """dicewalk package initializer.
 
 Ensures tests can import `dicewalk.main` when running under pytest.
-Re-exports DiceWalkGame for convenience.
+Re-exports DiceWalkGame for convenience; the import is lazy so headless users of
+`dicewalk.simulation` never pull in arcade.
 """
 
-from .main import DiceWalkGame  # noqa: F401
+
+def __getattr__(name):
+    if name == "DiceWalkGame":
+        from .main import DiceWalkGame
+        return DiceWalkGame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,290 @@
+"""Vectorized DiceWalk: B independent boards stepped one turn at a time as NumPy arrays.
+
+`Simulation` runs one board through the ECS `World` (dicts of dataclasses, events,
+per-entity systems). For balance tuning we want millions of turns, so `BatchWorld`
+keeps the same state as struct-of-arrays and applies one whole turn per `step`:
+
+    batch = BatchWorld.from_simulations([Simulation(resolve='instant') for _ in range(4096)])
+    result = batch.step(actions)          # actions: (B, 2) int array of (di, dj) intents
+
+One `step` is one `Simulation.play_turn` with the rules of `enemy_planning_system`,
+`player_turn_commit_system`, `orientation_system` and `attack_effect_system`:
+
+- Planning (once per planning phase): each enemy tries its Patrol direction, reverses
+  and tries once more if blocked (bounds, barriers, other enemies' current tiles).
+- Commit: the player's target must be in bounds, free of barriers / enemies and not
+  claimed by a planned enemy move, else the intent is dropped and the plan kept for the
+  next step. (0, 0) passes: only enemies move.
+- Execute: every mover rolls one tile (orientation table), then attacks with the
+  effects of its new top face; damage is summed per die and clamped at 0.
+
+Boards whose player has reached 0 HP are `done` and ignore further actions (the World
+has no death rule, so parity with it holds up to that turn).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from ecs.components import AttackSet, Barrier, DieFaces, HP, Patrol, Position
+from ecs.die_factory import create_enemy_die, create_player_die
+from ecs.orientation import DIRECTIONS, POSITIONS, TOP_FACE, TRANSITIONS, POSITION_INDEX
+from ecs.world import World
+
+# Attack patterns in table column order; offsets per roll direction (DIRECTIONS order),
+# matching ecs.attack_utils.get_attack_targets.
+PATTERNS: Tuple[str, ...] = ('forward-single', 'left-single', 'right-single')
+_LEFT = {(1, 0): (0, -1), (-1, 0): (0, 1), (0, 1): (1, 0), (0, -1): (-1, 0)}
+PATTERN_OFFSETS = np.array(
+    [[d, _LEFT[d], (-_LEFT[d][0], -_LEFT[d][1])] for d in DIRECTIONS], dtype=np.int64)  # (4, 3, 2)
+
+TRANSITION_TABLE = np.array(TRANSITIONS, dtype=np.int64)  # (24, 4)
+# Base face (POSITIONS index) on top for each orientation.
+TOP_INDEX = np.array([POSITION_INDEX[name] for name in TOP_FACE], dtype=np.int64)  # (24,)
+
+
+def attack_table(faces: DieFaces, attacks: AttackSet) -> np.ndarray:
+    """(6, len(PATTERNS)) strength per base face and pattern for one die's AttackSet."""
+    table = np.zeros((len(POSITIONS), len(PATTERNS)), dtype=np.int64)
+    for n, pos in enumerate(POSITIONS):
+        side = faces.base.get(pos)
+        if side is None:
+            continue
+        for eff in attacks.effects.get(side.face_id, ()):
+            if eff.target_type in PATTERNS:
+                table[n, PATTERNS.index(eff.target_type)] += eff.strength
+    return table
+
+
+def _factory_tables() -> Tuple[np.ndarray, np.ndarray]:
+    w = World()
+    player = create_player_die(w, 0, 0)
+    enemy = create_enemy_die(w, 0, 0, ai=False)
+    faces = w.get_component(DieFaces)
+    attacks = w.get_component(AttackSet)
+    return attack_table(faces[player], attacks[player]), attack_table(faces[enemy], attacks[enemy])
+
+
+PLAYER_ATTACKS, ENEMY_ATTACKS = _factory_tables()
+
+
+def direction_index(di: np.ndarray, dj: np.ndarray) -> np.ndarray:
+    """DIRECTIONS index per (di, dj); only meaningful where the pair is a unit step."""
+    return np.where(di == 1, 0, np.where(di == -1, 1, np.where(dj == 1, 2, 3)))
+
+
+@dataclass(slots=True)
+class StepResult:
+    """Per-board outcome of one BatchWorld.step (all arrays have length B)."""
+    committed: np.ndarray      # bool: the turn executed
+    damage_dealt: np.ndarray   # int: damage the player's attack did this turn
+    damage_taken: np.ndarray   # int: damage the player received this turn
+
+
+class BatchWorld:
+    """B DiceWalk boards of one grid size and enemy count, stored as NumPy arrays.
+
+    Arrays (b = board, e = enemy; positions are (i, j) pairs):
+        player_pos (B, 2), player_orient (B,), player_hp (B,)
+        enemy_pos (B, E, 2), enemy_orient (B, E), enemy_hp (B, E), patrol (B, E, 2)
+        barriers (B, G, G) bool -- static barriers (enemies block via their positions)
+        planned (B,) bool, plan_ok (B, E) bool -- current planning-phase decisions
+    """
+
+    def __init__(self, boards: int, grid_size: int, player_start: Tuple[int, int] = (2, 2),
+                 enemy_starts: Sequence[Tuple[int, int]] = ((1, 1),),
+                 barriers: Sequence[Tuple[int, int]] = (), player_hp: int = 10, enemy_hp: int = 5,
+                 patrol: Tuple[int, int] = (1, 0), player_attacks: np.ndarray = PLAYER_ATTACKS,
+                 enemy_attacks: np.ndarray = ENEMY_ATTACKS):
+        B = boards
+        E = len(enemy_starts)
+        self.boards = B
+        self.grid_size = grid_size
+        self.enemies = E
+        self.player_pos = np.tile(np.array(player_start, dtype=np.int64), (B, 1))
+        self.player_orient = np.zeros(B, dtype=np.int64)
+        self.player_hp = np.full(B, player_hp, dtype=np.int64)
+        self.enemy_pos = np.tile(np.array(enemy_starts, dtype=np.int64).reshape(E, 2), (B, 1, 1))
+        self.enemy_orient = np.zeros((B, E), dtype=np.int64)
+        self.enemy_hp = np.full((B, E), enemy_hp, dtype=np.int64)
+        self.patrol = np.tile(np.array(patrol, dtype=np.int64), (B, E, 1))
+        self.barriers = np.zeros((B, grid_size, grid_size), dtype=bool)
+        for bi, bj in barriers:
+            self.barriers[:, bi, bj] = True
+        self.planned = np.zeros(B, dtype=bool)
+        self.plan_ok = np.zeros((B, E), dtype=bool)
+        self.player_attacks = np.asarray(player_attacks, dtype=np.int64)
+        self.enemy_attacks = np.asarray(enemy_attacks, dtype=np.int64)
+        self.turns = 0
+
+    @classmethod
+    def from_simulations(cls, sims: Sequence) -> "BatchWorld":
+        """One board per Simulation, copied from its World (same grid size / enemy count).
+
+        The worlds must be in the planning phase with nothing in flight.
+        """
+        first = sims[0]
+        batch = cls(len(sims), first.grid_size, enemy_starts=[(0, 0)] * len(first.enemy_entities))
+        for b, sim in enumerate(sims):
+            batch.load_board(b, sim)
+        return batch
+
+    def load_board(self, b: int, sim):
+        """Copy board `b` from a Simulation's World."""
+        w = sim.world
+        if sim.grid_size != self.grid_size or len(sim.enemy_entities) != self.enemies:
+            raise ValueError("simulation does not match the batch grid size / enemy count")
+        pos = w.get_component(Position)
+        faces = w.get_component(DieFaces)
+        hp = w.get_component(HP)
+        patrols = w.get_component(Patrol)
+        p = sim.player_entity
+        self.player_pos[b] = (pos[p].i, pos[p].j)
+        self.player_orient[b] = faces[p].orientation
+        self.player_hp[b] = hp[p].current
+        for n, e in enumerate(sim.enemy_entities):
+            self.enemy_pos[b, n] = (pos[e].i, pos[e].j)
+            self.enemy_orient[b, n] = faces[e].orientation
+            self.enemy_hp[b, n] = hp[e].current
+            self.patrol[b, n] = (patrols[e].di, patrols[e].dj)
+        self.barriers[b] = False
+        enemies = set(sim.enemy_entities)
+        for eid in w.get_component(Barrier):
+            if eid in enemies or eid not in pos:
+                continue
+            bp = pos[eid]
+            if 0 <= bp.i < self.grid_size and 0 <= bp.j < self.grid_size:
+                self.barriers[b, bp.i, bp.j] = True
+        turn = sim.turn
+        planned = {plan['entity'] for plan in turn.planned}
+        self.planned[b] = bool(planned)
+        self.plan_ok[b] = [e in planned for e in sim.enemy_entities]
+
+    @property
+    def done(self) -> np.ndarray:
+        return self.player_hp <= 0
+
+    # --- Rules ---
+    def _blocked(self, ti: np.ndarray, tj: np.ndarray, enemy_count: np.ndarray) -> np.ndarray:
+        """is_blocked for target tiles shaped (B, ...): bounds, static barriers, enemy tiles."""
+        G = self.grid_size
+        inside = (ti >= 0) & (ti < G) & (tj >= 0) & (tj < G)
+        ci = np.clip(ti, 0, G - 1)
+        cj = np.clip(tj, 0, G - 1)
+        b = np.arange(self.boards).reshape((-1,) + (1,) * (ti.ndim - 1))
+        return ~inside | self.barriers[b, ci, cj] | (enemy_count[b, ci, cj] > 0)
+
+    def _enemy_count(self) -> np.ndarray:
+        """(B, G, G) number of enemies on each tile."""
+        G = self.grid_size
+        flat = (np.arange(self.boards)[:, None] * G + self.enemy_pos[..., 0]) * G + self.enemy_pos[..., 1]
+        return np.bincount(flat.ravel(), minlength=self.boards * G * G).reshape(self.boards, G, G)
+
+    def _scatter(self, tiles: np.ndarray, strength: np.ndarray) -> np.ndarray:
+        """(B, G, G) summed strength landing on each tile; tiles (B, ..., 2), strength (B, ...)."""
+        B = self.boards
+        G = self.grid_size
+        ti = tiles[..., 0]
+        tj = tiles[..., 1]
+        hit = (strength > 0) & (ti >= 0) & (ti < G) & (tj >= 0) & (tj < G)
+        board = np.arange(B).reshape((-1,) + (1,) * (ti.ndim - 1))
+        flat = (np.broadcast_to(board, ti.shape) * G + ti) * G + tj
+        out = np.bincount(flat[hit], weights=strength[hit], minlength=B * G * G)
+        return out.astype(np.int64).reshape(B, G, G)
+
+    def _plan(self, boards: np.ndarray, enemy_count: np.ndarray):
+        """enemy_planning_system for the boards in mask `boards`."""
+        pos = self.enemy_pos
+        fwd = pos + self.patrol
+        back = pos - self.patrol
+        fwd_blocked = self._blocked(fwd[..., 0], fwd[..., 1], enemy_count)
+        back_blocked = self._blocked(back[..., 0], back[..., 1], enemy_count)
+        # Reverse when forward is blocked; blocked both ways reverses twice (unchanged).
+        flip = boards[:, None] & fwd_blocked & ~back_blocked
+        self.patrol = np.where(flip[..., None], -self.patrol, self.patrol)
+        ok = ~(fwd_blocked & back_blocked)
+        self.plan_ok = np.where(boards[:, None], ok, self.plan_ok)
+        # No enemy able to move leaves the plan empty: the World keeps re-planning and
+        # holds the intent, so such boards cannot commit.
+        has_plan = ok.any(axis=1) if self.enemies else np.ones(self.boards, dtype=bool)
+        self.planned = np.where(boards, has_plan, self.planned)
+
+    def step(self, actions) -> StepResult:
+        """Play one turn on every board. `actions` is (B, 2) (di, dj); (0, 0) passes."""
+        actions = np.asarray(actions, dtype=np.int64).reshape(self.boards, 2)
+        di = actions[:, 0]
+        dj = actions[:, 1]
+        if np.any(np.abs(di) + np.abs(dj) > 1):
+            raise ValueError("actions must be unit steps or (0, 0)")
+        B = self.boards
+        G = self.grid_size
+        live = ~self.done
+        enemy_count = self._enemy_count()
+        self._plan(live & ~self.planned, enemy_count)
+
+        # player_turn_commit_system
+        target = self.player_pos + actions
+        cancel = self._blocked(target[:, 0], target[:, 1], enemy_count)
+        enemy_targets = self.enemy_pos + self.patrol
+        claimed = self.plan_ok & np.all(enemy_targets == target[:, None, :], axis=2)
+        cancel |= claimed.any(axis=1)
+        commit = live & self.planned & ~cancel
+        player_moves = commit & ((di != 0) | (dj != 0))
+        enemy_moves = commit[:, None] & self.plan_ok
+
+        # Movement + orientation_system
+        pdir = direction_index(di, dj)
+        self.player_pos = np.where(player_moves[:, None], target, self.player_pos)
+        self.player_orient = np.where(player_moves, TRANSITION_TABLE[self.player_orient, pdir], self.player_orient)
+        edir = direction_index(self.patrol[..., 0], self.patrol[..., 1])
+        self.enemy_pos = np.where(enemy_moves[..., None], enemy_targets, self.enemy_pos)
+        self.enemy_orient = np.where(enemy_moves, TRANSITION_TABLE[self.enemy_orient, edir], self.enemy_orient)
+
+        # attack_effect_system: scatter every mover's damage onto a (B, G, G) grid, then
+        # gather it at each die's tile (attack tiles never include the attacker's own).
+        board = np.arange(B)
+        p_str = self.player_attacks[TOP_INDEX[self.player_orient]] * player_moves[:, None]  # (B, 3)
+        p_tiles = self.player_pos[:, None, :] + PATTERN_OFFSETS[pdir]  # (B, 3, 2)
+        e_str = self.enemy_attacks[TOP_INDEX[self.enemy_orient]] * enemy_moves[..., None]  # (B, E, 3)
+        e_tiles = self.enemy_pos[:, :, None, :] + PATTERN_OFFSETS[edir]  # (B, E, 3, 2)
+        p_grid = self._scatter(p_tiles, p_str)
+        grid = p_grid + self._scatter(e_tiles, e_str)
+        taken = grid[board, self.player_pos[:, 0], self.player_pos[:, 1]]
+        at_enemies = (board[:, None], self.enemy_pos[..., 0], self.enemy_pos[..., 1])
+        enemy_dmg = grid[at_enemies]
+        dealt = p_grid[at_enemies].sum(axis=1)
+
+        self.player_hp = np.maximum(0, self.player_hp - taken)
+        self.enemy_hp = np.maximum(0, self.enemy_hp - enemy_dmg)
+        self.planned &= ~commit
+        self.turns += 1
+        return StepResult(commit, np.where(commit, dealt, 0), np.where(commit, taken, 0))
+
+    def board_state(self, b: int) -> Dict[str, object]:
+        """Plain-Python snapshot of one board (for comparisons and debugging)."""
+        return {
+            'player': (tuple(int(x) for x in self.player_pos[b]), int(self.player_orient[b]), int(self.player_hp[b])),
+            'enemies': [
+                (tuple(int(x) for x in self.enemy_pos[b, n]), int(self.enemy_orient[b, n]),
+                 int(self.enemy_hp[b, n]), tuple(int(x) for x in self.patrol[b, n]))
+                for n in range(self.enemies)
+            ],
+        }
+
+
+def simulation_state(sim) -> Dict[str, object]:
+    """The same snapshot as BatchWorld.board_state, read from a Simulation's World."""
+    w = sim.world
+    pos = w.get_component(Position)
+    faces = w.get_component(DieFaces)
+    hp = w.get_component(HP)
+    patrols = w.get_component(Patrol)
+    p = sim.player_entity
+    return {
+        'player': ((pos[p].i, pos[p].j), faces[p].orientation, hp[p].current),
+        'enemies': [
+            ((pos[e].i, pos[e].j), faces[e].orientation, hp[e].current, (patrols[e].di, patrols[e].dj))
+            for e in sim.enemy_entities
+        ],
+    }
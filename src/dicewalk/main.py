@@ -13,15 +13,15 @@ _src_root = _here.parent.parent
 if str(_src_root) not in sys.path:
     sys.path.insert(0, str(_src_root))
 
-from ecs.die_factory import create_player_die, create_enemy_die
-from ecs.components import Tile, Position, GridGeometry, TurnState, Barrier, Renderable
-from ecs.world import World
-from ecs.systems import movement_request_system, movement_progress_system, orientation_system, tile_occupancy_system, attack_effect_system, player_turn_commit_system
-from ecs.rendering import render_system, draw_planned_move_highlights, draw_planned_attack_highlights
-from ecs.events import Event as ECSEvent, MOVE_REQUEST as ECS_MOVE_REQUEST, PLAYER_MOVE_INTENT
+from ecs.components import GridGeometry, Camera
+from ecs.camera import visible_tiles, pan, zoom_by
+from ecs.rendering import render_system, draw_grid, draw_planned_move_highlights, draw_planned_attack_highlights, RetainedRenderer, RENDER_STATS
+from dicewalk.simulation import Simulation, GRID_SIZE
 
 SCREEN_TITLE = "Dice Walk"
-GRID_SIZE = 8
+TRACE_PATH = "dicewalk.trace.json"
+PAN_STEP = 120  # screen pixels per W/A/S/D press
+ZOOM_STEP = 1.25
 
 
 class DiceWalkGame(arcade.Window):
@@ -30,73 +30,34 @@ class DiceWalkGame(arcade.Window):
         self.set_fullscreen(True)
         self.screen_width, self.screen_height = self.get_size()
         arcade.set_background_color(arcade.color.BLACK)
-        # ECS World
-        self.world = World()
-        # Inline grid geometry (replaces Level class)
-        tile_height = 0.7 * self.screen_height / (GRID_SIZE - 1)
-        tile_width = 2 * tile_height
-        origin_x = self.screen_width / 2
-        origin_y = self.screen_height / 2 - (GRID_SIZE - 1) * tile_height / 2
-        def iso_point_local(i: float, j: float):
-            x = origin_x + (i - j) * (tile_width / 2)
-            y = origin_y + (i + j) * (tile_height / 2)
-            return x, y
-        grid_lines = []
-        for i in range(GRID_SIZE + 1):
-            grid_lines.append((*iso_point_local(i, 0), *iso_point_local(i, GRID_SIZE)))
-        for j in range(GRID_SIZE + 1):
-            grid_lines.append((*iso_point_local(0, j), *iso_point_local(GRID_SIZE, j)))
-        geom = GridGeometry(GRID_SIZE, tile_height, tile_width, origin_x, origin_y, tuple(grid_lines))
-        self.grid_entity = self.world.create_entity()
-        self.world.add_component(self.grid_entity, geom)
-        # Systems
-        self.world.add_system(movement_request_system)
-        self.world.add_system(movement_progress_system)
-        self.world.add_system(orientation_system)
-        self.world.add_system(attack_effect_system)
-        self.world.add_system(tile_occupancy_system)
-        # New turn-based systems
-        from ecs.systems import enemy_planning_system, turn_advance_system
-        self.world.add_system(enemy_planning_system)
-        self.world.add_system(turn_advance_system)
-        self.world.add_system(player_turn_commit_system)
-        # Autonomous ai_walker_system removed: enemy will only move via planned turn execution.
-
-        # Tile entities (static grid)
-        for i in range(GRID_SIZE):
-            for j in range(GRID_SIZE):
-                tid = self.world.create_entity()
-                self.world.add_component(tid, Position(i, j))
-                self.world.add_component(tid, Tile())
-
-        # Dice entities
-        # Enemy created with AIWalker so planning system can generate moves
-        self.enemy_entity = create_enemy_die(self.world, 1, 1, ai=True)
-        self.world.add_component(self.enemy_entity, Renderable(kind='dice', layer=1, z_bias=0.1))
-        self.player_entity = create_player_die(self.world, 2, 2)
-        self.world.add_component(self.player_entity, Renderable(kind='dice', layer=1, z_bias=0.1))
-        # Turn state singleton
-        turn_eid = self.world.create_entity()
-        self.world.add_component(turn_eid, TurnState())
-        # Sample barriers
-        for (bi, bj) in [(4,4), (5,2), (2,5)]:
-            beid = self.world.create_entity()
-            self.world.add_component(beid, Position(bi, bj))
-            self.world.add_component(beid, Barrier())
-            self.world.add_component(beid, Renderable(kind='barrier', layer=0, z_bias=0.0))
-        # Boundary barriers (invisible): surround grid to prevent leaving
-        # Positions just outside 0..GRID_SIZE-1
-        for i in range(GRID_SIZE):
-            for (oi, oj) in [(-1, i), (GRID_SIZE, i)]:  # left/right outside columns
-                b_eid = self.world.create_entity()
-                self.world.add_component(b_eid, Position(oi, oj))
-                self.world.add_component(b_eid, Barrier())
-                # Boundary barriers invisible: skip Renderable so they are not drawn
-        for j in range(GRID_SIZE):
-            for (oi, oj) in [(j, -1), (j, GRID_SIZE)]:  # bottom/top outside rows
-                b_eid = self.world.create_entity()
-                self.world.add_component(b_eid, Position(oi, oj))
-                self.world.add_component(b_eid, Barrier())
+        # Headless simulation owns the ECS world; the window only draws and feeds input.
+        self.sim = Simulation(grid_size=GRID_SIZE, screen_size=(self.screen_width, self.screen_height))
+        self.world = self.sim.world
+        self.grid_entity = self.sim.grid_entity
+        self.enemy_entity = self.sim.enemy_entity
+        self.player_entity = self.sim.player_entity
+        # AI-only turns (SPACE = pass) resolve instantly instead of animating enemy tumbles.
+        self.sim.turn.resolve = 'ai_instant'
+        # Retained shape-list cache for grid, barriers and resting dice (F2 toggles for comparison).
+        self.retained = RetainedRenderer()
+        self.use_retained = True
+        self.draw_calls_last_frame = 0
+        # Idle-frame elision: skip systems while the world is quiescent and skip redraw
+        # (keep the last presented frame) while World.version matches what was drawn.
+        self.frames_skipped = 0
+        self.updates_skipped = 0
+        self._drawn_version = -1
+        # Camera (pan: W/A/S/D or mouse drag, zoom: +/- or wheel); the default shows the
+        # whole grid as before. render_system culls to its visible tile range.
+        self.camera_entity = self.world.create_entity()
+        self.world.add_component(self.camera_entity, Camera(
+            self.screen_width / 2, self.screen_height / 2, self.screen_width, self.screen_height))
+        self.camera2d = arcade.Camera2D()
+        self.culled_last_frame = 0
+
+    @property
+    def camera(self) -> Camera:
+        return self.world.get_component(Camera)[self.camera_entity]
 
     def _iso_point(self, i: float, j: float):
         geom = self.world.get_component(GridGeometry)[self.grid_entity]
@@ -110,31 +71,129 @@ class DiceWalkGame(arcade.Window):
     def is_ecs_oriented(self, die) -> bool:
         return True
 
+    def request_redraw(self):
+        """Force the next frame to draw even if the world has not changed."""
+        self._drawn_version = -1
+
+    def draw(self, dt: float):
+        # Not drawing also skips flip(), so the front buffer keeps showing the last frame.
+        if self.world.version == self._drawn_version:
+            self.frames_skipped += 1
+            return
+        super().draw(dt)
+
+    def on_resize(self, width: int, height: int):
+        super().on_resize(width, height)
+        sim = getattr(self, 'sim', None)  # on_resize may fire before __init__ finishes
+        if sim is not None:
+            self.screen_width, self.screen_height = width, height
+            sim.resize(width, height)
+            if getattr(self, 'camera_entity', None) is not None:
+                cam = self.camera
+                cam.viewport_width, cam.viewport_height = width, height
+                cam.x, cam.y = width / 2, height / 2
+                self.camera2d.match_window()
+            self.request_redraw()
+
     def on_draw(self):
+        self._drawn_version = self.world.version
         self.clear()
+        RENDER_STATS.reset()
+        retained = self.retained if self.use_retained else None
         geom = self.world.get_component(GridGeometry)[self.grid_entity]
-        # Draw grid lines
-        for (x1, y1, x2, y2) in geom.grid_lines:
-            arcade.draw_line(x1, y1, x2, y2, arcade.color.WHITE, 1)
-        # Planned enemy move & attack highlights during planning phase
-        draw_planned_move_highlights(geom, self.world)
-        draw_planned_attack_highlights(geom, self.world)
-        # Render all entities with Renderable component
-        render_system(self.world)
+        world = self.world
+        cam = self.camera
+        self.camera2d.position = (cam.x, cam.y)
+        self.camera2d.zoom = cam.zoom
+        self.camera2d.use()
+        bounds = (world.spatial.width, world.spatial.height) if world.spatial.width is not None else None
+        view = visible_tiles(cam, geom, bounds)
+        if world.profiler is None and world.tracer is None:
+            draw_grid(geom, retained, view)
+            # Planned enemy move & attack highlights during planning phase
+            draw_planned_move_highlights(geom, world, view)
+            draw_planned_attack_highlights(geom, world, view)
+            # Render all entities with Renderable component
+            render_system(world, retained, view)
+        else:
+            trace_start = world.tracer.now() if world.tracer is not None else 0.0
+            world.call_instrumented('draw_grid', draw_grid, geom, retained, view)
+            world.call_instrumented('draw_planned_move_highlights', draw_planned_move_highlights, geom, world, view)
+            world.call_instrumented('draw_planned_attack_highlights', draw_planned_attack_highlights, geom, world, view)
+            world.call_instrumented('render_system', render_system, world, retained, view)
+            if world.tracer is not None:
+                world.tracer.complete('on_draw', 'frame', trace_start, world.tracer.now(),
+                                      {'draw_calls': RENDER_STATS.draw_calls, 'rebuilt': RENDER_STATS.rebuilt,
+                                       'culled': RENDER_STATS.culled})
+        self.draw_calls_last_frame = RENDER_STATS.draw_calls
+        self.culled_last_frame = RENDER_STATS.culled
+
+    # --- Camera controls (camera changes bump the world version so idle frames redraw) ---
+    def pan_camera(self, dx: float, dy: float):
+        pan(self.camera, dx, dy)
+        self.world.mark_changed()
+
+    def zoom_camera(self, factor: float):
+        zoom_by(self.camera, factor)
+        self.world.mark_changed()
+
+    def on_mouse_drag(self, x, y, dx, dy, buttons, modifiers):
+        self.pan_camera(-dx, -dy)
+
+    def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
+        if scroll_y:
+            self.zoom_camera(ZOOM_STEP if scroll_y > 0 else 1 / ZOOM_STEP)
 
     def on_key_press(self, key, modifiers):
         if key == arcade.key.ESCAPE:
             self.close(); return
+        if key == arcade.key.F2:
+            self.use_retained = not self.use_retained
+            self.request_redraw()
+            print(f"retained rendering {'on' if self.use_retained else 'off'}; last frame {self.draw_calls_last_frame} draw calls")
+            return
+        if key == arcade.key.F3:
+            # Toggle the per-system profiler; print its snapshot when switching off.
+            if self.world.profiler is None:
+                self.world.enable_profiling()
+                print("profiling on")
+            else:
+                print(self.world.disable_profiling().to_json())
+            return
+        if key == arcade.key.F4:
+            # Toggle trace capture; dump a Chrome trace when switching off.
+            if self.world.tracer is None:
+                self.world.enable_tracing()
+                print("tracing on")
+            else:
+                self.world.disable_tracing().dump(TRACE_PATH)
+                print(f"trace written to {TRACE_PATH}")
+            return
+        camera_keys = {
+            arcade.key.W: (0, PAN_STEP), arcade.key.S: (0, -PAN_STEP),
+            arcade.key.A: (-PAN_STEP, 0), arcade.key.D: (PAN_STEP, 0),
+        }
+        if key in camera_keys:
+            self.pan_camera(*camera_keys[key]); return
+        if key in (arcade.key.EQUAL, arcade.key.PLUS, arcade.key.NUM_ADD):
+            self.zoom_camera(ZOOM_STEP); return
+        if key in (arcade.key.MINUS, arcade.key.NUM_SUBTRACT):
+            self.zoom_camera(1 / ZOOM_STEP); return
         di = dj = 0
         if key == arcade.key.UP: dj = 1
         elif key == arcade.key.DOWN: dj = -1
         elif key == arcade.key.RIGHT: di = 1
         elif key == arcade.key.LEFT: di = -1
+        elif key == arcade.key.SPACE:
+            self.sim.submit_intent(0, 0); return
         if di or dj:
             # Emit intent event; system will validate and commit if allowed
-            self.world.emit(ECSEvent(type=PLAYER_MOVE_INTENT, entity=self.player_entity, data={'di': di, 'dj': dj}))
+            self.sim.submit_intent(di, dj)
 
     def on_update(self, delta_time: float):
+        if self.world.is_idle():
+            self.updates_skipped += 1
+            return
         self.world.update(delta_time)
 
 
@@ -145,14 +204,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-def _build_grid_lines(grid_size: int, iso_point_fn):
-    # Deprecated helper (geometry now inlined in __init__); retained temporarily for reference.
-    lines = []
-    for i in range(grid_size + 1):
-        lines.append((*iso_point_fn(i, 0), *iso_point_fn(i, grid_size)))
-    for j in range(grid_size + 1):
-        lines.append((*iso_point_fn(0, j), *iso_point_fn(grid_size, j)))
-    return tuple(lines)
-
-
@@ -0,0 +1,245 @@
+"""Monte Carlo scenario sweeps: many headless games across a reusable process pool.
+
+    scenario = Scenario(enemies=((1, 1, 1, 0), (6, 6, 0, -1)), policy='random')
+    with MonteCarloRunner(workers=8) as runner:
+        columns = runner.collect(scenario, runs=10_000, seed=42)
+    columns.save('sweep.npz')
+
+Each run is one `Simulation` (instant resolve) driven by the scenario's player policy
+until the player's HP reaches 0 or `max_turns` intents have been played. Run seeds are
+derived from (seed, run index) alone, so results do not depend on the worker count or
+on which worker picked up a chunk. Results stream back per chunk (`runner.stream`) and
+are gathered into `ResultColumns`, one array per field, saved as a NumPy .npz file.
+
+Run `python -m dicewalk.montecarlo --runs 1000 --out sweep.npz` for a quick sweep.
+"""
+from __future__ import annotations
+import hashlib
+import multiprocessing
+import os
+import random
+import time
+from array import array
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from dicewalk.simulation import Simulation, GRID_SIZE, SAMPLE_BARRIERS, Intent
+from ecs.components import HP, Patrol
+
+ACTIONS: Tuple[Intent, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1), (0, 0))
+DEFAULT_CHUNK = 64     # runs per task sent to a worker
+TURN_FRAMES = 64       # frame cap per turn (an instant turn resolves in a handful)
+PlayerPolicy = Callable[[Simulation, random.Random, int], Intent]  # (sim, rng, turn) -> intent
+
+
+def random_policy(sim: Simulation, rng: random.Random, turn: int) -> Intent:
+    """Uniformly random step or pass."""
+    return rng.choice(ACTIONS)
+
+
+def square_policy(sim: Simulation, rng: random.Random, turn: int) -> Intent:
+    """Walk a square around the start tile (the simulation CLI's script)."""
+    return ((1, 0), (0, 1), (-1, 0), (0, -1))[turn % 4]
+
+
+def pass_policy(sim: Simulation, rng: random.Random, turn: int) -> Intent:
+    """Never move; only enemies act."""
+    return (0, 0)
+
+
+POLICIES: Dict[str, PlayerPolicy] = {
+    'random': random_policy,
+    'square': square_policy,
+    'pass': pass_policy,
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """What to play: board, enemy spawns as (i, j, patrol_di, patrol_dj), player policy.
+
+    `policy` is a POLICIES name or a module-level callable (it is pickled to workers).
+    """
+    grid_size: int = GRID_SIZE
+    barriers: Tuple[Tuple[int, int], ...] = SAMPLE_BARRIERS
+    enemies: Tuple[Tuple[int, int, int, int], ...] = ((1, 1, 1, 0),)
+    player_start: Intent = (2, 2)
+    policy: Union[str, PlayerPolicy] = 'random'
+    max_turns: int = 200
+
+    def player_policy(self) -> PlayerPolicy:
+        return POLICIES[self.policy] if isinstance(self.policy, str) else self.policy
+
+    def build(self) -> Simulation:
+        sim = Simulation(grid_size=self.grid_size, player_start=self.player_start,
+                         enemy_starts=[(i, j) for i, j, _, _ in self.enemies],
+                         barriers=self.barriers, resolve='instant')
+        patrols = sim.world.get_component(Patrol)
+        for eid, (_, _, di, dj) in zip(sim.enemy_entities, self.enemies):
+            patrols[eid] = Patrol(di, dj)
+        return sim
+
+
+@dataclass(slots=True)
+class RunResult:
+    """Aggregates for one game (damage figures are HP lost, summed over the run)."""
+    run: int
+    seed: int
+    turns: int           # intents played while the player was alive
+    committed: int       # of those, turns that executed
+    survived: bool       # player HP still above 0 at the end
+    damage_dealt: int    # HP lost by enemies
+    damage_taken: int    # HP lost by the player
+    player_hp: int
+
+
+def run_seed(seed: int, run: int) -> int:
+    """Deterministic 63-bit seed for run `run` of a sweep seeded with `seed`."""
+    digest = hashlib.blake2b(f'{seed}:{run}'.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') >> 1
+
+
+def play(scenario: Scenario, run: int, seed: int) -> RunResult:
+    """Play one game of `scenario` with its own RNG."""
+    rs = run_seed(seed, run)
+    rng = random.Random(rs)
+    sim = scenario.build()
+    policy = scenario.player_policy()
+    hp = sim.world.get_component(HP)
+    player = hp[sim.player_entity]
+    enemies = [hp[e] for e in sim.enemy_entities]
+    player_start = player.current
+    enemy_start = sum(e.current for e in enemies)
+    turns = committed = 0
+    while turns < scenario.max_turns and player.current > 0:
+        ok, _ = sim.play_turn(*policy(sim, rng, turns), max_frames=TURN_FRAMES)
+        turns += 1
+        committed += ok
+    return RunResult(run, rs, turns, committed, player.current > 0,
+                     enemy_start - sum(e.current for e in enemies),
+                     player_start - player.current, player.current)
+
+
+def _play_chunk(task: Tuple[Scenario, int, int, int]) -> List[RunResult]:
+    scenario, start, count, seed = task
+    return [play(scenario, run, seed) for run in range(start, start + count)]
+
+
+def _init_worker():
+    # Workers never trace: a recorder installed in the parent would fill up per process.
+    from ecs import tracing
+    tracing.install_global(None)
+
+
+class ResultColumns:
+    """Column-per-field accumulator for RunResults (typed arrays, O(1) append)."""
+    COLUMNS: Tuple[Tuple[str, str], ...] = tuple(
+        (f.name, 'b' if f.name == 'survived' else 'q') for f in fields(RunResult))
+
+    def __init__(self):
+        self.columns: Dict[str, array] = {name: array(code) for name, code in self.COLUMNS}
+
+    def append(self, result: RunResult):
+        for name, col in self.columns.items():
+            col.append(getattr(result, name))
+
+    def extend(self, results: Sequence[RunResult]):
+        for result in results:
+            self.append(result)
+
+    def __len__(self) -> int:
+        return len(self.columns['run'])
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """Columns as NumPy arrays, sorted by run index."""
+        order = np.argsort(np.frombuffer(self.columns['run'], dtype=np.int64), kind='stable')
+        out = {}
+        for name, col in self.columns.items():
+            arr = np.frombuffer(col, dtype=np.int8 if col.typecode == 'b' else np.int64)
+            out[name] = arr[order].astype(bool) if name == 'survived' else arr[order]
+        return out
+
+    def save(self, path: str):
+        """Write the columns to a NumPy .npz file (one array per field)."""
+        np.savez(path, **self.arrays())
+
+    @staticmethod
+    def load(path: str) -> Dict[str, np.ndarray]:
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+
+
+class MonteCarloRunner:
+    """Process pool kept alive across sweeps; use as a context manager or call close()."""
+
+    def __init__(self, workers: Optional[int] = None, chunk: int = DEFAULT_CHUNK):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk = chunk
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None and self.workers > 1:
+            self._pool = multiprocessing.get_context().Pool(self.workers, initializer=_init_worker)
+        return self._pool
+
+    def stream(self, scenario: Scenario, runs: int, seed: int = 0) -> Iterator[List[RunResult]]:
+        """Yield chunks of RunResults as workers finish them (completion order)."""
+        tasks = [(scenario, start, min(self.chunk, runs - start), seed) for start in range(0, runs, self.chunk)]
+        pool = self._get_pool()
+        if pool is None:
+            for task in tasks:
+                yield _play_chunk(task)
+            return
+        yield from pool.imap_unordered(_play_chunk, tasks)
+
+    def collect(self, scenario: Scenario, runs: int, seed: int = 0,
+                on_chunk: Optional[Callable[[List[RunResult]], None]] = None) -> ResultColumns:
+        columns = ResultColumns()
+        for results in self.stream(scenario, runs, seed):
+            columns.extend(results)
+            if on_chunk is not None:
+                on_chunk(results)
+        return columns
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "MonteCarloRunner":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Play many headless DiceWalk games in parallel.")
+    parser.add_argument('--runs', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='random')
+    parser.add_argument('--max-turns', type=int, default=200)
+    parser.add_argument('--grid', type=int, default=GRID_SIZE)
+    parser.add_argument('--out', help="write columns to this .npz file")
+    args = parser.parse_args(argv)
+    scenario = Scenario(grid_size=args.grid, policy=args.policy, max_turns=args.max_turns)
+    start = time.perf_counter()
+    with MonteCarloRunner(args.workers, args.chunk) as runner:
+        columns = runner.collect(scenario, args.runs, args.seed)
+    wall = time.perf_counter() - start
+    cols = columns.arrays()
+    print(f"{len(columns)} runs on {runner.workers} worker(s) in {wall:.2f}s -> {len(columns) / wall:.1f} runs/s; "
+          f"survived {cols['survived'].mean():.1%}, mean turns {cols['turns'].mean():.1f}, "
+          f"dealt {cols['damage_dealt'].mean():.2f}, taken {cols['damage_taken'].mean():.2f}")
+    if args.out:
+        columns.save(args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""Headless DiceWalk simulation: builds the game world and advances turns without arcade.
+
+`DiceWalkGame` is a thin arcade.Window on top of `Simulation`; batch jobs and servers
+without a display can use `Simulation` directly:
+
+    sim = Simulation()
+    report = sim.run([(1, 0), (0, 1), (-1, 0)])
+    print(report.turns_per_second)
+
+Run `python -m dicewalk.simulation --turns 1000` for a quick throughput number.
+"""
+
+from __future__ import annotations
+import sys, pathlib
+import copy
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Sequence, Tuple, Union
+
+# Ensure src directory is on sys.path when run directly (mirrors main.py)
+_here = pathlib.Path(__file__).resolve()
+_src_root = _here.parent.parent
+if str(_src_root) not in sys.path:
+    sys.path.insert(0, str(_src_root))
+
+from ecs.die_factory import create_player_die, create_enemy_die
+from ecs.components import TileLayer, TileOccupancy, Position, GridGeometry, TurnState, Barrier, Renderable, LookaheadPlanner
+from ecs.world import World
+from ecs.systems import movement_request_system, movement_progress_system, orientation_system, tile_occupancy_system, attack_effect_system, player_turn_commit_system, enemy_planning_system, turn_advance_system
+from ecs.events import Event as ECSEvent, PLAYER_MOVE_INTENT
+from ecs.tumble import build_world_tables
+
+GRID_SIZE = 8
+# Nominal screen used for geometry when no window exists (metrics only; nothing is drawn).
+HEADLESS_SCREEN = (1920, 1080)
+SAMPLE_BARRIERS: Tuple[Tuple[int, int], ...] = ((4, 4), (5, 2), (2, 5))
+FRAME_DT = 1 / 60
+
+Intent = Tuple[int, int]
+Policy = Callable[["Simulation"], Optional[Intent]]
+
+
+def build_geometry(grid_size: int, screen_width: float, screen_height: float) -> GridGeometry:
+    """Isometric grid metrics sized to ~70% of the screen height, centred on screen."""
+    tile_height = 0.7 * screen_height / (grid_size - 1)
+    tile_width = 2 * tile_height
+    origin_x = screen_width / 2
+    origin_y = screen_height / 2 - (grid_size - 1) * tile_height / 2
+    def iso_point_local(i: float, j: float):
+        x = origin_x + (i - j) * (tile_width / 2)
+        y = origin_y + (i + j) * (tile_height / 2)
+        return x, y
+    grid_lines = []
+    for i in range(grid_size + 1):
+        grid_lines.append((*iso_point_local(i, 0), *iso_point_local(i, grid_size)))
+    for j in range(grid_size + 1):
+        grid_lines.append((*iso_point_local(0, j), *iso_point_local(grid_size, j)))
+    return GridGeometry(grid_size, tile_height, tile_width, origin_x, origin_y, tuple(grid_lines))
+
+
+def register_systems(world: World):
+    """Add the gameplay systems in their canonical order (event subscriber order follows)."""
+    world.add_system(movement_request_system)
+    world.add_system(movement_progress_system)
+    world.add_system(orientation_system)
+    world.add_system(attack_effect_system)
+    world.add_system(tile_occupancy_system)
+    world.add_system(enemy_planning_system)
+    world.add_system(turn_advance_system)
+    world.add_system(player_turn_commit_system)
+    # Autonomous ai_walker_system removed: enemy will only move via planned turn execution.
+
+
+@dataclass(slots=True)
+class SimulationReport:
+    """Outcome of Simulation.run: turns attempted/committed, frames stepped and wall time."""
+    turns: int = 0
+    committed: int = 0
+    frames: int = 0
+    wall_time: float = 0.0
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.wall_time if self.wall_time > 0 else 0.0
+
+
+class Simulation:
+    """The DiceWalk world (geometry, systems, tiles, dice, barriers) with no window attached."""
+
+    def __init__(self, grid_size: int = GRID_SIZE, screen_size: Tuple[float, float] = HEADLESS_SCREEN,
+                 player_start: Intent = (2, 2), enemy_starts: Sequence[Intent] = ((1, 1),),
+                 barriers: Iterable[Intent] = SAMPLE_BARRIERS, resolve: str = 'animated',
+                 planner: Optional[LookaheadPlanner] = None):
+        self.grid_size = grid_size
+        self.world = World()
+        geom = build_geometry(grid_size, *screen_size)
+        self.grid_entity = self.world.create_entity()
+        self.world.add_component(self.grid_entity, geom)
+        register_systems(self.world)
+
+        # Terrain: one dense layer on the grid entity instead of a Position + Tile entity per cell
+        self.world.add_component(self.grid_entity, TileLayer(grid_size, grid_size))
+        # Dice tile index: tile_occupancy_system fills it, attack_effect_system reads victims from it.
+        self.world.add_component(self.grid_entity, TileOccupancy())
+
+        # Dice entities
+        # Enemies created with AIWalker so planning system can generate moves
+        self.enemy_entities = []
+        for (ei, ej) in enemy_starts:
+            eid = create_enemy_die(self.world, ei, ej, ai=True)
+            self.world.add_component(eid, Renderable(kind='dice', layer=1, z_bias=0.1))
+            self.enemy_entities.append(eid)
+        self.enemy_entity = self.enemy_entities[0] if self.enemy_entities else None
+        self.player_entity = create_player_die(self.world, *player_start)
+        self.world.add_component(self.player_entity, Renderable(kind='dice', layer=1, z_bias=0.1))
+        # Turn state singleton
+        self.turn_entity = self.world.create_entity()
+        self.world.add_component(self.turn_entity, TurnState(resolve=resolve))
+        # Sample barriers
+        for (bi, bj) in barriers:
+            beid = self.world.create_entity()
+            self.world.add_component(beid, Position(bi, bj))
+            self.world.add_component(beid, Barrier())
+            self.world.add_component(beid, Renderable(kind='barrier', layer=0, z_bias=0.0))
+        # Grid edges need no entities: world.spatial takes its bounds from GridGeometry.
+        if planner is not None:
+            # Search-based enemy planning (ecs.lookahead) instead of plain Patrol walks
+            self.world.add_component(self.grid_entity, planner)
+        # Tumble keyframes for every die scale on the board, so none is built mid-animation
+        build_world_tables(self.world)
+
+    @property
+    def geometry(self) -> GridGeometry:
+        return self.world.get_component(GridGeometry)[self.grid_entity]
+
+    @property
+    def tiles(self) -> TileLayer:
+        return self.world.get_component(TileLayer)[self.grid_entity]
+
+    @property
+    def turn(self) -> TurnState:
+        return self.world.get_component(TurnState)[self.turn_entity]
+
+    def resize(self, screen_width: float, screen_height: float):
+        """Refit the grid geometry to a new screen size (in place) and drop cached projections."""
+        geom = self.world.edit_component(self.grid_entity, GridGeometry)
+        fresh = build_geometry(self.grid_size, screen_width, screen_height)
+        geom.tile_height = fresh.tile_height
+        geom.tile_width = fresh.tile_width
+        geom.origin_x = fresh.origin_x
+        geom.origin_y = fresh.origin_y
+        geom.grid_lines = fresh.grid_lines
+        geom.invalidate()
+        self.world.mark_changed()
+
+    def fork(self) -> "Simulation":
+        """Same simulation on a copy-on-write fork of the world (see World.fork).
+
+        Play turns on the fork freely, then `fork.world.commit()` or `fork.world.discard()`.
+        """
+        child = copy.copy(self)
+        child.world = self.world.fork()
+        return child
+
+    def step(self, dt: float = FRAME_DT):
+        self.world.update(dt)
+
+    def submit_intent(self, di: int, dj: int):
+        self.world.emit(ECSEvent(type=PLAYER_MOVE_INTENT, entity=self.player_entity, data={'di': di, 'dj': dj}))
+
+    def play_turn(self, di: int, dj: int, dt: float = FRAME_DT, max_frames: int = 10_000) -> Tuple[bool, int]:
+        """Submit one player intent and step until the turn resolves.
+
+        (0, 0) passes the turn so only enemies move. Returns (committed, frames). A
+        blocked intent is consumed without leaving the planning phase, so it returns
+        (False, frames).
+        """
+        self.submit_intent(di, dj)
+        executed = False
+        frames = 0
+        while frames < max_frames:
+            self.step(dt)
+            frames += 1
+            # Re-read each frame: on a fork the first edit swaps in the fork's own TurnState.
+            if self.turn.phase == 'executing':
+                executed = True
+            elif executed:
+                return True, frames
+            elif not self.world.events.pending(PLAYER_MOVE_INTENT):
+                return False, frames
+        return executed, frames
+
+    def run(self, intents: Union[Iterable[Intent], Policy], max_turns: Optional[int] = None,
+            dt: float = FRAME_DT) -> SimulationReport:
+        """Play scripted intents (or a policy callable returning an intent / None to stop)."""
+        report = SimulationReport()
+        start = time.perf_counter()
+        source = iter(()) if callable(intents) else iter(intents)
+        while max_turns is None or report.turns < max_turns:
+            intent = intents(self) if callable(intents) else next(source, None)
+            if intent is None:
+                break
+            committed, frames = self.play_turn(*intent, dt=dt)
+            report.turns += 1
+            report.committed += int(committed)
+            report.frames += frames
+        report.wall_time = time.perf_counter() - start
+        return report
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    import argparse
+    import itertools
+    parser = argparse.ArgumentParser(description="Run headless DiceWalk turns and report throughput.")
+    parser.add_argument('--turns', type=int, default=1000)
+    parser.add_argument('--grid', type=int, default=GRID_SIZE)
+    parser.add_argument('--animated', action='store_true', help="step tumble animations instead of instant resolve")
+    parser.add_argument('--profile', metavar='PATH', help="record per-system timings and write them as JSON ('-' = stdout)")
+    parser.add_argument('--trace', metavar='PATH', help="write a Chrome/Perfetto trace of the run")
+    parser.add_argument('--lookahead', type=int, metavar='DEPTH', help="plan enemies by expectimax search to DEPTH")
+    args = parser.parse_args(argv)
+    planner = LookaheadPlanner(max_depth=args.lookahead) if args.lookahead else None
+    sim = Simulation(grid_size=args.grid, resolve='animated' if args.animated else 'instant', planner=planner)
+    if args.profile:
+        sim.world.enable_profiling()
+    if args.trace:
+        sim.world.enable_tracing()
+    # Simple scripted loop: square walk around the start tile.
+    script = itertools.cycle([(1, 0), (0, 1), (-1, 0), (0, -1)])
+    report = sim.run(script, max_turns=args.turns)
+    print(f"{report.turns} turns ({report.committed} committed, {report.frames} frames) "
+          f"in {report.wall_time:.3f}s -> {report.turns_per_second:.1f} turns/s")
+    if args.profile == '-':
+        print(sim.world.profiler.to_json())
+    elif args.profile:
+        sim.world.profiler.dump(args.profile)
+    if args.trace:
+        sim.world.tracer.dump(args.trace)
+
+
+if __name__ == "__main__":
+    main()
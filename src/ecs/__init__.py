@@ -1,4 +1,4 @@
 # ECS package marker
 from .world import World
-from .components import Position, RenderCube, DieFaces, GridMove, TumbleAnim, AIWalker, DieSide, Tile, GridGeometry
+from .components import Position, RenderCube, DieFaces, GridMove, TumbleAnim, AIWalker, DieSide, Tile, TileLayer, GridGeometry
 from .events import Event, MOVE_REQUEST, MOVE_STARTED, MOVE_COMPLETE
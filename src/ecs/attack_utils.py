@@ -12,8 +12,7 @@ def get_attack_effects(world: World, eid: int):
     faces_store = world.get_component(DieFaces)
     if not faces_store or eid not in faces_store:
         return []
-    faces = faces_store[eid]
-    top = faces.sides.get('top')
+    top = faces_store[eid].top()
     if not top:
         return []
     attack_set_store = world.get_component(AttackSet)
@@ -39,20 +38,28 @@ def get_attack_targets(world: World, eid: int, di: int, dj: int, post_move_i: in
     for effect in get_attack_effects(world, eid):
         ttype = effect.target_type
         tiles: List[Tuple[int,int]] = []
-        if ttype == 'forward-single':
-            tiles.append((post_move_i + di, post_move_j + dj))
-        elif ttype == 'left-single':
-            if di != 0:
-                perp = (0, -1) if di == 1 else (0, 1)
-            else:
-                perp = (1, 0) if dj == 1 else (-1, 0)
-            tiles.append((post_move_i + perp[0], post_move_j + perp[1]))
-        elif ttype == 'right-single':
-            if di != 0:
-                perp = (0, 1) if di == 1 else (0, -1)
-            else:
-                perp = (-1, 0) if dj == 1 else (1, 0)
-            tiles.append((post_move_i + perp[0], post_move_j + perp[1]))
+        tile = pattern_tile(ttype, di, dj, post_move_i, post_move_j)
+        if tile is not None:
+            tiles.append(tile)
         if tiles:
             result.setdefault(ttype, []).extend(tiles)
     return result
+
+
+def pattern_tile(target_type: str, di: int, dj: int, i: int, j: int):
+    """Tile hit by a single-tile pattern after a (di, dj) move ending on (i, j), or None."""
+    if target_type == 'forward-single':
+        return (i + di, j + dj)
+    if target_type == 'left-single':
+        if di != 0:
+            perp = (0, -1) if di == 1 else (0, 1)
+        else:
+            perp = (1, 0) if dj == 1 else (-1, 0)
+        return (i + perp[0], j + perp[1])
+    if target_type == 'right-single':
+        if di != 0:
+            perp = (0, 1) if di == 1 else (0, -1)
+        else:
+            perp = (-1, 0) if dj == 1 else (1, 0)
+        return (i + perp[0], j + perp[1])
+    return None
@@ -0,0 +1,96 @@
+"""Camera pan/zoom helpers and the visible tile region used for culling.
+
+The viewport is an axis-aligned rectangle in screen space, which is a rotated rectangle
+in grid space. `TileView` stores it exactly as ranges of the iso diagonals
+(d = i - j selects screen x, s = i + j selects screen y), so a tile test is two range
+checks and enumerating the visible tiles never touches off-screen rows.
+"""
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+from ecs.components import Camera, GridGeometry
+
+MIN_ZOOM = 0.05
+MAX_ZOOM = 8.0
+# Tiles of slack around the viewport: dice stand up to one tile tall and tumble one tile.
+VIEW_PAD = 1
+
+
+@dataclass(frozen=True, slots=True)
+class TileView:
+    """Tiles whose diagonals satisfy dmin <= i - j <= dmax and smin <= i + j <= smax,
+    clipped to the box imin..imax x jmin..jmax (map bounds when known)."""
+    dmin: int
+    dmax: int
+    smin: int
+    smax: int
+    imin: int
+    imax: int
+    jmin: int
+    jmax: int
+
+    def contains(self, i: int, j: int) -> bool:
+        d = i - j
+        s = i + j
+        return (self.dmin <= d <= self.dmax and self.smin <= s <= self.smax
+                and self.imin <= i <= self.imax and self.jmin <= j <= self.jmax)
+
+    def tile_count(self) -> int:
+        """Upper bound on the number of tiles `cells()` yields."""
+        if self.imax < self.imin or self.jmax < self.jmin:
+            return 0
+        box = (self.imax - self.imin + 1) * (self.jmax - self.jmin + 1)
+        diamond = ((self.dmax - self.dmin + 2) * (self.smax - self.smin + 2)) // 2
+        return min(box, diamond)
+
+    def cells(self) -> Iterator[Tuple[int, int]]:
+        """Visible tiles, back rows (larger i + j) first."""
+        for s in range(min(self.smax, self.imax + self.jmax), max(self.smin, self.imin + self.jmin) - 1, -1):
+            # i - j = d and i + j = s  ->  i = (s + d) / 2: d must share parity with s
+            lo = max(self.dmin, s - 2 * self.jmax, 2 * self.imin - s)
+            hi = min(self.dmax, 2 * self.imax - s, s - 2 * self.jmin)
+            if (lo - s) % 2:
+                lo += 1
+            for d in range(lo, hi + 1, 2):
+                yield (s + d) // 2, (s - d) // 2
+
+
+def visible_tiles(camera: Camera, geom: GridGeometry, bounds: Optional[Tuple[int, int]] = None,
+                  pad: int = VIEW_PAD) -> TileView:
+    """Tile region covered by the camera viewport (plus `pad` tiles of slack)."""
+    half_w = camera.viewport_width / (2 * camera.zoom)
+    half_h = camera.viewport_height / (2 * camera.zoom)
+    # Screen -> iso diagonals: d = (x - ox) / (tw/2) = i - j, s = (y - oy) / (th/2) = i + j
+    hw = geom.tile_width / 2
+    hh = geom.tile_height / 2
+    d_lo = (camera.x - half_w - geom.origin_x) / hw
+    d_hi = (camera.x + half_w - geom.origin_x) / hw
+    s_lo = (camera.y - half_h - geom.origin_y) / hh
+    s_hi = (camera.y + half_h - geom.origin_y) / hh
+    # A tile (i, j) spans d in [i-j-1, i-j+1] and s in [i+j, i+j+2]
+    dmin = math.floor(d_lo) - 1 - pad
+    dmax = math.ceil(d_hi) + 1 + pad
+    smin = math.floor(s_lo) - 2 - 2 * pad
+    smax = math.ceil(s_hi) + 2 * pad
+    # Grid-space bounding box of the diamond, clipped to the map
+    imin = (smin + dmin) // 2
+    imax = (smax + dmax + 1) // 2
+    jmin = (smin - dmax) // 2
+    jmax = (smax - dmin + 1) // 2
+    if bounds is not None:
+        w, h = bounds
+        imin = max(imin, 0); jmin = max(jmin, 0)
+        imax = min(imax, w - 1); jmax = min(jmax, h - 1)
+    return TileView(dmin, dmax, smin, smax, imin, imax, jmin, jmax)
+
+
+def pan(camera: Camera, dx: float, dy: float):
+    """Move the view by (dx, dy) screen pixels at the current zoom."""
+    camera.x += dx / camera.zoom
+    camera.y += dy / camera.zoom
+
+
+def zoom_by(camera: Camera, factor: float):
+    camera.zoom = min(MAX_ZOOM, max(MIN_ZOOM, camera.zoom * factor))
@@ -1,6 +1,18 @@
 from __future__ import annotations
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import AbstractSet, Dict, Iterable, Iterator, Mapping, Optional, Set, Tuple
+from ecs.orientation import FACE_AT, POSITIONS, TOP_FACE
+
+# Cube vertex indices per face (vertex order: see GridGeometry.cube_corners)
+CUBE_FACE_DEFS = (
+    ((0, 1, 3, 2), 'bottom'), ((4, 5, 7, 6), 'top'),
+    ((0, 1, 5, 4), 'west'), ((2, 3, 7, 6), 'east'),
+    ((0, 2, 6, 4), 'south'), ((1, 3, 7, 5), 'north'),
+)
+# Resting cubes: fixed painter's order of face positions
+RESTING_FACE_PRIORITY = {'bottom': 0, 'east': 1, 'north': 2, 'south': 3, 'west': 4, 'top': 5}
+RESTING_FACE_ORDER = tuple(sorted(CUBE_FACE_DEFS, key=lambda fd: RESTING_FACE_PRIORITY[fd[1]]))
 
 
 @dataclass(slots=True)
@@ -22,10 +34,45 @@ class Position:
 class RenderCube:
     scale: float = 0.8
 
+class OrientedSides(Mapping):
+    """Read-only position -> DieSide view of a DieFaces at a given orientation."""
+    __slots__ = ('_base', '_face_at')
+
+    def __init__(self, base: Dict[str, DieSide], orientation: int):
+        self._base = base
+        self._face_at = FACE_AT[orientation]
+
+    def __getitem__(self, position: str) -> DieSide:
+        return self._base[self._face_at[position]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(POSITIONS)
+
+    def __len__(self) -> int:
+        return len(POSITIONS)
+
+
 @dataclass(slots=True)
 class DieFaces:
-    sides: Dict[str, DieSide]
-    snapshot: Optional[Dict[str, DieSide]] = None
+    """Die face colors plus the die's current rotation.
+
+    base: sides keyed by the position they occupy in orientation 0 (never mutated).
+    orientation: one of the 24 cube rotations (see ecs.orientation); rolling only
+    changes this int. `sides` is a position-keyed view for compatibility.
+    """
+    base: Dict[str, DieSide]
+    orientation: int = 0
+
+    @property
+    def sides(self) -> OrientedSides:
+        return OrientedSides(self.base, self.orientation)
+
+    def side_at(self, position: str, orientation: Optional[int] = None) -> Optional[DieSide]:
+        o = self.orientation if orientation is None else orientation
+        return self.base.get(FACE_AT[o][position])
+
+    def top(self) -> Optional[DieSide]:
+        return self.base.get(TOP_FACE[self.orientation])
 
 @dataclass(slots=True)
 class GridMove:
@@ -41,7 +88,8 @@ class GridMove:
 class TumbleAnim:
     """Active tumble animation state for rendering interpolation.
 
-    Mirrors GridMove timing; stores a snapshot of faces (Face objects) pre-rotation.
+    Mirrors GridMove timing; stores the pre-rotation orientation index (faces are drawn
+    from DieFaces.base through that orientation until the roll completes).
     """
     start_i: int
     start_j: int
@@ -50,23 +98,180 @@ class TumbleAnim:
     duration: float
     elapsed: float = 0.0
     scale: float = 0.8
-    faces_snapshot: Optional[Dict[str, DieSide]] = None
+    orientation: Optional[int] = None
 
 @dataclass(slots=True)
 class AIWalker:
     interval: float = 1.5
     timer: float = 0.0
 
+_NO_OCCUPANTS: AbstractSet[int] = frozenset()
+
+
 @dataclass(slots=True)
 class TileOccupancy:
-    """Sparse occupancy mapping: (i,j) -> list of entity ids occupying tile."""
-    occupants: Dict[tuple[int,int], list[int]] = field(default_factory=dict)
+    """Sparse dice occupancy: (i,j) -> set of entity ids, plus the reverse entity -> tile map.
+
+    The reverse map makes add / remove / move O(1) regardless of how many tiles are
+    occupied. A World holding one keeps it in sync as dice spawn, despawn and move
+    (see World.occupancy); rebuild() replaces the contents in one pass for level loads.
+    """
+    occupants: Dict[tuple[int,int], Set[int]] = field(default_factory=dict)
+    where: Dict[int, tuple[int,int]] = field(default_factory=dict)
+    # Set by clone(): tiles whose occupant sets are private (others are shared with the
+    # original and copied on first write). None = every set is private.
+    _owned: Optional[Set[tuple[int,int]]] = field(default=None, init=False, repr=False, compare=False)
+
+    def at(self, i: int, j: int) -> AbstractSet[int]:
+        """Entities on tile (i, j) (read-only; empty set if none)."""
+        return self.occupants.get((i, j), _NO_OCCUPANTS)
+
+    def tile_of(self, eid: int) -> Optional[tuple[int,int]]:
+        return self.where.get(eid)
+
+    def move(self, eid: int, i: int, j: int) -> bool:
+        """Put `eid` on tile (i, j), adding it if untracked; False if it was already there."""
+        tile = (i, j)
+        old = self.where.get(eid)
+        if old == tile:
+            return False
+        if old is not None:
+            self._unlink(eid, old)
+        self.where[eid] = tile
+        slot = self.occupants.get(tile)
+        if slot is None:
+            self.occupants[tile] = {eid}
+            if self._owned is not None:
+                self._owned.add(tile)
+        else:
+            self._slot(tile, slot).add(eid)
+        return True
+
+    add = move
+
+    def remove(self, eid: int) -> bool:
+        old = self.where.pop(eid, None)
+        if old is None:
+            return False
+        self._unlink(eid, old)
+        return True
+
+    def _slot(self, tile: tuple[int,int], slot: Set[int]) -> Set[int]:
+        owned = self._owned
+        if owned is not None and tile not in owned:
+            slot = self.occupants[tile] = set(slot)
+            owned.add(tile)
+        return slot
+
+    def _unlink(self, eid: int, tile: tuple[int,int]):
+        slot = self._slot(tile, self.occupants[tile])
+        slot.discard(eid)
+        if not slot:
+            del self.occupants[tile]
+
+    def rebuild(self, entries: Iterable[Tuple[int, int, int]]):
+        """Replace all contents with (eid, i, j) entries."""
+        occupants: Dict[tuple[int,int], Set[int]] = {}
+        where: Dict[int, tuple[int,int]] = {}
+        for eid, i, j in entries:
+            tile = (i, j)
+            old = where.get(eid)
+            if old is not None:
+                occupants[old].discard(eid)
+            where[eid] = tile
+            occupants.setdefault(tile, set()).add(eid)
+        self.occupants = {t: s for t, s in occupants.items() if s}
+        self.where = where
+        self._owned = None
+
+    def clear(self):
+        self.occupants.clear()
+        self.where.clear()
+        self._owned = None
+
+    def __len__(self) -> int:
+        return len(self.where)
+
+    def __contains__(self, eid: int) -> bool:
+        return eid in self.where
+
+    def clone(self) -> "TileOccupancy":
+        """Copy for a World fork: both maps are copied, per-tile sets on first write."""
+        twin = TileOccupancy(dict(self.occupants), dict(self.where))
+        twin._owned = set()
+        return twin
 
 @dataclass(slots=True)
 class Tile:
-    """Marker component for a grid tile entity (static background geometry)."""
+    """Marker component for a grid tile entity (legacy; the map now uses TileLayer)."""
     pass
 
+
+# TileLayer kinds (one byte per tile) and flag bits
+TILE_FLOOR = 0
+TILE_WALKABLE = 1
+
+
+@dataclass(slots=True)
+class TileLayer:
+    """Dense terrain for a width x height map: one kind byte and one flag byte per tile.
+
+    Replaces one Position + Tile entity per cell, so tiles never show up in component
+    stores, queries or the spatial index. Row-major: tile (i, j) is at j * width + i.
+    Tiles start as walkable TILE_FLOOR; non-walkable tiles block movement and planning
+    through world.spatial.is_blocked once the layer is added to the World.
+    """
+    width: int
+    height: int
+    kinds: bytearray = field(default=None, repr=False)
+    flags: bytearray = field(default=None, repr=False)
+
+    def __post_init__(self):
+        n = self.width * self.height
+        if self.kinds is None:
+            self.kinds = bytearray(n)
+        if self.flags is None:
+            self.flags = bytearray([TILE_WALKABLE]) * n
+        if len(self.kinds) != n or len(self.flags) != n:
+            raise ValueError("tile arrays must hold width * height entries")
+
+    def in_bounds(self, i: int, j: int) -> bool:
+        return 0 <= i < self.width and 0 <= j < self.height
+
+    def index(self, i: int, j: int) -> int:
+        if not (0 <= i < self.width and 0 <= j < self.height):
+            raise IndexError(f"tile ({i}, {j}) outside {self.width}x{self.height} layer")
+        return j * self.width + i
+
+    def kind(self, i: int, j: int) -> int:
+        return self.kinds[self.index(i, j)]
+
+    def set_kind(self, i: int, j: int, kind: int):
+        self.kinds[self.index(i, j)] = kind
+
+    def walkable(self, i: int, j: int) -> bool:
+        return 0 <= i < self.width and 0 <= j < self.height and bool(self.flags[j * self.width + i] & TILE_WALKABLE)
+
+    def set_walkable(self, i: int, j: int, walkable: bool = True):
+        n = self.index(i, j)
+        self.flags[n] = (self.flags[n] | TILE_WALKABLE) if walkable else (self.flags[n] & ~TILE_WALKABLE)
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def __contains__(self, tile) -> bool:
+        i, j = tile
+        return self.in_bounds(i, j)
+
+    def cells(self) -> Iterator[Tuple[int, int]]:
+        for j in range(self.height):
+            for i in range(self.width):
+                yield i, j
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.kinds) + len(self.flags)
+
 @dataclass(slots=True)
 class GridGeometry:
     """Holds isometric grid metrics and precomputed grid lines."""
@@ -76,6 +281,7 @@ class GridGeometry:
     origin_x: float
     origin_y: float
     grid_lines: Tuple[tuple[float,float,float,float], ...]
+    _cube_cache: Dict[tuple, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     # Provide helpers matching removed Level class interface so rendering code
     # (and any future tile utilities) can call geom.iso_point/geom.tile_center.
@@ -87,6 +293,43 @@ class GridGeometry:
     def tile_center(self, i: int, j: int) -> Tuple[float, float]:
         return self.iso_point(i + 0.5, j + 0.5)
 
+    # --- Resting cube projection cache ---
+    # Resting dice and barriers sit on integer tiles at a handful of scales, so their
+    # projected corners / painter-ordered face polygons are computed once per
+    # (i, j, scale) and reused every frame. Call invalidate() after changing any metric.
+    def cube_corners(self, i: int, j: int, scale: float) -> Tuple[Tuple[float, float], ...]:
+        """Screen positions of the 8 corners of a resting cube (see CUBE_FACE_DEFS order)."""
+        entry = self._cube_cache.get((i, j, scale))
+        if entry is None:
+            entry = self._cache_cube(i, j, scale)
+        return entry[0]
+
+    def cube_faces(self, i: int, j: int, scale: float) -> Tuple[Tuple[str, Tuple[Tuple[float, float], ...]], ...]:
+        """(position, screen polygon) per face of a resting cube, in painter's order."""
+        entry = self._cube_cache.get((i, j, scale))
+        if entry is None:
+            entry = self._cache_cube(i, j, scale)
+        return entry[1]
+
+    def invalidate(self):
+        """Drop cached projections (geometry metrics changed, e.g. window resize)."""
+        self._cube_cache.clear()
+
+    def _cache_cube(self, i: int, j: int, scale: float):
+        half = 0.5 * scale
+        ci0 = i + 0.5
+        cj0 = j + 0.5
+        corners = []
+        for z in (0.0, scale):
+            for vi, vj in ((ci0 - half, cj0 - half), (ci0 - half, cj0 + half),
+                           (ci0 + half, cj0 - half), (ci0 + half, cj0 + half)):
+                sx, sy = self.iso_point(vi, vj)
+                corners.append((sx, sy + z * self.tile_height))
+        corners = tuple(corners)
+        faces = tuple((position, tuple(corners[n] for n in face)) for face, position in RESTING_FACE_ORDER)
+        entry = self._cube_cache[(i, j, scale)] = (corners, faces)
+        return entry
+
 
 @dataclass(slots=True)
 class TurnState:
@@ -94,10 +337,14 @@ class TurnState:
 
     phase: 'planning' | 'executing'
     planned: list of dicts {entity, di, dj}
+    resolve: 'animated' | 'instant' | 'ai_instant'
+        'instant' resolves every executing phase in a single update (no TumbleAnim);
+        'ai_instant' does so only for AI-only turns (player passes with di=dj=0).
     """
     phase: str = 'planning'
     planned: list[dict] = field(default_factory=list)
     planning_elapsed: float = 0.0  # time spent in current planning phase (for preview gating)
+    resolve: str = 'animated'
 
 @dataclass(slots=True)
 class Barrier:
@@ -110,6 +357,21 @@ class HP:
     current: int
     max: int
 
+@dataclass(slots=True)
+class Camera:
+    """Singleton view state: world-space point at the viewport centre, zoom and viewport size.
+
+    World space is the isometric screen space GridGeometry projects into, so the default
+    camera (centred on the screen, zoom 1) shows exactly what an uncamera'd window did.
+    Use ecs.camera.visible_tiles to turn it into the tile range worth drawing.
+    """
+    x: float
+    y: float
+    viewport_width: float
+    viewport_height: float
+    zoom: float = 1.0
+
+
 @dataclass(slots=True)
 class Renderable:
     """Generic render metadata.
@@ -159,3 +421,28 @@ class Patrol:
     """Deterministic patrol: move each turn by (di,dj); reverse upon barrier/bounds block."""
     di: int
     dj: int
+
+@dataclass(slots=True)
+class LookaheadPlanner:
+    """Singleton config + transposition table for search-based enemy planning (ecs.lookahead).
+
+    When present, enemy_planning_system scores each enemy's legal moves by depth-limited
+    expectimax (uniform player responses) instead of following Patrol. Search deepens
+    iteratively from depth 1 up to max_depth while the per-turn budget lasts.
+    counter_weight: how much damage the enemy takes back counts against a move.
+    table: bounded LRU of search results keyed by local state; hits / misses are counted.
+    """
+    max_depth: int = 2
+    budget_ms: float = 8.0
+    table_size: int = 65_536
+    counter_weight: float = 0.5
+    table: "OrderedDict[tuple, tuple]" = field(default_factory=OrderedDict, repr=False, compare=False)
+    hits: int = 0
+    misses: int = 0
+    last_depth: int = 0
+    last_ms: float = 0.0
+
+    def clone(self) -> "LookaheadPlanner":
+        """Copy for a World fork; the table is a pure cache, so the fork shares it."""
+        return LookaheadPlanner(self.max_depth, self.budget_ms, self.table_size, self.counter_weight,
+                                self.table, self.hits, self.misses, self.last_depth, self.last_ms)
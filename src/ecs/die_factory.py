@@ -3,6 +3,10 @@ from ecs.world import World
 from ecs.components import Position, RenderCube, DieFaces, AIWalker, DieSide, HP, AttackEffect, AttackSet, Patrol, Barrier
 from typing import Dict
 
+# RenderCube scales of the dice the factories create (ecs.tumble prebuilds both).
+PLAYER_CUBE_SCALE = 0.8
+ENEMY_CUBE_SCALE = 0.6
+
 def create_player_die(world: World, i: int, j: int):
     # Use side keys as face_id so orientation_system permutations keep logical identifiers.
     sides: Dict[str, DieSide] = {
@@ -15,7 +19,7 @@ def create_player_die(world: World, i: int, j: int):
     }
     eid = world.create_entity()
     world.add_component(eid, Position(i, j))
-    world.add_component(eid, RenderCube(scale=0.8))
+    world.add_component(eid, RenderCube(scale=PLAYER_CUBE_SCALE))
     world.add_component(eid, DieFaces(sides))
     world.add_component(eid, HP(current=10, max=10))
     # Player: forward-single only on all faces
@@ -37,7 +41,7 @@ def create_enemy_die(world: World, i: int, j: int, ai: bool = True):
     }
     eid = world.create_entity()
     world.add_component(eid, Position(i, j))
-    world.add_component(eid, RenderCube(scale=0.6))
+    world.add_component(eid, RenderCube(scale=ENEMY_CUBE_SCALE))
     world.add_component(eid, DieFaces(sides))
     world.add_component(eid, HP(current=5, max=5))
     # Enemy: forward, left, right single patterns (all strength 1)
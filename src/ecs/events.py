@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional
 
 @dataclass(slots=True)
 class Event:
@@ -8,9 +8,212 @@ class Event:
     entity: Optional[int] = None
     data: Dict[str, Any] = field(default_factory=dict)
     priority: int = 0
+    seq: int = 0  # global publish order, assigned by EventBus
+    frame: int = 0  # bus frame the event was published in (lifetime bookkeeping)
 
 # Common event type constants (string form keeps it lightweight)
 MOVE_REQUEST = "MoveRequest"
 MOVE_STARTED = "MoveStarted"
 MOVE_COMPLETE = "MoveComplete"
 PLAYER_MOVE_INTENT = "PlayerMoveIntent"
+
+# Lifetime policies (in frames). An event with lifetime N is expired by
+# EventBus.end_frame once N frame boundaries have passed since it was published,
+# whether or not every subscriber has read it.
+EXPIRE_END_OF_FRAME = 1
+DEFAULT_LIFETIMES: Dict[str, int] = {
+    # Informational only: nothing subscribes, so without a lifetime it accumulates forever.
+    MOVE_STARTED: EXPIRE_END_OF_FRAME,
+}
+
+
+@dataclass(slots=True)
+class EventTypeStats:
+    """Running counters for one event type (see EventBus.stats)."""
+    emitted: int = 0
+    consumed: int = 0
+    expired: int = 0
+    peak_depth: int = 0
+
+
+def subscribes(*event_types: str):
+    """Decorator declaring which event types a system reads.
+
+    `World.add_system` subscribes the system to each type in registration order, which
+    fixes the order in which consumers see an event (e.g. MOVE_COMPLETE goes
+    orientation -> attack -> occupancy).
+    """
+    def deco(fn: Callable):
+        fn.subscribes = event_types
+        return fn
+    return deco
+
+
+class EventBus:
+    """Per-type event queues read through per-subscriber cursors.
+
+    Every subscriber of a type sees each event of that type exactly once, in publish
+    order, via `read(type, subscriber)`. An event is consumed (dropped from its queue)
+    once every subscriber has read past it, so no system ever rescans or rebuilds the
+    queues of types it does not care about. Types with no subscribers are retained
+    unless they have a lifetime (`set_lifetime`), in which case `end_frame` expires them.
+    """
+    __slots__ = ('_queues', '_base', '_cursors', '_seq', '_frame', '_lifetimes', '_stats',
+                 'delivered', 'consumed')
+
+    def __init__(self):
+        self._queues: Dict[str, List[Event]] = {}
+        # Absolute index (publish count for that type) of _queues[type][0]
+        self._base: Dict[str, int] = {}
+        # type -> {subscriber: absolute index of next unread event}; dict keeps subscribe order
+        self._cursors: Dict[str, Dict[Hashable, int]] = {}
+        self._seq = 0
+        self._frame = 0
+        self._lifetimes: Dict[str, int] = dict(DEFAULT_LIFETIMES)
+        self._stats: Dict[str, EventTypeStats] = {}
+        # Running totals across types (read deliveries / events dropped after every read);
+        # the profiler diffs these around each system call.
+        self.delivered = 0
+        self.consumed = 0
+
+    def fork(self) -> "EventBus":
+        """Independent copy for World.fork: queues, cursors and counters are copied.
+
+        Retained events are copied too (data dict included) since systems may annotate
+        an event's data while reading it. Cost is O(retained events), not O(entities).
+        """
+        child = EventBus.__new__(EventBus)
+        child._queues = {t: [Event(ev.type, ev.entity, dict(ev.data), ev.priority, ev.seq, ev.frame) for ev in q]
+                         for t, q in self._queues.items()}
+        child._base = dict(self._base)
+        child._cursors = {t: dict(c) for t, c in self._cursors.items()}
+        child._seq = self._seq
+        child._frame = self._frame
+        child._lifetimes = dict(self._lifetimes)
+        child._stats = {t: EventTypeStats(st.emitted, st.consumed, st.expired, st.peak_depth)
+                        for t, st in self._stats.items()}
+        child.delivered = self.delivered
+        child.consumed = self.consumed
+        return child
+
+    def set_lifetime(self, event_type: str, frames: Optional[int]):
+        """Expire `event_type` events `frames` frame ends after publish (None = never)."""
+        if frames is None:
+            self._lifetimes.pop(event_type, None)
+        else:
+            if frames < 1:
+                raise ValueError("event lifetime must be at least one frame")
+            self._lifetimes[event_type] = frames
+
+    def publish(self, event: Event) -> Event:
+        self._seq += 1
+        event.seq = self._seq
+        event.frame = self._frame
+        q = self._queues.get(event.type)
+        if q is None:
+            q = self._queues[event.type] = []
+            self._base.setdefault(event.type, 0)
+            self._stats[event.type] = EventTypeStats()
+        q.append(event)
+        st = self._stats[event.type]
+        st.emitted += 1
+        if len(q) > st.peak_depth:
+            st.peak_depth = len(q)
+        return event
+
+    def subscribe(self, event_type: str, subscriber: Hashable):
+        cursors = self._cursors.setdefault(event_type, {})
+        if subscriber not in cursors:
+            # New subscribers start at the oldest retained event.
+            cursors[subscriber] = self._base.get(event_type, 0)
+
+    def subscribers(self, event_type: str) -> List[Hashable]:
+        return list(self._cursors.get(event_type, {}))
+
+    def read(self, event_type: str, subscriber: Hashable) -> List[Event]:
+        """Return events of `event_type` not yet seen by `subscriber` and mark them read."""
+        cursors = self._cursors.get(event_type)
+        if cursors is None or subscriber not in cursors:
+            self.subscribe(event_type, subscriber)
+            cursors = self._cursors[event_type]
+        q = self._queues.get(event_type)
+        if not q:
+            return []
+        base = self._base[event_type]
+        start = cursors[subscriber] - base
+        end = base + len(q)
+        if start >= len(q):
+            return []
+        events = q[start:]
+        cursors[subscriber] = end
+        self.delivered += len(events)
+        self._trim(event_type)
+        return events
+
+    def _trim(self, event_type: str):
+        cursors = self._cursors.get(event_type)
+        if not cursors:
+            return
+        low = min(cursors.values())
+        base = self._base[event_type]
+        if low > base:
+            del self._queues[event_type][:low - base]
+            self._base[event_type] = low
+            self._stats[event_type].consumed += low - base
+            self.consumed += low - base
+
+    def end_frame(self):
+        """Advance the frame counter and drop events whose lifetime has run out."""
+        frame = self._frame
+        for event_type, lifetime in self._lifetimes.items():
+            q = self._queues.get(event_type)
+            if not q:
+                continue
+            # Queues are in publish (hence frame) order: expired events form a prefix.
+            n = 0
+            for ev in q:
+                if frame - ev.frame + 1 < lifetime:
+                    break
+                n += 1
+            if not n:
+                continue
+            del q[:n]
+            base = self._base[event_type] + n
+            self._base[event_type] = base
+            self._stats[event_type].expired += n
+            cursors = self._cursors.get(event_type)
+            if cursors:
+                for sub, cur in cursors.items():
+                    if cur < base:
+                        cursors[sub] = base
+        self._frame = frame + 1
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-type snapshot: depth (retained now), emitted, consumed, expired, peak_depth."""
+        return {
+            event_type: {
+                'depth': len(self._queues.get(event_type, ())),
+                'emitted': st.emitted,
+                'consumed': st.consumed,
+                'expired': st.expired,
+                'peak_depth': st.peak_depth,
+            }
+            for event_type, st in self._stats.items()
+        }
+
+    def pending(self, event_type: str) -> List[Event]:
+        """Events of `event_type` still retained (not yet read by every subscriber)."""
+        return list(self._queues.get(event_type, ()))
+
+    def all_pending(self) -> List[Event]:
+        """Every retained event across types, in publish order (debug/inspection)."""
+        merged = [ev for q in self._queues.values() for ev in q]
+        merged.sort(key=lambda ev: ev.seq)
+        return merged
+
+    def __len__(self) -> int:
+        return sum(len(q) for q in self._queues.values())
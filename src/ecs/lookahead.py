@@ -0,0 +1,247 @@
+"""Search-based enemy planning: depth-limited expectimax with a bounded transposition table.
+
+Used by enemy_planning_system when the world holds a LookaheadPlanner singleton. Each
+enemy close enough to the player to matter is planned on its own against a frozen
+snapshot of the board (the only state the search clones is a handful of ints per
+node): the enemy picks the legal move maximising
+
+    E[damage its new top face deals to the player - counter_weight * damage taken back]
+
+over the player's legal responses (four steps or a pass, equally likely), recursing to
+the configured depth. Other enemies are treated as fixed obstacles. Enemies too far
+away to hit or be hit within the horizon keep following their Patrol.
+
+Search runs depth 1 for every near enemy, then deepens (nearest enemies first) while
+the per-turn budget lasts, so planning cost is bounded however many enemies there are.
+Results are cached in the planner's LRU table keyed by everything a subtree reads:
+the enemy's and the player's tile and orientation, the depth, both dice's attack
+tables, and the blocked state of every tile within `depth` steps of either die (the
+only tiles the subtree can move onto). Identical situations on later turns (or for
+other enemies, or deeper in the same search) are then dictionary hits.
+"""
+from __future__ import annotations
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ecs.world import World
+from ecs.components import Position, DieFaces, AIWalker, Patrol, AttackSet, AttackSide, LookaheadPlanner
+from ecs.attack_utils import pattern_tile
+from ecs.orientation import DIRECTIONS, ORIENTATION_COUNT, TOP_FACE, TRANSITIONS
+
+RESPONSES: Tuple[Tuple[int, int], ...] = DIRECTIONS + ((0, 0),)
+# Per orientation: ((target_type, strength), ...) of the effects its top face triggers.
+EffectTable = Tuple[Tuple[Tuple[str, int], ...], ...]
+# Tile offsets within Manhattan distance d, per depth d (grown on demand).
+_DIAMONDS: List[Tuple[Tuple[int, int], ...]] = []
+# Interned (enemy effects, player effects) pairs: a small int in the key instead of the tables.
+_FX_IDS: Dict[Tuple[EffectTable, EffectTable], int] = {}
+
+
+def _diamond(depth: int) -> Tuple[Tuple[int, int], ...]:
+    while len(_DIAMONDS) <= depth:
+        d = len(_DIAMONDS)
+        _DIAMONDS.append(tuple((di, dj) for di in range(-d, d + 1) for dj in range(-d, d + 1)
+                               if abs(di) + abs(dj) <= d))
+    return _DIAMONDS[depth]
+
+
+def orientation_effects(world: World, eid: int) -> EffectTable:
+    """Attack effects per orientation index (same resolution as get_attack_effects)."""
+    faces = world.get_component(DieFaces).get(eid)
+    attack_set = world.get_component(AttackSet).get(eid)
+    attack_side = world.get_component(AttackSide).get(eid)
+    table = []
+    for o in range(ORIENTATION_COUNT):
+        top = faces.base.get(TOP_FACE[o]) if faces else None
+        effects = ()
+        if top is not None:
+            if attack_set is not None:
+                effects = attack_set.effects.get(top.face_id, ())
+            elif attack_side is not None and attack_side.face_id == top.face_id:
+                effects = (attack_side.effect,)
+        table.append(tuple((eff.target_type, eff.strength) for eff in effects))
+    return tuple(table)
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+class _Search:
+    """One enemy's search against a frozen board (blocked tiles looked up once each)."""
+    __slots__ = ('planner', 'is_blocked', 'blocked_cache', 'enemy_fx', 'player_fx', 'fx_id', 'deadline')
+
+    def __init__(self, planner: LookaheadPlanner, is_blocked: Callable[[int, int], bool],
+                 enemy_fx: EffectTable, player_fx: EffectTable):
+        self.planner = planner
+        self.is_blocked = is_blocked
+        self.blocked_cache: Dict[Tuple[int, int], bool] = {}
+        self.enemy_fx = enemy_fx
+        self.player_fx = player_fx
+        self.fx_id = _FX_IDS.setdefault((enemy_fx, player_fx), len(_FX_IDS))
+        self.deadline: Optional[float] = None  # set while deepening past depth 1
+
+    def blocked(self, i: int, j: int) -> bool:
+        key = (i, j)
+        b = self.blocked_cache.get(key)
+        if b is None:
+            b = self.blocked_cache[key] = self.is_blocked(i, j)
+        return b
+
+    def window(self, e_pos, p_pos, depth: int) -> int:
+        """Bitmask of blocked tiles within `depth` steps of either die (all a subtree reads)."""
+        blocked = self.blocked
+        offsets = _diamond(depth)
+        mask = 0
+        bit = 1
+        for ci, cj in (e_pos, p_pos):
+            for di, dj in offsets:
+                if blocked(ci + di, cj + dj):
+                    mask |= bit
+                bit <<= 1
+        return mask
+
+    def best(self, e_pos, e_o: int, p_pos, p_o: int, depth: int, moves) -> Tuple[float, Optional[Tuple[int, int]]]:
+        """(expected value, best move) for the enemy at e_pos; moves = candidate order."""
+        planner = self.planner
+        table = planner.table
+        key = (self.fx_id, e_pos, e_o, p_pos, p_o, depth, moves, self.window(e_pos, p_pos, depth))
+        hit = table.get(key)
+        if hit is not None:
+            table.move_to_end(key)
+            planner.hits += 1
+            return hit
+        planner.misses += 1
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise _OutOfTime
+        ei, ej = e_pos
+        pi, pj = p_pos
+        weight = planner.counter_weight
+        best_value = float('-inf')
+        best_move = None
+        for di, dj in moves:
+            ti = ei + di; tj = ej + dj
+            if self.blocked(ti, tj):
+                continue
+            o2 = TRANSITIONS[e_o][DIRECTIONS.index((di, dj))]
+            hits: Dict[Tuple[int, int], int] = {}
+            for ttype, strength in self.enemy_fx[o2]:
+                tile = pattern_tile(ttype, di, dj, ti, tj)
+                if tile is not None:
+                    hits[tile] = hits.get(tile, 0) + strength
+            total = 0.0
+            count = 0
+            for ri, rj in RESPONSES:
+                qi = pi + ri; qj = pj + rj
+                # Player cannot enter a blocked tile or the tile this enemy claims
+                if (qi, qj) == (ti, tj) or self.blocked(qi, qj):
+                    continue
+                value = hits.get((qi, qj), 0)
+                po2 = p_o
+                if ri or rj:
+                    po2 = TRANSITIONS[p_o][DIRECTIONS.index((ri, rj))]
+                    back = 0
+                    for ttype, strength in self.player_fx[po2]:
+                        if pattern_tile(ttype, ri, rj, qi, qj) == (ti, tj):
+                            back += strength
+                    value -= weight * back
+                if depth > 1:
+                    value += self.best((ti, tj), o2, (qi, qj), po2, depth - 1, DIRECTIONS)[0]
+                total += value
+                count += 1
+            expected = total / count if count else 0.0
+            if expected > best_value:
+                best_value = expected
+                best_move = (di, dj)
+        result = (best_value if best_move is not None else 0.0, best_move)
+        table[key] = result
+        if len(table) > planner.table_size:
+            table.popitem(last=False)
+        return result
+
+
+def find_player(world: World) -> Optional[int]:
+    """First die without AIWalker (the player-controlled die), or None."""
+    ai = world.get_component(AIWalker)
+    for eid in world.query(DieFaces, Position):
+        if eid not in ai:
+            return eid
+    return None
+
+
+def plan_turn(world: World, planner: LookaheadPlanner,
+              fallback: Callable[[World, int, Position, Patrol], Optional[dict]]) -> List[dict]:
+    """Planned moves ({'entity', 'di', 'dj', 'ti', 'tj'}) for every AIWalker + Patrol enemy.
+
+    `fallback(world, eid, pos, patrol)` plans enemies the search leaves alone (no player,
+    or out of reach within max_depth turns); enemy_planning_system passes its Patrol rule.
+    """
+    start = time.perf_counter()
+    deadline = start + planner.budget_ms / 1e3
+    pos_store = world.get_component(Position)
+    patrol_store = world.get_component(Patrol)
+    faces_store = world.get_component(DieFaces)
+    is_blocked = world.spatial.is_blocked
+    player = find_player(world)
+    p_pos = p_o = None
+    player_fx: EffectTable = ()
+    if player is not None:
+        pp = pos_store[player]
+        p_pos = (pp.i, pp.j)
+        p_o = faces_store[player].orientation
+        player_fx = orientation_effects(world, player)
+    max_depth = max(1, planner.max_depth)
+    # Enemy and player each close one tile per ply; attacks reach one tile beyond.
+    reach = 2 * max_depth + 1
+
+    plans: Dict[int, Optional[dict]] = {}
+    near: List[Tuple[int, int, _Search, tuple]] = []  # (distance, eid, search, root args)
+    for eid in world.query(AIWalker, Patrol):
+        pos = pos_store.get(eid)
+        patrol = patrol_store.get(eid)
+        if not pos or not patrol:
+            continue
+        dist = abs(pos.i - p_pos[0]) + abs(pos.j - p_pos[1]) if p_pos is not None else None
+        faces = faces_store.get(eid)
+        if dist is None or dist > reach or faces is None:
+            plans[eid] = fallback(world, eid, pos, patrol)
+            continue
+        search = _Search(planner, is_blocked, orientation_effects(world, eid), player_fx)
+        # Patrol direction first so ties keep the patrol walk.
+        fwd = (patrol.di, patrol.dj)
+        rev = (-patrol.di, -patrol.dj)
+        moves = tuple(dict.fromkeys((fwd, rev) + DIRECTIONS))
+        moves = tuple(m for m in moves if m in DIRECTIONS)
+        near.append((dist, eid, search, ((pos.i, pos.j), faces.orientation, p_pos, p_o, moves)))
+        plans[eid] = None
+    near.sort(key=lambda item: item[0])
+
+    chosen: Dict[int, Tuple[int, int]] = {}
+    completed = 0
+    for depth in range(1, max_depth + 1):
+        if depth > 1 and time.perf_counter() >= deadline:
+            break
+        done_all = True
+        for _, eid, search, (e_pos, e_o, pp, po, moves) in near:
+            # Depth 1 always completes; deeper passes stop (keeping the shallower move)
+            # as soon as the budget runs out, even mid-search.
+            search.deadline = deadline if depth > 1 else None
+            try:
+                _, move = search.best(e_pos, e_o, pp, po, depth, moves)
+            except _OutOfTime:
+                done_all = False
+                break
+            if move is not None:
+                chosen[eid] = move
+        if done_all:
+            completed = depth
+        else:
+            break
+    for _, eid, _, (e_pos, _, _, _, _) in near:
+        move = chosen.get(eid)
+        if move is not None:
+            plans[eid] = {'entity': eid, 'di': move[0], 'dj': move[1],
+                          'ti': e_pos[0] + move[0], 'tj': e_pos[1] + move[1]}
+    planner.last_depth = completed if near else 0
+    planner.last_ms = (time.perf_counter() - start) * 1e3
+    return [plan for plan in plans.values() if plan]
@@ -0,0 +1,81 @@
+"""Precomputed cube orientation tables.
+
+A die orientation is one of the 24 rotations of a cube, stored as a small int
+(0 = the orientation a die is created in). Rolling and "which face is at position X"
+become table lookups instead of permuting dicts of DieSide objects.
+
+Positions / base faces use the logical names the rest of the code uses:
+'top', 'bottom', 'north', 'south', 'east', 'west'. A base face is named after the
+position it occupies in orientation 0.
+"""
+from __future__ import annotations
+from typing import Dict, List, Tuple
+
+POSITIONS: Tuple[str, ...] = ('top', 'bottom', 'north', 'south', 'east', 'west')
+POSITION_INDEX: Dict[str, int] = {p: n for n, p in enumerate(POSITIONS)}
+
+# Roll directions in (di, dj) form; index used by TRANSITIONS.
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIRECTION_INDEX: Dict[Tuple[int, int], int] = {d: n for n, d in enumerate(DIRECTIONS)}
+
+IDENTITY = 0
+
+# For each roll direction: new_position -> old_position whose face moves there.
+# Matches the historical orientation_system permutations exactly.
+_ROLLS: Dict[Tuple[int, int], Dict[str, str]] = {
+    (1, 0): {'top': 'west', 'east': 'top', 'bottom': 'east', 'west': 'bottom'},
+    (-1, 0): {'top': 'east', 'west': 'top', 'bottom': 'west', 'east': 'bottom'},
+    (0, 1): {'top': 'south', 'north': 'top', 'bottom': 'north', 'south': 'bottom'},
+    (0, -1): {'top': 'north', 'south': 'top', 'bottom': 'south', 'north': 'bottom'},
+}
+
+
+def _roll_layout(layout: Tuple[int, ...], direction: Tuple[int, int]) -> Tuple[int, ...]:
+    moves = _ROLLS[direction]
+    return tuple(
+        layout[POSITION_INDEX[moves.get(pos, pos)]]
+        for pos in POSITIONS
+    )
+
+
+def _build_tables():
+    # layout: position index -> base face index; BFS from identity so ids are stable.
+    identity = tuple(range(len(POSITIONS)))
+    layouts: List[Tuple[int, ...]] = [identity]
+    ids = {identity: IDENTITY}
+    transitions: List[List[int]] = []
+    n = 0
+    while n < len(layouts):
+        row = []
+        for direction in DIRECTIONS:
+            nxt = _roll_layout(layouts[n], direction)
+            if nxt not in ids:
+                ids[nxt] = len(layouts)
+                layouts.append(nxt)
+            row.append(ids[nxt])
+        transitions.append(row)
+        n += 1
+    return layouts, transitions
+
+
+_LAYOUTS, _TRANSITIONS = _build_tables()
+assert len(_LAYOUTS) == 24, "cube must have 24 rotations"
+
+ORIENTATION_COUNT = len(_LAYOUTS)
+# TRANSITIONS[o][direction_index] -> orientation after rolling one tile that way.
+TRANSITIONS: Tuple[Tuple[int, ...], ...] = tuple(tuple(row) for row in _TRANSITIONS)
+# FACE_AT[o][position] -> base face name currently at `position`.
+FACE_AT: Tuple[Dict[str, str], ...] = tuple(
+    {pos: POSITIONS[layout[POSITION_INDEX[pos]]] for pos in POSITIONS}
+    for layout in _LAYOUTS
+)
+# TOP_FACE[o] -> base face name on top (hot path for attack resolution).
+TOP_FACE: Tuple[str, ...] = tuple(face_at['top'] for face_at in FACE_AT)
+
+
+def roll(orientation: int, di: int, dj: int) -> int:
+    """Orientation after rolling one tile by (di, dj); unchanged for non-unit moves."""
+    d = DIRECTION_INDEX.get((di, dj))
+    if d is None:
+        return orientation
+    return TRANSITIONS[orientation][d]
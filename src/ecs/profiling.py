@@ -0,0 +1,126 @@
+"""Opt-in per-system profiler for World.update (and anything else timed through it).
+
+    prof = world.enable_profiling()
+    ...  # run frames
+    print(prof.to_json())
+
+`World.update` only takes the instrumented path while `world.profiler` is set, so a
+disabled profiler costs a single None check per frame.
+"""
+from __future__ import annotations
+import json
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ecs.world import World
+
+DEFAULT_WINDOW = 512  # samples kept per entry for percentiles
+PERCENTILES = (50, 95, 99)
+
+
+def _nearest_rank(ordered, pct: float) -> float:
+    n = len(ordered)
+    if not n:
+        return 0.0
+    rank = min(n - 1, max(0, math.ceil(pct / 100 * n) - 1))
+    return ordered[rank]
+
+
+class ProfileEntry:
+    """Counters for one system / draw helper plus a ring buffer of recent wall times."""
+    __slots__ = ('calls', 'total', 'max', 'events_seen', 'events_consumed', 'samples')
+
+    def __init__(self, window: int):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.events_seen = 0
+        self.events_consumed = 0
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def add(self, elapsed: float, seen: int = 0, consumed: int = 0):
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.events_seen += seen
+        self.events_consumed += consumed
+        self.samples.append(elapsed)
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the buffered samples (seconds)."""
+        return _nearest_rank(sorted(self.samples), pct)
+
+    def snapshot(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        out: Dict[str, Any] = {
+            'calls': self.calls,
+            'total_ms': self.total * 1e3,
+            'mean_ms': (self.total / self.calls * 1e3) if self.calls else 0.0,
+            'max_ms': self.max * 1e3,
+            'events_seen': self.events_seen,
+            'events_consumed': self.events_consumed,
+        }
+        for pct in PERCENTILES:
+            out[f'p{pct}_ms'] = _nearest_rank(ordered, pct) * 1e3
+        return out
+
+
+class Profiler:
+    """Wall time, call count and event traffic per system (keyed by function name)."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW, clock: Callable[[], float] = time.perf_counter):
+        self.window = window
+        self.clock = clock
+        self.entries: Dict[str, ProfileEntry] = {}
+        self.frames = 0
+
+    def _entry(self, name: str) -> ProfileEntry:
+        entry = self.entries.get(name)
+        if entry is None:
+            entry = self.entries[name] = ProfileEntry(self.window)
+        return entry
+
+    def run_system(self, world: "World", system_fn: Callable, dt: float):
+        """Call `system_fn(world, dt)`, recording time and events read / dropped by it."""
+        bus = world.events
+        seen0 = bus.delivered
+        consumed0 = bus.consumed
+        start = self.clock()
+        system_fn(world, dt)
+        elapsed = self.clock() - start
+        self._entry(system_fn.__name__).add(elapsed, bus.delivered - seen0, bus.consumed - consumed0)
+
+    def call(self, name: str, fn: Callable, *args, **kwargs):
+        """Time an arbitrary call (render_system, draw helpers) under `name`."""
+        start = self.clock()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._entry(name).add(self.clock() - start)
+
+    def end_frame(self, elapsed: float):
+        self.frames += 1
+        self._entry('World.update').add(elapsed)
+
+    def reset(self):
+        self.entries.clear()
+        self.frames = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict view: {'frames': n, 'window': w, 'entries': {name: stats}}."""
+        return {
+            'frames': self.frames,
+            'window': self.window,
+            'entries': {name: entry.snapshot() for name, entry in self.entries.items()},
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def dump(self, path: str):
+        with open(path, 'w', encoding='utf-8') as fh:
+            fh.write(self.to_json())
@@ -1,124 +1,89 @@
 from __future__ import annotations
-import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from ecs.world import World
 from ecs.components import Position, DieFaces, RenderCube, TumbleAnim, DieSide, HP, Renderable
 from ecs.attack_utils import get_attack_targets
+from ecs.tumble import tumble_face_polygons
+from ecs.camera import TileView
 import arcade
+from arcade import shape_list
+
+FACE_OUTLINE_COLOR = (0, 200, 255)
+BARRIER_EDGES = (
+    (0,1),(1,3),(3,2),(2,0),  # bottom square
+    (4,5),(5,7),(7,6),(6,4),  # top square
+    (0,4),(1,5),(2,6),(3,7)   # verticals
+)
+
+
+@dataclass(slots=True)
+class RenderStats:
+    """Draw calls issued in the current frame.
+
+    immediate: individual arcade.draw_* calls; batched: ShapeElementList.draw calls;
+    rebuilt: shape lists rebuilt this frame (cache misses); culled: renderable entities
+    skipped by render_system because they lie outside the camera view.
+    """
+    immediate: int = 0
+    batched: int = 0
+    rebuilt: int = 0
+    culled: int = 0
+
+    @property
+    def draw_calls(self) -> int:
+        return self.immediate + self.batched
+
+    def reset(self):
+        self.immediate = 0
+        self.batched = 0
+        self.rebuilt = 0
+        self.culled = 0
+
+
+RENDER_STATS = RenderStats()
+
+
+def cube_screen_corners(geom, pos_i: int, pos_j: int, scale: float) -> Tuple[Tuple[float, float], ...]:
+    """The 8 screen corners of a resting cube on tile (pos_i, pos_j) (cached on geom)."""
+    return geom.cube_corners(pos_i, pos_j, scale)
+
+
+def cube_face_polygons(geom, pos_i: int, pos_j: int, scale: float) -> Tuple[Tuple[str, Tuple[Tuple[float, float], ...]], ...]:
+    """(position, screen polygon) for each face of a resting cube, in draw order (cached on geom)."""
+    return geom.cube_faces(pos_i, pos_j, scale)
+
 
 def draw_cube(geom, faces: DieFaces, pos_i: float, pos_j: float, scale: float):
     """Draw a static cube with its faces."""
-    half = 0.5 * scale
-    height = scale
-    ci0 = pos_i + 0.5
-    cj0 = pos_j + 0.5
-    verts = [
-        [ci0 - half, cj0 - half, 0.0], [ci0 - half, cj0 + half, 0.0],
-        [ci0 + half, cj0 - half, 0.0], [ci0 + half, cj0 + half, 0.0],
-        [ci0 - half, cj0 - half, height], [ci0 - half, cj0 + half, height],
-        [ci0 + half, cj0 - half, height], [ci0 + half, cj0 + half, height],
-    ]
-    screen = []
-    for (vi, vj, vz) in verts:
-        sx, sy = geom.iso_point(vi, vj)
-        sy += vz * geom.tile_height
-        screen.append((sx, sy))
-    face_defs = [
-        ([0,1,3,2], 'bottom'), ([4,5,7,6], 'top'),
-        ([0,1,5,4], 'west'), ([2,3,7,6], 'east'),
-        ([0,2,6,4], 'south'), ([1,3,7,5], 'north'),
-    ]
-    position_priority = {'bottom': 0, 'east': 1, 'north': 2, 'south': 3, 'west': 4, 'top': 5}
-    to_draw = []
-    for face, logical in face_defs:
-        depth = sum(screen[i][1] for i in face) / len(face)
-        to_draw.append((depth, face, logical))
-    to_draw.sort(key=lambda x: position_priority.get(x[2], 99))
-    for _, face, position in to_draw:
-        poly = [screen[i] for i in face]
-        side = faces.sides.get(position)
+    for position, poly in cube_face_polygons(geom, pos_i, pos_j, scale):
+        side = faces.side_at(position)
         if side:
             draw_face_polygon(poly, side)
 
 
-def draw_tumbling_cube(geom, faces_snapshot, active_faces, anim: TumbleAnim):
-    """Draw cube mid-tumble interpolating rotation and slight slide."""
+def draw_tumbling_cube(geom, faces: DieFaces, anim: TumbleAnim):
+    """Draw cube mid-tumble from the precomputed keyframe table (see ecs.tumble)."""
     t = min(anim.elapsed / anim.duration, 1.0)
-    angle = (3.14159265 / 2) * t
-    si = anim.start_i
-    sj = anim.start_j
-    di = anim.di
-    dj = anim.dj
-    half = 0.5 * anim.scale
-    height = anim.scale
-    ci0 = si + 0.5
-    cj0 = sj + 0.5
-    # Slight slide second half
-    if t > 0.5:
-        raw = (t - 0.5) / 0.5
-        slide_t = 1 - (1 - raw) * (1 - raw)
-        correction = (1.0 - anim.scale) * slide_t
-        ci0 += di * correction
-        cj0 += dj * correction
-    verts = [
-        [ci0 - half, cj0 - half, 0.0], [ci0 - half, cj0 + half, 0.0],
-        [ci0 + half, cj0 - half, 0.0], [ci0 + half, cj0 + half, 0.0],
-        [ci0 - half, cj0 - half, height], [ci0 - half, cj0 + half, height],
-        [ci0 + half, cj0 - half, height], [ci0 + half, cj0 + half, height],
-    ]
-    if di != 0:
-        pivot_i = ci0 + half * di
-        for v in verts:
-            i_off = v[0] - pivot_i
-            z = v[2]
-            sin_sign = -1 if di == 1 else 1
-            v[0] = pivot_i + i_off * math.cos(angle) - z * math.sin(angle) * sin_sign
-            v[2] = i_off * math.sin(angle) * sin_sign + z * math.cos(angle)
-    elif dj != 0:
-        pivot_j = cj0 + half * dj
-        for v in verts:
-            j_off = v[1] - pivot_j
-            z = v[2]
-            sin_sign = -1 if dj == 1 else 1
-            v[1] = pivot_j + j_off * math.cos(angle) - z * math.sin(angle) * sin_sign
-            v[2] = j_off * math.sin(angle) * sin_sign + z * math.cos(angle)
-    face_defs = [
-        ([0,1,3,2], 'bottom'), ([4,5,7,6], 'top'),
-        ([0,1,5,4], 'west'), ([2,3,7,6], 'east'),
-        ([0,2,6,4], 'south'), ([1,3,7,5], 'north'),
-    ]
-    screen = []
-    for (vi, vj, vz) in verts:
-        sx, sy = geom.iso_point(vi, vj)
-        sy += vz * geom.tile_height
-        screen.append((sx, sy))
-    faces_to_draw = []
-    for face, logical in face_defs:
-        depth = sum(screen[i][1] for i in face) / len(face)
-        faces_to_draw.append((depth, face, logical))
-    # Face draw priority depends on movement direction for correct overlap
-    if di == 1 or dj == 1:
-        position_priority = {'north': 0, 'east': 1, 'bottom': 2, 'top': 3, 'south': 4, 'west': 5}
-    elif di == -1:
-        position_priority = {'north': 0, 'bottom': 1, 'east': 2, 'west': 3, 'south': 4, 'top': 5}
-    elif dj == -1:
-        position_priority = {'bottom': 0, 'east': 1, 'north': 2, 'south': 3, 'top': 4, 'west': 5}
-    else:
-        position_priority = {'bottom': 0, 'east': 1, 'north': 2, 'south': 3, 'west': 4, 'top': 5}
-    faces_to_draw.sort(key=lambda x: position_priority.get(x[2], 99))
-    active_sides = faces_snapshot if faces_snapshot is not None else active_faces
-    for _, face, position in faces_to_draw:
-        poly = [screen[i] for i in face]
-        side = active_sides.get(position)
+    polys = tumble_face_polygons(geom, anim.start_i, anim.start_j, anim.di, anim.dj, anim.scale, t)
+    # Faces keep their pre-roll layout until orientation_system applies the transition.
+    orientation = anim.orientation if anim.orientation is not None else faces.orientation
+    for position, poly in polys:
+        side = faces.side_at(position, orientation)
         if side:
             draw_face_polygon(poly, side)
 
 
-def render_system(world: World):
+def render_system(world: World, retained: Optional[RetainedRenderer] = None, view: Optional[TileView] = None):
     """System to render all entities with Renderable + Position.
 
+    With a camera `view` (ecs.camera.visible_tiles) only entities on visible tiles are
+    gathered, through the spatial index; the rest are counted in RENDER_STATS.culled.
+
     Assumes a singleton GridGeometry component is present (as earlier). This is invoked
     explicitly from the window's on_draw (not part of usual update ordering since drawing
-    happens once per frame after logic systems).
+    happens once per frame after logic systems). With a RetainedRenderer, barriers and
+    resting dice draw from cached shape lists; tumbling dice are always immediate-mode.
     """
     # Locate geometry (first / only instance)
     from ecs.components import GridGeometry
@@ -136,12 +101,17 @@ def render_system(world: World):
 
     draw_list = []  # (depth_key, eid)
     # IMPORTANT PROJECT RULE: Larger (i + j) => FARTHER BACK.
-    for eid, rend in render_store.items():
+    renderables = world.query(Renderable, Position)
+    if view is None:
+        candidates = renderables
+    else:
+        candidates = [eid for eid in world.spatial.entities_in(view) if eid in renderables]
+        RENDER_STATS.culled += len(renderables) - len(candidates)
+    for eid in candidates:
+        rend = render_store[eid]
         if not rend.visible:
             continue
-        p = pos_store.get(eid)
-        if not p:
-            continue
+        p = pos_store[eid]
         # Depth key: negate (i+j) so larger sums (farther back) appear earlier after ascending sort.
         depth_key = (-(p.i + p.j), p.i, rend.layer, rend.z_bias)
         draw_list.append((depth_key, eid))
@@ -160,17 +130,28 @@ def render_system(world: World):
                 continue
             anim = anim_store.get(eid) if anim_store else None
             if anim:
-                draw_tumbling_cube(geom, anim.faces_snapshot, faces.sides, anim)
+                draw_tumbling_cube(geom, faces, anim)
+            elif retained is not None:
+                retained.draw_die(eid, geom, faces, p.i, p.j, cube.scale)
             else:
                 draw_cube(geom, faces, p.i, p.j, cube.scale)
             if hp_store and eid in hp_store:
-                draw_hp_bar(geom, p.i, p.j, cube.scale, hp_store[eid])
+                if retained is not None:
+                    retained.hp_bars.draw(eid, geom, p.i, p.j, cube.scale, hp_store[eid])
+                else:
+                    draw_hp_bar(geom, p.i, p.j, cube.scale, hp_store[eid])
         elif rend.kind == 'barrier':
-            draw_barrier_cube(geom, p.i, p.j, 0.8)
+            if retained is not None:
+                retained.draw_barrier(eid, geom, p.i, p.j, 0.8)
+            else:
+                draw_barrier_cube(geom, p.i, p.j, 0.8)
+    if retained is not None:
+        retained.end_frame()
+        retained.hp_bars.end_frame(hp_store)
 
     # Planned move highlights remain separate (invoked externally) to avoid transient entity churn.
 
-def draw_planned_move_highlights(geom, world: World):
+def draw_planned_move_highlights(geom, world: World, view: Optional[TileView] = None):
     """Draw translucent green highlight on tiles with planned enemy moves (planning phase only)."""
     from ecs.components import TurnState
     turn_store = world.get_component(TurnState)
@@ -190,6 +171,8 @@ def draw_planned_move_highlights(geom, world: World):
                 continue
             di = plan.get('di', 0); dj = plan.get('dj', 0)
             ti = pos.i + di; tj = pos.j + dj
+        if view is not None and not view.contains(ti, tj):
+            continue
         # Build diamond polygon for tile target
         cx, cy = geom.tile_center(ti, tj)
         half_w = geom.tile_width / 2 * 0.5
@@ -202,6 +185,7 @@ def draw_planned_move_highlights(geom, world: World):
         ]
         arcade.draw_polygon_filled(poly, (0, 200, 0, 80))
         arcade.draw_polygon_outline(poly, (0, 255, 0), 2)
+        RENDER_STATS.immediate += 2
 
 def compute_planned_attack_preview(world: World) -> list[tuple[int,int]]:
     """Compute attack target tiles for planned enemy moves (planning phase).
@@ -238,25 +222,19 @@ def compute_planned_attack_preview(world: World) -> list[tuple[int,int]]:
     targets = list(dict.fromkeys(targets))
     return targets
 
-def draw_planned_attack_highlights(geom, world: World):
+def draw_planned_attack_highlights(geom, world: World, view: Optional[TileView] = None):
     """Draw red highlights for tiles projected to be attacked after planned moves."""
     attack_tiles = compute_planned_attack_preview(world)
     if not attack_tiles:
         return
     # Exclude barrier tiles from preview drawing
-    from ecs.components import Barrier
-    barrier_store = world.get_component(Barrier)
-    pos_store = world.get_component(Position)
-    barrier_positions = set()
-    if barrier_store:
-        for b_eid in barrier_store.keys():
-            b_pos = pos_store.get(b_eid)
-            if b_pos:
-                barrier_positions.add((b_pos.i, b_pos.j))
+    spatial = world.spatial
     half_w = geom.tile_width / 2 * 0.5
     half_h = geom.tile_height / 2 * 0.5
     for (ti, tj) in attack_tiles:
-        if (ti, tj) in barrier_positions:
+        if spatial.is_blocked(ti, tj):
+            continue
+        if view is not None and not view.contains(ti, tj):
             continue
         cx, cy = geom.tile_center(ti, tj)
         poly = [
@@ -266,6 +244,7 @@ def draw_planned_attack_highlights(geom, world: World):
             (cx - half_w, cy),
         ]
         arcade.draw_polygon_outline(poly, (255, 0, 0), 2)
+        RENDER_STATS.immediate += 1
 
 
 def draw_face_polygon(poly, face: DieSide):
@@ -275,37 +254,147 @@ def draw_face_polygon(poly, face: DieSide):
     for i in range(len(poly)):
         p1 = poly[i]
         p2 = poly[(i + 1) % len(poly)]
-        arcade.draw_line(p1[0], p1[1], p2[0], p2[1], (0, 200, 255), 2)
+        arcade.draw_line(p1[0], p1[1], p2[0], p2[1], FACE_OUTLINE_COLOR, 2)
+    RENDER_STATS.immediate += 1 + len(poly)
 
 def draw_barrier_cube(geom, pos_i: int, pos_j: int, scale: float):
     """Draw an immovable barrier as a wireframe cube (white lines only)."""
-    half = 0.5 * scale
-    height = scale
-    ci0 = pos_i + 0.5
-    cj0 = pos_j + 0.5
-    verts = [
-        [ci0 - half, cj0 - half, 0.0], [ci0 - half, cj0 + half, 0.0],
-        [ci0 + half, cj0 - half, 0.0], [ci0 + half, cj0 + half, 0.0],
-        [ci0 - half, cj0 - half, height], [ci0 - half, cj0 + half, height],
-        [ci0 + half, cj0 - half, height], [ci0 + half, cj0 + half, height],
-    ]
-    screen = []
-    for (vi, vj, vz) in verts:
-        sx, sy = geom.iso_point(vi, vj)
-        sy += vz * geom.tile_height
-        screen.append((sx, sy))
-    # Edges (pairs of vertex indices)
-    edges = [
-        (0,1),(1,3),(3,2),(2,0),  # bottom square
-        (4,5),(5,7),(7,6),(6,4),  # top square
-        (0,4),(1,5),(2,6),(3,7)   # verticals
-    ]
-    for a,b in edges:
+    screen = cube_screen_corners(geom, pos_i, pos_j, scale)
+    for a,b in BARRIER_EDGES:
         p1 = screen[a]; p2 = screen[b]
         arcade.draw_line(p1[0], p1[1], p2[0], p2[1], arcade.color.WHITE, 2)
+    RENDER_STATS.immediate += len(BARRIER_EDGES)
 
-def draw_hp_bar(geom, pos_i: int, pos_j: int, scale: float, hp: HP):
-    """Draw a small health bar and text X/Y above the cube center."""
+def visible_grid_lines(geom, view: Optional[TileView]) -> Tuple[Tuple[float, float, float, float], ...]:
+    """Grid line segments clipped to the view's tile box (all of geom.grid_lines if None)."""
+    if view is None:
+        return geom.grid_lines
+    n = geom.grid_size
+    i0 = max(view.imin, 0); i1 = min(view.imax + 1, n)
+    j0 = max(view.jmin, 0); j1 = min(view.jmax + 1, n)
+    if i1 < i0 or j1 < j0:
+        return ()
+    iso = geom.iso_point
+    lines = []
+    for i in range(i0, i1 + 1):
+        lines.append((*iso(i, j0), *iso(i, j1)))
+    for j in range(j0, j1 + 1):
+        lines.append((*iso(i0, j), *iso(i1, j)))
+    return tuple(lines)
+
+
+def draw_grid(geom, retained: Optional["RetainedRenderer"] = None, view: Optional[TileView] = None):
+    """Draw grid lines (one batched draw when a RetainedRenderer is supplied).
+
+    With a camera `view` only the lines crossing visible tiles are drawn.
+    """
+    lines = visible_grid_lines(geom, view)
+    if retained is not None:
+        retained.draw_grid(geom, lines)
+        return
+    for (x1, y1, x2, y2) in lines:
+        arcade.draw_line(x1, y1, x2, y2, arcade.color.WHITE, 1)
+    RENDER_STATS.immediate += len(lines)
+
+
+def _geom_key(geom) -> Tuple[float, float, float, float]:
+    return (geom.tile_width, geom.tile_height, geom.origin_x, geom.origin_y)
+
+
+class RetainedRenderer:
+    """Retained-mode cache of static geometry as arcade ShapeElementLists.
+
+    Grid lines, barriers and resting (non-tumbling) dice are each built once into a
+    shape list and redrawn with a single draw call. A list is rebuilt only when the
+    inputs it was built from change: tile, scale, orientation, face colors or grid
+    geometry (e.g. after a resize). Entities that stop being drawn are pruned each frame.
+    Requires an active arcade window (shape lists live on the GL context).
+    """
+
+    def __init__(self):
+        self._grid: Optional[shape_list.ShapeElementList] = None
+        self._grid_key = None
+        self._entities: Dict[int, Tuple[tuple, shape_list.ShapeElementList]] = {}
+        self._seen: set[int] = set()
+        self.hp_bars = HPBarCache()
+
+    def _draw(self, batch: shape_list.ShapeElementList):
+        batch.draw()
+        RENDER_STATS.batched += 1
+
+    def draw_grid(self, geom, lines=None):
+        if lines is None:
+            lines = geom.grid_lines
+        key = (_geom_key(geom), lines)
+        if self._grid is None or self._grid_key != key:
+            batch = shape_list.ShapeElementList()
+            points = []
+            for (x1, y1, x2, y2) in lines:
+                points.append((x1, y1)); points.append((x2, y2))
+            if points:
+                batch.append(shape_list.create_lines(points, arcade.color.WHITE))
+            self._grid, self._grid_key = batch, key
+            RENDER_STATS.rebuilt += 1
+        self._draw(self._grid)
+
+    def _cached(self, eid: int, key: tuple):
+        self._seen.add(eid)
+        entry = self._entities.get(eid)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        return None
+
+    def _store(self, eid: int, key: tuple, batch: shape_list.ShapeElementList):
+        self._entities[eid] = (key, batch)
+        RENDER_STATS.rebuilt += 1
+        return batch
+
+    def draw_die(self, eid: int, geom, faces: DieFaces, pos_i: int, pos_j: int, scale: float):
+        key = ('dice', pos_i, pos_j, scale, faces.orientation, id(faces.base), _geom_key(geom))
+        batch = self._cached(eid, key)
+        if batch is None:
+            batch = shape_list.ShapeElementList()
+            for position, poly in cube_face_polygons(geom, pos_i, pos_j, scale):
+                side = faces.side_at(position)
+                if side:
+                    batch.append(shape_list.create_polygon(poly, side.get_color()))
+                    batch.append(shape_list.create_line_loop(poly, FACE_OUTLINE_COLOR, 2))
+            self._store(eid, key, batch)
+        self._draw(batch)
+
+    def draw_barrier(self, eid: int, geom, pos_i: int, pos_j: int, scale: float):
+        key = ('barrier', pos_i, pos_j, scale, _geom_key(geom))
+        batch = self._cached(eid, key)
+        if batch is None:
+            batch = shape_list.ShapeElementList()
+            screen = cube_screen_corners(geom, pos_i, pos_j, scale)
+            for a, b in BARRIER_EDGES:
+                p1 = screen[a]; p2 = screen[b]
+                batch.append(shape_list.create_line(p1[0], p1[1], p2[0], p2[1], arcade.color.WHITE, 2))
+            self._store(eid, key, batch)
+        self._draw(batch)
+
+    def end_frame(self):
+        """Drop cached lists for entities not drawn as static geometry this frame."""
+        if len(self._seen) != len(self._entities):
+            for eid in [e for e in self._entities if e not in self._seen]:
+                del self._entities[eid]
+        self._seen = set()
+
+
+@dataclass(slots=True)
+class HPBarGeometry:
+    """Screen-space pieces of one HP bar (see hp_bar_geometry)."""
+    bg_poly: List[Tuple[float, float]]
+    fill_poly: Optional[List[Tuple[float, float]]]
+    fill_color: Tuple[int, int, int]
+    label: str
+    label_x: float
+    label_y: float
+
+
+def hp_bar_geometry(geom, pos_i: int, pos_j: int, scale: float, hp: HP) -> HPBarGeometry:
+    """Compute bar rectangles, fill color and label placement above the cube center."""
     # Base position: top center of tile
     cx, cy = geom.tile_center(pos_i, pos_j)
     # Vertical offset above cube: proportional to tile_height and scale
@@ -316,13 +405,12 @@ def draw_hp_bar(geom, pos_i: int, pos_j: int, scale: float, hp: HP):
     x_right = cx + bar_width / 2
     y_bottom = cy + offset_y
     y_top = y_bottom + bar_height
-    # Background
     # Background (approximate) using polygon if rectangle helpers unavailable
     bg_poly = [
         (x_left, y_bottom), (x_right, y_bottom), (x_right, y_top), (x_left, y_top)
     ]
-    arcade.draw_polygon_filled(bg_poly, (40,40,40,200))
-    arcade.draw_polygon_outline(bg_poly, arcade.color.WHITE, 1)
+    fill_poly = None
+    fill_color = (0, 0, 0)
     # Fill proportion
     if hp.max > 0 and hp.current > 0:
         ratio = max(0.0, min(1.0, hp.current / hp.max))
@@ -334,7 +422,68 @@ def draw_hp_bar(geom, pos_i: int, pos_j: int, scale: float, hp: HP):
             (x_left + fill_w, y_bottom + bar_height*0.65),
             (x_left, y_bottom + bar_height*0.65),
         ]
-        arcade.draw_polygon_filled(fill_poly, fill_color)
     # Text HP X/Y just to right of bar
-    label = f"{hp.current}/{hp.max}"
-    arcade.draw_text(label, x_right + 4, y_bottom - 2, arcade.color.WHITE, 12, anchor_x="left", anchor_y="bottom")
+    return HPBarGeometry(bg_poly, fill_poly, fill_color, f"{hp.current}/{hp.max}", x_right + 4, y_bottom - 2)
+
+
+def draw_hp_bar(geom, pos_i: int, pos_j: int, scale: float, hp: HP):
+    """Draw a small health bar and text X/Y above the cube center."""
+    bar = hp_bar_geometry(geom, pos_i, pos_j, scale, hp)
+    arcade.draw_polygon_filled(bar.bg_poly, (40,40,40,200))
+    arcade.draw_polygon_outline(bar.bg_poly, arcade.color.WHITE, 1)
+    RENDER_STATS.immediate += 2
+    if bar.fill_poly:
+        arcade.draw_polygon_filled(bar.fill_poly, bar.fill_color)
+        RENDER_STATS.immediate += 1
+    arcade.draw_text(bar.label, bar.label_x, bar.label_y, arcade.color.WHITE, 12, anchor_x="left", anchor_y="bottom")
+    RENDER_STATS.immediate += 1
+
+
+class HPBarCache:
+    """Per-entity HP bar cache: one arcade.Text label plus a shape list for the rectangles.
+
+    Entries are keyed on (current, max, tile, scale, geometry); the label text/position and
+    the bar shapes are only rebuilt when that key changes, so steady frames do no text
+    layout or string formatting. Entries for entities that lost their HP component (or
+    were not drawn this frame) are dropped by `end_frame`.
+    """
+
+    def __init__(self):
+        # eid -> [key, ShapeElementList, arcade.Text]
+        self._entries: Dict[int, list] = {}
+        self._seen: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def draw(self, eid: int, geom, pos_i: int, pos_j: int, scale: float, hp: HP):
+        self._seen.add(eid)
+        key = (hp.current, hp.max, pos_i, pos_j, scale, _geom_key(geom))
+        entry = self._entries.get(eid)
+        if entry is None or entry[0] != key:
+            bar = hp_bar_geometry(geom, pos_i, pos_j, scale, hp)
+            shapes = shape_list.ShapeElementList()
+            shapes.append(shape_list.create_polygon(bar.bg_poly, (40, 40, 40, 200)))
+            shapes.append(shape_list.create_line_loop(bar.bg_poly, arcade.color.WHITE, 1))
+            if bar.fill_poly:
+                shapes.append(shape_list.create_polygon(bar.fill_poly, bar.fill_color))
+            if entry is None:
+                text = arcade.Text(bar.label, bar.label_x, bar.label_y, arcade.color.WHITE, 12, anchor_x="left", anchor_y="bottom")
+                entry = self._entries[eid] = [key, shapes, text]
+            else:
+                text = entry[2]
+                if text.text != bar.label:
+                    text.text = bar.label
+                text.position = (bar.label_x, bar.label_y)
+                entry[0] = key
+                entry[1] = shapes
+            RENDER_STATS.rebuilt += 1
+        entry[1].draw()
+        entry[2].draw()
+        RENDER_STATS.batched += 2
+
+    def end_frame(self, hp_store):
+        stale = [eid for eid in self._entries if eid not in self._seen or eid not in hp_store]
+        for eid in stale:
+            del self._entries[eid]
+        self._seen = set()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Set, Tuple, Type
+from ecs.components import Barrier, DieFaces, Tile, TileLayer, TILE_WALKABLE
+
+# Layer bits: which kind of occupant an entity counts as in a cell.
+LAYER_BARRIER = 1
+LAYER_DIE = 2
+LAYER_TILE = 4
+LAYER_ALL = LAYER_BARRIER | LAYER_DIE | LAYER_TILE
+
+# Component type -> layer bit contributed by holding that component.
+LAYER_COMPONENTS: Dict[Type, int] = {
+    Barrier: LAYER_BARRIER,
+    DieFaces: LAYER_DIE,
+    Tile: LAYER_TILE,
+}
+
+
+class SpatialIndex:
+    """Spatial hash (i,j) -> occupants, kept on the World and updated as Position changes.
+
+    Each cell holds an insertion-ordered {eid: layer_mask} dict so blocking and occupant
+    lookups cost O(occupants in that cell) instead of a scan over every positioned entity.
+    Layer masks come from component membership (see LAYER_COMPONENTS), so an enemy die
+    that carries both DieFaces and Barrier answers to either layer.
+    """
+    __slots__ = ('_cells', '_where', '_masks', 'width', 'height', 'terrain', '_shared', '_owned_cells')
+
+    def __init__(self):
+        self._cells: Dict[Tuple[int, int], Dict[int, int]] = {}
+        self._where: Dict[int, Tuple[int, int]] = {}
+        self._masks: Dict[int, int] = {}
+        # Map bounds (set from GridGeometry by the World); None = unbounded.
+        self.width: Optional[int] = None
+        self.height: Optional[int] = None
+        # Dense terrain (non-walkable tiles block); set by the World from a TileLayer.
+        self.terrain: Optional[TileLayer] = None
+        # True while the maps above are shared with another index (see fork); after the
+        # first write, the cells whose occupant dicts are private again (None = all).
+        self._shared = False
+        self._owned_cells: Optional[Set[Tuple[int, int]]] = None
+
+    def fork(self) -> "SpatialIndex":
+        """O(1) copy-on-write copy: both indexes share the maps until either one writes."""
+        child = SpatialIndex.__new__(SpatialIndex)
+        child._cells = self._cells
+        child._where = self._where
+        child._masks = self._masks
+        child.width = self.width
+        child.height = self.height
+        child.terrain = self.terrain
+        child._owned_cells = None
+        child._shared = self._shared = True
+        return child
+
+    def _own(self):
+        # Top-level maps are copied now; each cell's occupant dict on its first write.
+        self._cells = dict(self._cells)
+        self._where = dict(self._where)
+        self._masks = dict(self._masks)
+        self._owned_cells = set()
+        self._shared = False
+
+    def _cell(self, cell: Tuple[int, int]) -> Dict[int, int]:
+        """Writable occupant dict for `cell` (created if missing)."""
+        occ = self._cells.get(cell)
+        owned = self._owned_cells
+        if occ is None:
+            occ = self._cells[cell] = {}
+            if owned is not None:
+                owned.add(cell)
+        elif owned is not None and cell not in owned:
+            occ = self._cells[cell] = dict(occ)
+            owned.add(cell)
+        return occ
+
+    def set_bounds(self, width: Optional[int], height: Optional[int] = None):
+        """Tiles outside 0..width-1 x 0..height-1 count as blocked (None clears bounds)."""
+        self.width = width
+        self.height = width if height is None else height
+
+    # --- Maintenance (driven by World store notifications / set_position) ---
+    def place(self, eid: int, i: int, j: int):
+        cell = (i, j)
+        old = self._where.get(eid)
+        if old == cell:
+            return
+        if self._shared:
+            self._own()
+        if old is not None:
+            self._unlink(eid, old)
+        self._where[eid] = cell
+        self._cell(cell)[eid] = self._masks.get(eid, 0)
+
+    def remove(self, eid: int):
+        if self._shared:
+            self._own()
+        old = self._where.pop(eid, None)
+        if old is not None:
+            self._unlink(eid, old)
+
+    def set_layer(self, eid: int, layer: int, present: bool):
+        if self._shared:
+            self._own()
+        mask = self._masks.get(eid, 0)
+        mask = (mask | layer) if present else (mask & ~layer)
+        if mask:
+            self._masks[eid] = mask
+        else:
+            self._masks.pop(eid, None)
+        cell = self._where.get(eid)
+        if cell is not None:
+            self._cell(cell)[eid] = mask
+
+    def _unlink(self, eid: int, cell: Tuple[int, int]):
+        if cell not in self._cells:
+            return
+        occ = self._cell(cell)
+        occ.pop(eid, None)
+        if not occ:
+            del self._cells[cell]
+
+    # --- Lookups ---
+    def cell_of(self, eid: int):
+        return self._where.get(eid)
+
+    def mask_at(self, i: int, j: int) -> int:
+        occ = self._cells.get((i, j))
+        if not occ:
+            return 0
+        mask = 0
+        for m in occ.values():
+            mask |= m
+        return mask
+
+    def set_terrain(self, layer: Optional[TileLayer]):
+        """Use `layer` for walkability and as the map bounds (None detaches it)."""
+        self.terrain = layer
+        if layer is not None:
+            self.set_bounds(layer.width, layer.height)
+
+    def in_bounds(self, i: int, j: int) -> bool:
+        w = self.width
+        return w is None or (0 <= i < w and 0 <= j < self.height)
+
+    def is_blocked(self, i: int, j: int) -> bool:
+        """True if (i,j) is off the map, not walkable terrain, or holds a Barrier-layer entity."""
+        w = self.width
+        if w is not None and not (0 <= i < w and 0 <= j < self.height):
+            return True
+        terrain = self.terrain
+        if terrain is not None and not terrain.flags[j * terrain.width + i] & TILE_WALKABLE:
+            return True
+        occ = self._cells.get((i, j))
+        if not occ:
+            return False
+        for m in occ.values():
+            if m & LAYER_BARRIER:
+                return True
+        return False
+
+    def occupants_at(self, i: int, j: int, mask: int = LAYER_ALL) -> List[int]:
+        """Entity ids at (i,j) whose layer mask intersects `mask` (placement order).
+
+        Passing LAYER_ALL also returns positioned entities that belong to no layer.
+        """
+        occ = self._cells.get((i, j))
+        if not occ:
+            return []
+        if mask == LAYER_ALL:
+            return list(occ)
+        return [eid for eid, m in occ.items() if m & mask]
+
+    def entities_in(self, view, mask: int = LAYER_ALL) -> List[int]:
+        """Entity ids on tiles inside `view` (an ecs.camera.TileView) matching `mask`.
+
+        Walks whichever is smaller: the view's tiles, or the occupied cells; so cost is
+        bounded by what is on screen or what is on the map, never by the entity count.
+        """
+        cells = self._cells
+        out: List[int] = []
+        if view.tile_count() <= len(cells):
+            for cell in view.cells():
+                occ = cells.get(cell)
+                if occ:
+                    out.extend(eid for eid, m in occ.items() if m & mask or mask == LAYER_ALL)
+        else:
+            contains = view.contains
+            for (i, j), occ in cells.items():
+                if contains(i, j):
+                    out.extend(eid for eid, m in occ.items() if m & mask or mask == LAYER_ALL)
+        return out
+
+    def __len__(self) -> int:
+        return len(self._where)
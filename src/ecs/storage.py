@@ -0,0 +1,249 @@
+from __future__ import annotations
+import copy
+from typing import Any, Callable, Dict, Iterator, Tuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ecs.world import World
+
+
+class ComponentStore(dict):
+    """Per-type mapping entity id -> component that reports membership changes to its World.
+
+    Behaves exactly like the plain dict stores systems already use (`store[eid] = comp`,
+    `store.pop(eid)`, `eid in store`...), so `World.get_component` callers keep working.
+    Every mutating dict method is routed through `_added` / `_removed` so cached queries
+    can be updated incrementally instead of rescanning stores.
+
+    Storage stays one dict per component type rather than archetype tables or sparse
+    sets: a CPython dict is already a sparse index over a dense, insertion-ordered entry
+    array, so per-entity get / set / delete are O(1) and iteration is dense. The cost
+    that grew with map size was the per-call scan in entities_with, and cached Query
+    membership removes it. Archetypes would also make every add / remove move an
+    entity's other components between tables in Python code.
+    """
+    __slots__ = ('comp_type', '_world')
+
+    def __init__(self, comp_type: Type, world: "World"):
+        super().__init__()
+        self.comp_type = comp_type
+        self._world = world
+
+    # --- Notification helpers ---
+    def _added(self, eid: int, comp: Any, is_new: bool):
+        self._world._component_added(self.comp_type, eid, comp, is_new)
+
+    def _removed(self, eid: int, comp: Any):
+        self._world._component_removed(self.comp_type, eid, comp)
+
+    # --- dict overrides (C-level dict methods bypass __setitem__, so each is wrapped) ---
+    def __setitem__(self, eid: int, comp: Any):
+        is_new = eid not in self
+        dict.__setitem__(self, eid, comp)
+        self._added(eid, comp, is_new)
+
+    def __delitem__(self, eid: int):
+        comp = dict.pop(self, eid)
+        self._removed(eid, comp)
+
+    _MISSING = object()
+
+    def pop(self, eid: int, default: Any = _MISSING):
+        if eid in self:
+            comp = dict.pop(self, eid)
+            self._removed(eid, comp)
+            return comp
+        if default is ComponentStore._MISSING:
+            raise KeyError(eid)
+        return default
+
+    def popitem(self):
+        eid, comp = dict.popitem(self)
+        self._removed(eid, comp)
+        return eid, comp
+
+    def clear(self):
+        for eid in list(self.keys()):
+            del self[eid]
+
+    def setdefault(self, eid: int, default: Any = None):
+        if eid in self:
+            return dict.__getitem__(self, eid)
+        self[eid] = default
+        return default
+
+    def update(self, *args, **kwargs):
+        for eid, comp in dict(*args, **kwargs).items():
+            self[eid] = comp
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+class BorrowedStore:
+    """Read-through view of a store a forked World still shares with its parent.
+
+    Returned by `World.get_component` on a fork until the fork writes to that type:
+    reads go straight to the shared store, and the first write (set / delete / pop...)
+    makes the World take a private copy of the store, after which the view forwards to
+    that copy. Components read through the view are still the parent's objects; mutate
+    one in place only after `World.edit_component` hands back the fork's own copy.
+    """
+    __slots__ = ('comp_type', '_world', '_store')
+
+    def __init__(self, comp_type: Type, world: "World", store: ComponentStore):
+        self.comp_type = comp_type
+        self._world = world
+        self._store = store
+
+    def _writable(self) -> ComponentStore:
+        return self._world._own(self.comp_type)
+
+    # --- Reads (shared) ---
+    def __getitem__(self, eid: int) -> Any:
+        return self._store[eid]
+
+    def get(self, eid: int, default: Any = None) -> Any:
+        return self._store.get(eid, default)
+
+    def __contains__(self, eid: int) -> bool:
+        return eid in self._store
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._store)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def keys(self):
+        return self._store.keys()
+
+    def values(self):
+        return self._store.values()
+
+    def items(self):
+        return self._store.items()
+
+    def copy(self) -> Dict[int, Any]:
+        return dict(self._store)
+
+    def __eq__(self, other) -> bool:
+        return self._store == (other._store if isinstance(other, BorrowedStore) else other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"BorrowedStore({self.comp_type.__name__}, {len(self._store)} entities)"
+
+    # --- Writes (copy the store first) ---
+    def __setitem__(self, eid: int, comp: Any):
+        self._writable()[eid] = comp
+
+    def __delitem__(self, eid: int):
+        del self._writable()[eid]
+
+    def pop(self, eid: int, *default: Any):
+        return self._writable().pop(eid, *default)
+
+    def popitem(self):
+        return self._writable().popitem()
+
+    def clear(self):
+        self._writable().clear()
+
+    def setdefault(self, eid: int, default: Any = None):
+        if eid in self._store:
+            return self._store[eid]
+        return self._writable().setdefault(eid, default)
+
+    def update(self, *args, **kwargs):
+        self._writable().update(*args, **kwargs)
+
+    def __ior__(self, other):
+        self._writable().update(other)
+        return self
+
+
+# Field values clone_component copies one level deep (everything else is shared).
+_CONTAINERS = (list, dict, set, bytearray)
+_CLONERS: Dict[Type, Callable[[Any], Any]] = {}
+
+
+def _slot_names(cls: Type) -> Tuple[str, ...]:
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(n for n in dict.fromkeys(names) if n not in ('__dict__', '__weakref__'))
+
+
+def _make_cloner(cls: Type) -> Callable[[Any], Any]:
+    custom = getattr(cls, 'clone', None)
+    if custom is not None:
+        return custom
+    # Instances carry a __dict__ unless every class in the MRO declares __slots__.
+    if any('__slots__' not in klass.__dict__ for klass in cls.__mro__[:-1]):
+        def clone(comp):
+            new = copy.copy(comp)
+            for name, value in list(vars(new).items()):
+                if isinstance(value, _CONTAINERS):
+                    setattr(new, name, value.copy())
+            return new
+        return clone
+
+    names = _slot_names(cls)
+
+    def clone(comp):
+        new = object.__new__(cls)
+        for name in names:
+            try:
+                value = getattr(comp, name)
+            except AttributeError:
+                continue
+            if isinstance(value, _CONTAINERS):
+                value = value.copy()
+            setattr(new, name, value)
+        return new
+    return clone
+
+
+def clone_component(comp: Any) -> Any:
+    """Copy of `comp` that is safe to mutate in place without touching the original.
+
+    Uses the type's `clone()` if it defines one; otherwise copies the instance and its
+    list / dict / set / bytearray fields one level deep (immutable values are shared).
+    Used by World.edit_component when a forked world first mutates a shared component.
+    """
+    fn = _CLONERS.get(type(comp))
+    if fn is None:
+        fn = _CLONERS[type(comp)] = _make_cloner(type(comp))
+    return fn(comp)
+
+
+class Query:
+    """Cached set of entities holding every component type in `types`.
+
+    Built once by `World.query` and then kept current by the World as components are
+    added or removed, so iterating it costs O(matches) rather than a scan of the first
+    store plus a lookup in every other store. Membership is held in an insertion-ordered
+    dict so iteration order is deterministic (order in which entities started matching).
+    Iterate over `list(query)` if the loop body adds/removes the queried components.
+    """
+    __slots__ = ('types', 'entities')
+
+    def __init__(self, types: Tuple[Type, ...]):
+        self.types = types
+        self.entities: Dict[int, None] = {}
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.entities)
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __contains__(self, eid: int) -> bool:
+        return eid in self.entities
+
+    def __repr__(self) -> str:
+        names = ', '.join(t.__name__ for t in self.types)
+        return f"Query({names}; {len(self.entities)} entities)"
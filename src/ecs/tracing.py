@@ -0,0 +1,143 @@
+"""Chrome / Perfetto trace export for frames, systems, draws, events and turn phases.
+
+    tracer = world.enable_tracing()
+    ...  # run frames (headless Simulation or the arcade window)
+    tracer.dump('frame.trace.json')   # open in chrome://tracing or ui.perfetto.dev
+
+Spans are "complete" ('X') trace events: `World.update` per frame, each system inside
+it, and whatever the window times through `World.call_instrumented` (render_system,
+highlight draws). Emitted ECS events and TurnState phase transitions are instant ('i')
+events. Events live in a bounded ring buffer, so a long session keeps the most recent
+`capacity` entries and counts the rest as dropped.
+
+`install_global(recorder)` makes every World created afterwards trace into that
+recorder (tests/conftest.py uses it to attach traces to slow test runs).
+"""
+from __future__ import annotations
+import json
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, TYPE_CHECKING
+
+from ecs.components import TurnState
+
+if TYPE_CHECKING:
+    from ecs.world import World
+    from ecs.events import Event
+
+DEFAULT_CAPACITY = 100_000  # trace events kept in memory
+PID = 1
+TID = 1
+
+
+class TraceRecorder:
+    """Bounded in-memory buffer of Chrome trace events (timestamps in microseconds)."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, clock: Callable[[], float] = time.perf_counter,
+                 process_name: str = "DiceWalk"):
+        self.capacity = capacity
+        self.clock = clock
+        self.process_name = process_name
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self.dropped = 0
+        self.frames = 0
+        # World -> last seen TurnState.phase; weak so finished worlds drop out (and ids can be reused).
+        self._phases: "weakref.WeakKeyDictionary[World, str]" = weakref.WeakKeyDictionary()
+
+    def now(self) -> float:
+        return self.clock() * 1e6
+
+    def _append(self, event: Dict[str, Any]):
+        if len(self.events) == self.capacity:
+            self.dropped += 1
+        self.events.append(event)
+
+    # --- Recording ---
+    def complete(self, name: str, cat: str, start_us: float, end_us: float, args: Optional[Dict[str, Any]] = None):
+        ev = {'name': name, 'cat': cat, 'ph': 'X', 'ts': start_us, 'dur': end_us - start_us, 'pid': PID, 'tid': TID}
+        if args:
+            ev['args'] = args
+        self._append(ev)
+
+    def instant(self, name: str, cat: str, args: Optional[Dict[str, Any]] = None, scope: str = 't'):
+        ev = {'name': name, 'cat': cat, 'ph': 'i', 's': scope, 'ts': self.now(), 'pid': PID, 'tid': TID}
+        if args:
+            ev['args'] = args
+        self._append(ev)
+
+    def call(self, name: str, fn: Callable, *args, **kwargs):
+        """Record `fn(*args)` as a span named `name` (category 'draw')."""
+        start = self.now()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.complete(name, 'draw', start, self.now())
+
+    def run_system(self, world: "World", system_fn: Callable, dt: float, runner: Optional[Callable] = None):
+        """Record one system call as a span, then any TurnState phase change it caused."""
+        start = self.now()
+        if runner is None:
+            system_fn(world, dt)
+        else:
+            runner(world, system_fn, dt)
+        self.complete(system_fn.__name__, 'system', start, self.now())
+        self.check_phase(world)
+
+    def event(self, event: "Event"):
+        args = {'entity': event.entity} if event.entity is not None else None
+        self.instant(event.type, 'event', args)
+
+    def frame(self, start_us: float, dt: float, world: "World"):
+        self.frames += 1
+        self.complete('World.update', 'frame', start_us, self.now(),
+                      {'frame': self.frames, 'dt': dt, 'events_pending': len(world.events)})
+
+    def check_phase(self, world: "World"):
+        turn_store = world.components.get(TurnState)
+        if not turn_store:
+            return
+        phase = next(iter(turn_store.values())).phase
+        last = self._phases.get(world)
+        if phase != last:
+            self._phases[world] = phase
+            if last is not None:
+                self.instant(f'phase:{phase}', 'turn', {'from': last, 'to': phase}, scope='g')
+
+    # --- Export ---
+    def clear(self):
+        self.events.clear()
+        self.dropped = 0
+        self.frames = 0
+
+    def trace(self) -> Dict[str, Any]:
+        """Chrome trace-event JSON object (dict form)."""
+        meta: List[Dict[str, Any]] = [
+            {'name': 'process_name', 'ph': 'M', 'pid': PID, 'tid': TID, 'args': {'name': self.process_name}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': PID, 'tid': TID, 'args': {'name': 'main'}},
+        ]
+        return {
+            'traceEvents': meta + list(self.events),
+            'displayTimeUnit': 'ms',
+            'otherData': {'frames': self.frames, 'dropped': self.dropped, 'capacity': self.capacity},
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.trace())
+
+    def dump(self, path: str):
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(self.trace(), fh)
+
+
+_GLOBAL: Optional[TraceRecorder] = None
+
+
+def install_global(recorder: Optional[TraceRecorder]):
+    """Attach `recorder` to every World created from now on (None to stop)."""
+    global _GLOBAL
+    _GLOBAL = recorder
+
+
+def global_recorder() -> Optional[TraceRecorder]:
+    return _GLOBAL
@@ -0,0 +1,177 @@
+"""Precomputed tumble animation keyframes.
+
+A tumbling die's shape depends only on roll direction, cube scale and normalized time,
+so the rotated vertices are sampled once per (direction, scale) into a table of
+screen-space offsets (in tile_width / tile_height units, relative to the start tile's
+centre). Drawing a tumble is then an interpolation between two samples plus a
+translation: no trig, no per-frame face sorting, whatever the number of dice.
+"""
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Tuple, TYPE_CHECKING
+
+from ecs.components import CUBE_FACE_DEFS, RenderCube
+from ecs.orientation import DIRECTIONS
+
+if TYPE_CHECKING:
+    from ecs.world import World
+
+TUMBLE_SAMPLES = 33  # keyframes per (direction, scale), including t=0 and t=1
+DEFAULT_SCALES = (0.8, 0.6)  # player / enemy RenderCube scales (ecs.die_factory)
+
+# Face draw priority per movement direction for correct overlap (position -> rank).
+_FORWARD_PRIORITY = {'north': 0, 'east': 1, 'bottom': 2, 'top': 3, 'south': 4, 'west': 5}
+_WEST_PRIORITY = {'north': 0, 'bottom': 1, 'east': 2, 'west': 3, 'south': 4, 'top': 5}
+_SOUTH_PRIORITY = {'bottom': 0, 'east': 1, 'north': 2, 'south': 3, 'top': 4, 'west': 5}
+_REST_PRIORITY = {'bottom': 0, 'east': 1, 'north': 2, 'south': 3, 'west': 4, 'top': 5}
+
+Offset = Tuple[float, float]
+
+
+def face_order(di: int, dj: int) -> Tuple[Tuple[Tuple[int, ...], str], ...]:
+    """CUBE_FACE_DEFS sorted into painter's order for a roll in (di, dj)."""
+    if di == 1 or dj == 1:
+        priority = _FORWARD_PRIORITY
+    elif di == -1:
+        priority = _WEST_PRIORITY
+    elif dj == -1:
+        priority = _SOUTH_PRIORITY
+    else:
+        priority = _REST_PRIORITY
+    return tuple(sorted(CUBE_FACE_DEFS, key=lambda fd: priority.get(fd[1], 99)))
+
+
+def tumble_vertices(di: int, dj: int, scale: float, t: float) -> List[List[float]]:
+    """Exact (i, j, z) cube corners at normalized time t, relative to the start tile centre."""
+    angle = (math.pi / 2) * t
+    half = 0.5 * scale
+    height = scale
+    ci0 = 0.0
+    cj0 = 0.0
+    # Slight slide second half
+    if t > 0.5:
+        raw = (t - 0.5) / 0.5
+        slide_t = 1 - (1 - raw) * (1 - raw)
+        correction = (1.0 - scale) * slide_t
+        ci0 += di * correction
+        cj0 += dj * correction
+    verts = [
+        [ci0 - half, cj0 - half, 0.0], [ci0 - half, cj0 + half, 0.0],
+        [ci0 + half, cj0 - half, 0.0], [ci0 + half, cj0 + half, 0.0],
+        [ci0 - half, cj0 - half, height], [ci0 - half, cj0 + half, height],
+        [ci0 + half, cj0 - half, height], [ci0 + half, cj0 + half, height],
+    ]
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    if di != 0:
+        pivot_i = ci0 + half * di
+        sin_sign = -1 if di == 1 else 1
+        for v in verts:
+            i_off = v[0] - pivot_i
+            z = v[2]
+            v[0] = pivot_i + i_off * cos_a - z * sin_a * sin_sign
+            v[2] = i_off * sin_a * sin_sign + z * cos_a
+    elif dj != 0:
+        pivot_j = cj0 + half * dj
+        sin_sign = -1 if dj == 1 else 1
+        for v in verts:
+            j_off = v[1] - pivot_j
+            z = v[2]
+            v[1] = pivot_j + j_off * cos_a - z * sin_a * sin_sign
+            v[2] = j_off * sin_a * sin_sign + z * cos_a
+    return verts
+
+
+def _screen_offsets(verts) -> Tuple[float, ...]:
+    # iso projection with tile_width/tile_height factored out: x = (i - j) / 2, y = (i + j) / 2 + z
+    flat: List[float] = []
+    for vi, vj, vz in verts:
+        flat.append((vi - vj) * 0.5)
+        flat.append((vi + vj) * 0.5 + vz)
+    return tuple(flat)
+
+
+@dataclass(frozen=True, slots=True)
+class TumbleKeyframes:
+    """Sampled screen offsets of the 8 corners plus the fixed face draw order.
+
+    frames[k] holds the corners as a flat (u0, v0, u1, v1, ...) tuple; steps[k] is
+    frames[k + 1] - frames[k] so interpolation is one multiply-add per coordinate.
+    """
+    di: int
+    dj: int
+    scale: float
+    frames: Tuple[Tuple[float, ...], ...]
+    steps: Tuple[Tuple[float, ...], ...]
+    faces: Tuple[Tuple[Tuple[int, ...], str], ...]
+
+    def sample(self, t: float) -> Tuple[int, float]:
+        """(keyframe index, fraction towards the next keyframe) for normalized time t."""
+        last = len(self.frames) - 1
+        if t <= 0.0:
+            return 0, 0.0
+        if t >= 1.0:
+            return last, 0.0
+        x = t * last
+        k = int(x)
+        return k, x - k
+
+    def offsets(self, t: float) -> Tuple[Offset, ...]:
+        """Corner offsets at normalized time t, linearly interpolated between samples."""
+        k, f = self.sample(t)
+        flat = self.frames[k]
+        if f:
+            flat = [a + d * f for a, d in zip(flat, self.steps[k])]
+        return tuple(zip(flat[0::2], flat[1::2]))
+
+
+@lru_cache(maxsize=None)
+def tumble_keyframes(di: int, dj: int, scale: float, samples: int = TUMBLE_SAMPLES) -> TumbleKeyframes:
+    """Keyframe table for one (direction, scale), built once and shared."""
+    frames = tuple(
+        _screen_offsets(tumble_vertices(di, dj, scale, n / (samples - 1)))
+        for n in range(samples)
+    )
+    steps = tuple(
+        tuple(b - a for a, b in zip(frames[n], frames[n + 1]))
+        for n in range(samples - 1)
+    ) + (tuple(0.0 for _ in frames[-1]),)
+    return TumbleKeyframes(di, dj, scale, frames, steps, face_order(di, dj))
+
+
+def build_tables(scales: Iterable[float] = DEFAULT_SCALES, samples: int = TUMBLE_SAMPLES):
+    """Prebuild keyframes for every roll direction at `scales` (called at import)."""
+    for scale in scales:
+        for di, dj in DIRECTIONS:
+            tumble_keyframes(di, dj, scale, samples)
+
+
+def build_world_tables(world: "World"):
+    """Prebuild keyframes for every RenderCube scale in `world` (call once dice exist).
+
+    Covers dice made with custom scales, so no table is built mid-tumble.
+    """
+    build_tables({cube.scale for cube in world.get_component(RenderCube).values()})
+
+
+def tumble_face_polygons(geom, start_i: int, start_j: int, di: int, dj: int, scale: float,
+                         t: float) -> List[Tuple[str, List[Tuple[float, float]]]]:
+    """(position, screen polygon) per face of a cube tumbling off (start_i, start_j), in draw order."""
+    # Same arguments as build_tables: lru_cache keys on the exact call signature.
+    table = tumble_keyframes(di, dj, scale, TUMBLE_SAMPLES)
+    cx, cy = geom.iso_point(start_i + 0.5, start_j + 0.5)
+    tw = geom.tile_width
+    th = geom.tile_height
+    k, f = table.sample(t)
+    a = table.frames[k]
+    d = table.steps[k]
+    screen = [
+        (cx + (a[n] + d[n] * f) * tw, cy + (a[n + 1] + d[n + 1] * f) * th)
+        for n in range(0, 16, 2)
+    ]
+    return [(position, [screen[n] for n in face]) for face, position in table.faces]
+
+
+build_tables()
@@ -1,17 +1,54 @@
 from __future__ import annotations
-from typing import Dict, Type, TypeVar, Callable, List, Iterable, Any
-from ecs.events import Event
+from typing import Dict, Set, Type, TypeVar, Callable, List, Iterable, Any, Optional, Tuple
+from ecs.events import Event, EventBus
+from ecs.storage import BorrowedStore, ComponentStore, Query, clone_component
+from ecs.components import Position, GridGeometry, TileLayer, TileOccupancy, DieFaces
+from ecs.spatial import SpatialIndex, LAYER_COMPONENTS
+from ecs.profiling import Profiler, DEFAULT_WINDOW
+from ecs import tracing
+from ecs.tracing import TraceRecorder
+from ecs.zobrist import ZobristHash, HASHED_TYPES
 
 C = TypeVar("C")
 
 class World:
     def __init__(self):
         self._next_entity_id = 1
-        self.components: Dict[Type, Dict[int, Any]] = {}
+        self.components: Dict[Type, ComponentStore] = {}
         self.systems: List[Callable[["World", float], None]] = []
-        self.event_queue: List[Event] = []
+        self.events = EventBus()
         self._next_events: List[Event] = []
         self._processing_events = False
+        # Cached queries keyed by the exact component type tuple, plus a reverse index
+        # so a component change only touches queries that mention its type.
+        self._queries: Dict[Tuple[Type, ...], Query] = {}
+        self._queries_by_type: Dict[Type, List[Query]] = {}
+        # Tile -> occupants hash kept in sync with the Position store (see set_position).
+        self.spatial = SpatialIndex()
+        # Dice tile index (the TileOccupancy component, if any), kept in sync like `spatial`.
+        self.occupancy: Optional[TileOccupancy] = None
+        self._occupancy_eid: Optional[int] = None
+        # Change tracking for idle-frame elision: bumped by store membership changes,
+        # emitted events and mark_changed() (in-place mutations systems report).
+        self.version = 0
+        self._idle = False
+        self._settled_version = -1
+        # Opt-in per-system profiler (None = disabled, plain loop in update).
+        self.profiler: Optional[Profiler] = None
+        # Opt-in Chrome trace recorder (see ecs.tracing); may be installed globally.
+        self.tracer: Optional[TraceRecorder] = tracing.global_recorder()
+        # Opt-in incremental Zobrist hash of the gameplay state (see ecs.zobrist).
+        self.zobrist: Optional[ZobristHash] = None
+        # Copy-on-write forking (see fork): the parent this world was forked from, its
+        # stores as of the fork, the types still shared with it (and read-only views of
+        # them), and how many live forks borrow from this world.
+        self._parent: Optional[World] = None
+        self._bases: Dict[Type, ComponentStore] = {}
+        self._borrowed: Set[Type] = set()
+        self._views: Dict[Type, BorrowedStore] = {}
+        self._fork_generation = 0
+        self._parent_generation = 0
+        self._live_forks = 0
 
     # --- Entity / Component management ---
     def create_entity(self) -> int:
@@ -20,49 +57,436 @@ class World:
         return eid
 
     def add_component(self, entity: int, comp: Any):
-        store = self.components.setdefault(type(comp), {})
-        store[entity] = comp
+        self.get_component(type(comp))[entity] = comp
         return comp
 
+    def remove_component(self, entity: int, comp_type: Type):
+        return self.get_component(comp_type).pop(entity, None)
+
+    def destroy_entity(self, entity: int):
+        for comp_type, store in list(self.components.items()):
+            if entity in store:
+                del self.get_component(comp_type)[entity]
+
+    def set_position(self, entity: int, i: int, j: int):
+        """Move an entity's Position in place and keep the spatial index in sync.
+
+        Systems must use this (or assign a new Position) rather than writing pos.i/pos.j
+        directly, otherwise `world.spatial` keeps answering for the old tile.
+        """
+        pos = self.edit_component(entity, Position)
+        pos.i = i
+        pos.j = j
+        self.spatial.place(entity, i, j)
+        occ = self.occupancy
+        if occ is not None and entity in occ:
+            self.edit_occupancy().move(entity, i, j)
+        if self.zobrist is not None:
+            self.zobrist.position(entity, i, j)
+        self.version += 1
+        return pos
+
+    def edit_component(self, entity: int, comp_type: Type[C]) -> Optional[C]:
+        """The entity's `comp_type` component, safe to mutate in place (None if absent).
+
+        Systems call this rather than mutating what get_component returned. On a plain
+        world it is a store lookup; on a fork it first swaps a component still shared
+        with the parent for the fork's own copy (once per component).
+        """
+        store = self.components.get(comp_type)
+        if store is None:
+            return None
+        if not self._bases:
+            return store.get(entity)
+        if comp_type in self._borrowed:
+            store = self._own(comp_type)
+        comp = store.get(entity)
+        base = self._bases.get(comp_type)
+        if comp is None or base is None or base.get(entity) is not comp:
+            return comp
+        copy = clone_component(comp)
+        # Same membership, new object: no store notifications.
+        dict.__setitem__(store, entity, copy)
+        if comp is self.occupancy:
+            self.occupancy = copy
+        elif comp is self.spatial.terrain:
+            self.spatial.set_terrain(copy)
+        return copy
+
+    def edit_occupancy(self) -> Optional[TileOccupancy]:
+        """`occupancy`, safe to mutate (the fork's own copy on a forked world)."""
+        occ = self.occupancy
+        if occ is not None and self._bases:
+            occ = self.edit_component(self._occupancy_eid, TileOccupancy)
+        return occ
+
+    def rebuild_occupancy(self) -> Optional[TileOccupancy]:
+        """Refill the TileOccupancy from the Position / DieFaces stores in one pass."""
+        occ = self.edit_occupancy()
+        if occ is not None:
+            pos_store = self.components.get(Position, {})
+            occ.rebuild((eid, pos_store[eid].i, pos_store[eid].j)
+                        for eid in self.components.get(DieFaces, ()) if eid in pos_store)
+            self.version += 1
+        return occ
+
+    def mark_changed(self):
+        """Record an in-place component mutation (store writes and emits are tracked already)."""
+        self.version += 1
+
+    def is_idle(self) -> bool:
+        """True if the last update changed nothing, left no events queued, and nothing
+        has changed since. Running update() again would be a no-op, so callers (the game
+        loop) may skip both systems and redraw."""
+        return self._idle and self.version == self._settled_version
+
     def get_component(self, comp_type: Type[C]) -> Dict[int, C]:
-        return self.components.setdefault(comp_type, {})  # type: ignore
+        store = self.components.get(comp_type)
+        if store is None:
+            store = self.components[comp_type] = ComponentStore(comp_type, self)
+        elif self._borrowed and comp_type in self._borrowed:
+            # Forked world: read-only view of the parent's store until the first write.
+            view = self._views.get(comp_type)
+            if view is None:
+                view = self._views[comp_type] = BorrowedStore(comp_type, self, store)
+            return view  # type: ignore
+        return store  # type: ignore
+
+    def query(self, *comp_types: Type) -> Query:
+        """Return the cached Query for `comp_types`, building it on first use."""
+        q = self._queries.get(comp_types)
+        if q is not None:
+            return q
+        q = Query(comp_types)
+        if comp_types:
+            stores = [self.components.get(ct) or self.get_component(ct) for ct in comp_types]
+            # Seed from the first type's store so order matches the old entities_with scan.
+            first, rest = stores[0], stores[1:]
+            for eid in first.keys():
+                if all(eid in s for s in rest):
+                    q.entities[eid] = None
+        self._queries[comp_types] = q
+        for ct in set(comp_types):
+            self._queries_by_type.setdefault(ct, []).append(q)
+        return q
 
     def entities_with(self, *comp_types: Type) -> Iterable[int]:
         if not comp_types:
-            return []
-        first = self.get_component(comp_types[0])
-        for eid in first.keys():
-            ok = True
-            for ct in comp_types[1:]:
-                if eid not in self.get_component(ct):
-                    ok = False
+            return iter(())
+        # Snapshot so callers may add/remove components while iterating (as before).
+        return iter(list(self.query(*comp_types).entities))
+
+    # --- Store notifications (called by ComponentStore) ---
+    def _component_added(self, comp_type: Type, entity: int, comp: Any, is_new: bool):
+        self.version += 1
+        if self.zobrist is not None and comp_type in HASHED_TYPES:
+            self.zobrist.observe(comp_type, entity, comp)
+        if comp_type is Position:
+            self.spatial.place(entity, comp.i, comp.j)
+            if self.occupancy is not None and entity in self.components.get(DieFaces, ()):
+                self.edit_occupancy().move(entity, comp.i, comp.j)
+        elif comp_type is DieFaces:
+            if self.occupancy is not None:
+                pos = self.components.get(Position, {}).get(entity)
+                if pos is not None:
+                    self.edit_occupancy().move(entity, pos.i, pos.j)
+        elif comp_type is TileOccupancy:
+            # Single occupancy index per world; attaching one indexes the existing dice.
+            self.occupancy = comp
+            self._occupancy_eid = entity
+            self.rebuild_occupancy()
+        elif comp_type is GridGeometry:
+            # Map bounds come from the grid geometry; no boundary entities needed.
+            if self.spatial.terrain is None:
+                self.spatial.set_bounds(comp.grid_size)
+        elif comp_type is TileLayer:
+            self.spatial.set_terrain(comp)
+        if not is_new:
+            return
+        layer = LAYER_COMPONENTS.get(comp_type)
+        if layer:
+            self.spatial.set_layer(entity, layer, True)
+        components = self.components
+        for q in self._queries_by_type.get(comp_type, ()):
+            if entity in q.entities:
+                continue
+            for ct in q.types:
+                store = components.get(ct)
+                if store is None or entity not in store:
                     break
-            if ok:
-                yield eid
+            else:
+                q.entities[entity] = None
+
+    def _component_removed(self, comp_type: Type, entity: int, comp: Any):
+        self.version += 1
+        if self.zobrist is not None and comp_type in HASHED_TYPES:
+            self.zobrist.forget(comp_type, entity, comp)
+        if comp_type is Position:
+            self.spatial.remove(entity)
+            if self.occupancy is not None:
+                self.edit_occupancy().remove(entity)
+        elif comp_type is TileOccupancy:
+            if comp is self.occupancy:
+                self.occupancy = None
+                self._occupancy_eid = None
+        elif comp_type is GridGeometry:
+            if self.spatial.terrain is None:
+                self.spatial.set_bounds(None)
+        elif comp_type is TileLayer:
+            self.spatial.set_terrain(None)
+            geom = next(iter(self.components.get(GridGeometry, {}).values()), None)
+            self.spatial.set_bounds(geom.grid_size if geom is not None else None)
+        else:
+            if comp_type is DieFaces and self.occupancy is not None:
+                self.edit_occupancy().remove(entity)
+            layer = LAYER_COMPONENTS.get(comp_type)
+            if layer:
+                self.spatial.set_layer(entity, layer, False)
+        for q in self._queries_by_type.get(comp_type, ()):
+            q.entities.pop(entity, None)
 
     # --- Events ---
     def emit(self, event: Event):
+        self.version += 1
+        if self.tracer is not None:
+            self.tracer.event(event)
         if self._processing_events:
             self._next_events.append(event)
         else:
-            self.event_queue.append(event)
+            self.events.publish(event)
         return event
 
+    def read_events(self, event_type: str, subscriber: Callable) -> List[Event]:
+        """Unread events of `event_type` for `subscriber` (usually the calling system)."""
+        return self.events.read(event_type, subscriber)
+
+    def event_stats(self) -> Dict[str, Dict[str, int]]:
+        """Queue depth and emitted/consumed/expired counters per event type."""
+        return self.events.stats()
+
+    @property
+    def event_queue(self) -> List[Event]:
+        """Snapshot of all retained events in publish order (read-only view)."""
+        return self.events.all_pending()
+
     def flush_events(self):
         if self._next_events:
-            self.event_queue.extend(self._next_events)
+            for ev in self._next_events:
+                self.events.publish(ev)
             self._next_events.clear()
 
     # --- Systems ---
     def add_system(self, system_fn: Callable[["World", float], None]):
         self.systems.append(system_fn)
+        # Registration order defines the order subscribers see each event type.
+        for event_type in getattr(system_fn, 'subscribes', ()):
+            self.events.subscribe(event_type, system_fn)
+
+    # --- Profiling ---
+    def enable_profiling(self, window: int = DEFAULT_WINDOW) -> Profiler:
+        """Start recording per-system timings (keeps an existing profiler)."""
+        if self.profiler is None:
+            self.profiler = Profiler(window)
+        return self.profiler
+
+    def disable_profiling(self) -> Optional[Profiler]:
+        """Stop recording; returns the detached profiler with its data."""
+        prof, self.profiler = self.profiler, None
+        return prof
+
+    def enable_tracing(self, capacity: int = tracing.DEFAULT_CAPACITY) -> TraceRecorder:
+        """Start recording a Chrome trace (keeps an existing recorder)."""
+        if self.tracer is None:
+            self.tracer = TraceRecorder(capacity)
+        return self.tracer
+
+    def disable_tracing(self) -> Optional[TraceRecorder]:
+        tracer, self.tracer = self.tracer, None
+        return tracer
+
+    # --- State hashing ---
+    def enable_hashing(self, verify: bool = False) -> ZobristHash:
+        """Start maintaining `world.zobrist` (built once from the stores, then incremental).
+
+        verify=True recomputes the hash after every update() and raises ZobristMismatch
+        if an in-place mutation was not reported (debug only: it costs a full scan).
+        """
+        if self.zobrist is None:
+            self.zobrist = ZobristHash(verify)
+            self.zobrist.rebuild(self)
+        else:
+            self.zobrist.verify = verify
+        return self.zobrist
+
+    def disable_hashing(self) -> Optional[ZobristHash]:
+        zh, self.zobrist = self.zobrist, None
+        return zh
+
+    @property
+    def state_hash(self) -> Optional[int]:
+        """Current 64-bit Zobrist hash, or None while hashing is disabled."""
+        return self.zobrist.value if self.zobrist is not None else None
+
+    def call_instrumented(self, name: str, fn: Callable, *args):
+        """Call fn(*args), timed by the profiler and/or traced when either is enabled.
+
+        Used for work outside update() such as render_system and the draw helpers.
+        """
+        prof = self.profiler
+        tracer = self.tracer
+        if tracer is not None:
+            if prof is not None:
+                return tracer.call(name, prof.call, name, fn, *args)
+            return tracer.call(name, fn, *args)
+        if prof is not None:
+            return prof.call(name, fn, *args)
+        return fn(*args)
+
+    # --- Forking ---
+    def fork(self) -> "World":
+        """Copy-on-write child world for speculative play (lookahead, what-if turns).
+
+        The child shares every component store with this world. Reading one (through
+        get_component, queries or `components`) never copies; the first structural write
+        to a type (add / remove / destroy) copies that store's entity -> component map,
+        and a shared component is cloned only when the child asks to mutate it through
+        edit_component (set_position and the systems do). The spatial index, occupancy
+        index and Zobrist hash are shared the same way until either side writes. Forking
+        and stepping a fork cost O(what changes), not O(entities).
+
+        Finish with child.commit() (this world adopts the child's state) or
+        child.discard(). While forks are live this world must not be changed: update()
+        raises, and direct writes would leak into the children.
+        """
+        child = World()
+        child.tracer = None
+        child._next_entity_id = self._next_entity_id
+        child.components = dict(self.components)
+        child._bases = dict(self.components)
+        child._borrowed = set(self.components)
+        child.systems = list(self.systems)
+        child.events = self.events.fork()
+        child._next_events = list(self._next_events)
+        child.spatial = self.spatial.fork()
+        child.occupancy = self.occupancy
+        child._occupancy_eid = self._occupancy_eid
+        child.version = self.version
+        child._idle = self._idle
+        child._settled_version = self._settled_version
+        if self.zobrist is not None:
+            child.zobrist = self.zobrist.fork()
+        child._parent = self
+        child._parent_generation = self._fork_generation
+        self._live_forks += 1
+        return child
+
+    def _own(self, comp_type: Type) -> ComponentStore:
+        """Replace a store borrowed from the parent with a private map of the same components."""
+        self._borrowed.discard(comp_type)
+        store = ComponentStore(comp_type, self)
+        # dict.update bypasses notifications: membership is unchanged. Components stay
+        # shared until edit_component clones them.
+        dict.update(store, self.components[comp_type])
+        self.components[comp_type] = store
+        view = self._views.pop(comp_type, None)
+        if view is not None:
+            view._store = store
+        return store
+
+    def _detach(self) -> "World":
+        parent = self._parent
+        if parent is None:
+            raise RuntimeError("world is not a live fork (already committed or discarded?)")
+        self._parent = None
+        parent._live_forks -= 1
+        return parent
+
+    def commit(self) -> "World":
+        """Apply this fork's state to its parent and retire the fork; returns the parent.
+
+        Only the stores the fork took ownership of are moved; shared ones are already
+        the parent's. Other live forks of the same parent become stale: committing one
+        of them afterwards raises RuntimeError, so discard them.
+        """
+        parent = self._parent
+        if parent is not None and parent._fork_generation != self._parent_generation:
+            raise RuntimeError("parent world changed by another fork's commit since this fork was made")
+        parent = self._detach()
+        for comp_type, store in self.components.items():
+            if comp_type in self._borrowed:
+                continue
+            store._world = parent
+            parent.components[comp_type] = store
+            parent._borrowed.discard(comp_type)
+            view = parent._views.pop(comp_type, None)
+            if view is not None:
+                view._store = store
+        parent._fork_generation += 1
+        parent._next_entity_id = self._next_entity_id
+        parent.events = self.events
+        parent._next_events = self._next_events
+        parent.spatial = self.spatial
+        parent.occupancy = self.occupancy
+        parent._occupancy_eid = self._occupancy_eid
+        parent.zobrist = self.zobrist
+        parent.version = self.version + 1
+        parent._idle = False
+        # Refill the parent's cached queries in place (callers may hold them), taking the
+        # fork's incrementally kept membership (and order) where it built the same query.
+        components = parent.components
+        for types, q in parent._queries.items():
+            fq = self._queries.get(types)
+            if fq is not None:
+                q.entities = fq.entities
+            elif types:
+                first, rest = components.get(types[0], {}), [components.get(ct, {}) for ct in types[1:]]
+                q.entities = {eid: None for eid in first if all(eid in st for st in rest)}
+        self._retire()
+        return parent
+
+    def discard(self):
+        """Drop this fork; its parent is unaffected and may be updated again."""
+        self._detach()
+        self._retire()
+
+    def _retire(self):
+        self.components = {}
+        self._bases = {}
+        self._borrowed = set()
+        self._views = {}
 
     def update(self, dt: float):
+        if self._live_forks:
+            raise RuntimeError(f"cannot update a world with {self._live_forks} live fork(s); commit or discard them first")
+        start_version = self.version
+        prof = self.profiler
+        tracer = self.tracer
         # Let systems run (they may enqueue events or mutate components)
-        for sys_fn in self.systems:
-            sys_fn(self, dt)
+        if prof is None and tracer is None:
+            for sys_fn in self.systems:
+                sys_fn(self, dt)
+        else:
+            frame_start = prof.clock() if prof is not None else 0.0
+            trace_start = tracer.now() if tracer is not None else 0.0
+            runner = prof.run_system if prof is not None else None
+            for sys_fn in self.systems:
+                if tracer is not None:
+                    tracer.run_system(self, sys_fn, dt, runner)
+                else:
+                    runner(self, sys_fn, dt)
         # (Optional) process event phases later when we add consumers
         self._processing_events = True
         # Here we could route events to dedicated consumers; initial stage leaves them queued.
         self._processing_events = False
+        # Expire lifetime-bounded events before flushing so deferred ones count toward the next frame.
+        self.events.end_frame()
         self.flush_events()
+        zh = self.zobrist
+        if zh is not None and zh.verify:
+            zh.check(self)
+        self._idle = self.version == start_version and not len(self.events)
+        self._settled_version = self.version
+        if prof is not None:
+            prof.end_frame(prof.clock() - frame_start)
+        if tracer is not None:
+            tracer.frame(trace_start, dt, self)
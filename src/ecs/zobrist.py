@@ -0,0 +1,162 @@
+"""Incremental 64-bit Zobrist hash of the gameplay state.
+
+    zh = world.enable_hashing()          # verify=True re-checks after every update
+    key = world.zobrist.value            # cheap fingerprint for caches / lookahead
+
+The hash XORs one 64-bit key per hashed fact: each entity's Position (i, j),
+DieFaces orientation index (which fixes the top / north arrangement), HP.current,
+Patrol (di, dj) and the TurnState phase. Keys are derived from the fact itself with a
+splitmix64 finaliser, so equal states hash equally in every process and no key tables
+need to be stored.
+
+The World feeds component adds / removals and `set_position` in; systems that mutate a
+hashed field in place (orientation, attack, planning, turn phase changes) report the
+new value through the matching method. Each update costs O(1): the hash remembers the
+key currently contributed per (field, entity) and swaps it out.
+"""
+from __future__ import annotations
+import zlib
+from typing import Any, Dict, Tuple, Type, TYPE_CHECKING
+
+from ecs.components import Position, DieFaces, HP, Patrol, TurnState
+
+if TYPE_CHECKING:
+    from ecs.world import World
+
+MASK64 = (1 << 64) - 1
+
+# Field tags (part of every key)
+F_POSITION = 1
+F_ORIENTATION = 2
+F_HP = 3
+F_PATROL = 4
+F_PHASE = 5
+
+HASHED_TYPES: Tuple[Type, ...] = (Position, DieFaces, HP, Patrol, TurnState)
+
+
+class ZobristMismatch(RuntimeError):
+    """The incremental hash disagrees with a full recompute (a mutation went unreported)."""
+
+
+def _mix(x: int) -> int:
+    # splitmix64 finaliser
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def zkey(field: int, eid: int, a: int = 0, b: int = 0) -> int:
+    """64-bit key for one hashed fact (deterministic across processes)."""
+    return _mix(hash((field, eid, a, b)) & MASK64)
+
+
+def phase_code(phase: str) -> int:
+    return zlib.crc32(phase.encode())
+
+
+def component_terms(comp_type: Type, eid: int, comp: Any) -> Tuple[Tuple[int, int], ...]:
+    """((field, key), ...) contributed by one component."""
+    if comp_type is Position:
+        return ((F_POSITION, zkey(F_POSITION, eid, comp.i, comp.j)),)
+    if comp_type is DieFaces:
+        return ((F_ORIENTATION, zkey(F_ORIENTATION, eid, comp.orientation)),)
+    if comp_type is HP:
+        return ((F_HP, zkey(F_HP, eid, comp.current)),)
+    if comp_type is Patrol:
+        return ((F_PATROL, zkey(F_PATROL, eid, comp.di, comp.dj)),)
+    if comp_type is TurnState:
+        return ((F_PHASE, zkey(F_PHASE, eid, phase_code(comp.phase))),)
+    return ()
+
+
+def compute(world: "World") -> int:
+    """Full recompute from the component stores (what the incremental value must equal)."""
+    value = 0
+    for comp_type in HASHED_TYPES:
+        for eid, comp in world.components.get(comp_type, {}).items():
+            for _, key in component_terms(comp_type, eid, comp):
+                value ^= key
+    return value
+
+
+class ZobristHash:
+    """Running XOR of the keys currently contributed per (field, entity)."""
+    __slots__ = ('value', 'verify', 'checks', '_terms', '_shared')
+
+    def __init__(self, verify: bool = False):
+        self.value = 0
+        self.verify = verify
+        self.checks = 0
+        self._terms: Dict[Tuple[int, int], int] = {}
+        self._shared = False  # _terms is shared with a fork until either side writes
+
+    def fork(self) -> "ZobristHash":
+        """O(1) copy-on-write copy (used by World.fork)."""
+        child = ZobristHash(self.verify)
+        child.value = self.value
+        child._terms = self._terms
+        child._shared = self._shared = True
+        return child
+
+    def _set(self, field: int, eid: int, key: int):
+        slot = (field, eid)
+        old = self._terms.get(slot)
+        if old == key:
+            return
+        if self._shared:
+            self._terms = dict(self._terms)
+            self._shared = False
+        if old is not None:
+            self.value ^= old
+        self.value ^= key
+        self._terms[slot] = key
+
+    def _drop(self, field: int, eid: int):
+        if self._shared:
+            self._terms = dict(self._terms)
+            self._shared = False
+        old = self._terms.pop((field, eid), None)
+        if old is not None:
+            self.value ^= old
+
+    # --- Field updates (call after mutating the component in place) ---
+    def position(self, eid: int, i: int, j: int):
+        self._set(F_POSITION, eid, zkey(F_POSITION, eid, i, j))
+
+    def orientation(self, eid: int, orientation: int):
+        self._set(F_ORIENTATION, eid, zkey(F_ORIENTATION, eid, orientation))
+
+    def hp(self, eid: int, current: int):
+        self._set(F_HP, eid, zkey(F_HP, eid, current))
+
+    def patrol(self, eid: int, di: int, dj: int):
+        self._set(F_PATROL, eid, zkey(F_PATROL, eid, di, dj))
+
+    def phase(self, eid: int, phase: str):
+        self._set(F_PHASE, eid, zkey(F_PHASE, eid, phase_code(phase)))
+
+    # --- Store membership (driven by World notifications) ---
+    def observe(self, comp_type: Type, eid: int, comp: Any):
+        for field, key in component_terms(comp_type, eid, comp):
+            self._set(field, eid, key)
+
+    def forget(self, comp_type: Type, eid: int, comp: Any):
+        for field, _ in component_terms(comp_type, eid, comp):
+            self._drop(field, eid)
+
+    def rebuild(self, world: "World"):
+        self.value = 0
+        self._terms = {}
+        self._shared = False
+        for comp_type in HASHED_TYPES:
+            for eid, comp in world.components.get(comp_type, {}).items():
+                self.observe(comp_type, eid, comp)
+
+    def check(self, world: "World"):
+        """Raise ZobristMismatch if the running value differs from a full recompute."""
+        self.checks += 1
+        full = compute(world)
+        if full != self.value:
+            raise ZobristMismatch(f"incremental hash {self.value:#018x} != recomputed {full:#018x}")
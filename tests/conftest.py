@@ -1,4 +1,7 @@
+import os
+import re
 import sys
+import time
 from pathlib import Path
 import pytest
 
@@ -8,6 +11,31 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 
+# CI hook: with DICEWALK_TRACE_DIR set, every World a test creates records a Chrome trace
+# and tests slower than DICEWALK_TRACE_SLOW seconds (default 0 = all) get it dumped there.
+TRACE_DIR = os.environ.get('DICEWALK_TRACE_DIR')
+TRACE_SLOW = float(os.environ.get('DICEWALK_TRACE_SLOW', '0'))
+
+
+@pytest.fixture(autouse=True)
+def _trace_slow_tests(request):
+    if not TRACE_DIR:
+        yield
+        return
+    from ecs import tracing
+    recorder = tracing.TraceRecorder()
+    tracing.install_global(recorder)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        tracing.install_global(None)
+        if time.perf_counter() - start >= TRACE_SLOW and recorder.events:
+            Path(TRACE_DIR).mkdir(parents=True, exist_ok=True)
+            name = re.sub(r'[^A-Za-z0-9_.-]+', '_', request.node.nodeid)
+            recorder.dump(str(Path(TRACE_DIR) / f'{name}.trace.json'))
+
+
 class FakeGame:
     GRID_SIZE = 8
     def __init__(self):
@@ -0,0 +1,67 @@
+from ecs.world import World
+from ecs.components import Position, HP, TileOccupancy, DieFaces
+from ecs.die_factory import create_player_die, create_enemy_die
+from ecs.systems import orientation_system, attack_effect_system, tile_occupancy_system
+from ecs.events import Event as ECSEvent, MOVE_COMPLETE
+
+
+def _world(with_occupancy: bool):
+    w = World()
+    w.add_system(orientation_system)
+    w.add_system(attack_effect_system)
+    w.add_system(tile_occupancy_system)
+    if with_occupancy:
+        w.add_component(w.create_entity(), TileOccupancy())
+    return w
+
+
+def _complete(w: World, eid: int, di: int, dj: int):
+    pos = w.get_component(Position)[eid]
+    w.emit(ECSEvent(type=MOVE_COMPLETE, entity=eid, data={'i': pos.i, 'j': pos.j, 'di': di, 'dj': dj}))
+
+
+def test_simultaneous_attackers_damage_is_summed_once():
+    for with_occ in (False, True):
+        w = _world(with_occ)
+        victim = create_player_die(w, 4, 4)
+        # Three enemies that just stepped next to the victim; each forward-single hits (4,4)
+        attackers = [create_enemy_die(w, 4, 3, ai=False), create_enemy_die(w, 3, 4, ai=False),
+                     create_enemy_die(w, 5, 4, ai=False)]
+        for eid, (di, dj) in zip(attackers, [(0, 1), (1, 0), (-1, 0)]):
+            _complete(w, eid, di, dj)
+        w.update(0.016)
+        assert w.get_component(HP)[victim].current == 10 - 3
+
+
+def test_batched_damage_clamps_at_zero():
+    w = _world(True)
+    victim = create_player_die(w, 4, 4)
+    w.get_component(HP)[victim].current = 2
+    attackers = [create_enemy_die(w, 4, 3, ai=False), create_enemy_die(w, 3, 4, ai=False),
+                 create_enemy_die(w, 5, 4, ai=False)]
+    for eid, (di, dj) in zip(attackers, [(0, 1), (1, 0), (-1, 0)]):
+        _complete(w, eid, di, dj)
+    w.update(0.016)
+    assert w.get_component(HP)[victim].current == 0
+
+
+def test_many_movers_same_frame_occupancy_matches_spatial():
+    results = []
+    for with_occ in (False, True):
+        w = _world(with_occ)
+        enemies = [create_enemy_die(w, i, j, ai=False) for i in range(0, 16, 2) for j in range(0, 16, 2)]
+        players = [create_player_die(w, i, j + 1) for i in range(0, 16, 2) for j in range(0, 16, 2)]
+        for eid in enemies:
+            _complete(w, eid, 1, 0)
+        w.update(0.016)
+        hp = w.get_component(HP)
+        results.append([hp[e].current for e in enemies + players])
+        if with_occ:
+            occ = next(iter(w.get_component(TileOccupancy).values()))
+            pos = w.get_component(Position)
+            tracked = sorted(e for lst in occ.occupants.values() for e in lst)
+            assert tracked == sorted(w.get_component(DieFaces))
+            for (i, j), lst in occ.occupants.items():
+                assert all((pos[e].i, pos[e].j) == (i, j) for e in lst)
+    assert results[0] == results[1]
+    assert any(v < 10 for v in results[0])
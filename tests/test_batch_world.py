@@ -0,0 +1,60 @@
+import random
+
+import numpy as np
+
+from dicewalk.batch import BatchWorld, simulation_state
+from dicewalk.simulation import Simulation
+
+ACTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1), (0, 0)]
+
+
+def _random_sims(n: int, grid: int, enemies: int, barriers: int, seed: int):
+    rng = random.Random(seed)
+    sims = []
+    for _ in range(n):
+        cells = [divmod(c, grid) for c in rng.sample(range(grid * grid), 1 + enemies + barriers)]
+        sims.append(Simulation(grid_size=grid, player_start=cells[0], enemy_starts=cells[1:1 + enemies],
+                               barriers=cells[1 + enemies:], resolve='instant'))
+    return sims
+
+
+def test_batch_matches_world_systems():
+    sims = _random_sims(12, grid=6, enemies=3, barriers=4, seed=3)
+    batch = BatchWorld.from_simulations(sims)
+    rng = random.Random(7)
+    committed_any = hits = 0
+    for _ in range(30):
+        actions = [rng.choice(ACTIONS) for _ in sims]
+        live = ~batch.done
+        result = batch.step(np.array(actions))
+        for b, sim in enumerate(sims):
+            if not live[b]:
+                continue
+            before = simulation_state(sim)['player'][2]
+            committed, _ = sim.play_turn(*actions[b])
+            assert committed == bool(result.committed[b])
+            state = simulation_state(sim)
+            assert batch.board_state(b) == state
+            assert before - state['player'][2] == result.damage_taken[b]
+            committed_any += committed
+            hits += int(result.damage_dealt[b] > 0) + int(result.damage_taken[b] > 0)
+    assert committed_any > 0 and hits > 0
+
+
+def test_default_board_matches_simulation_defaults():
+    sim = Simulation(resolve='instant')
+    batch = BatchWorld(4, sim.grid_size, barriers=[(4, 4), (5, 2), (2, 5)])
+    assert batch.board_state(0) == simulation_state(sim)
+    for di, dj in [(1, 0), (0, 1), (0, 0), (-1, 0)]:
+        sim.play_turn(di, dj)
+        batch.step(np.tile([di, dj], (4, 1)))
+        for b in range(4):
+            assert batch.board_state(b) == simulation_state(sim)
+
+
+def test_dead_boards_ignore_actions():
+    batch = BatchWorld(2, 8)
+    batch.player_hp[1] = 0
+    result = batch.step(np.array([[1, 0], [1, 0]]))
+    assert result.committed.tolist() == [True, False]
+    assert batch.board_state(1)['player'] == ((2, 2), 0, 0)
@@ -0,0 +1,37 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+SUITE = Path(__file__).resolve().parent.parent / 'benchmarks' / 'suite.py'
+
+
+def _suite():
+    spec = importlib.util.spec_from_file_location('bench_suite', SUITE)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod  # dataclasses resolve annotations via sys.modules
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_suite_runs_every_case_headless():
+    suite = _suite()
+    results = suite.run_suite(scales=[(8, 2, 3), (16, 4, 8)], repeat=2)
+    assert len(results) == 2 * len(suite.CASES)
+    key = suite.result_key('enemy_planning_system', 16, 4, 8)
+    assert results[key]['repeat'] == 2 and results[key]['median_ms'] >= 0
+
+
+def test_compare_flags_regressions(tmp_path):
+    suite = _suite()
+    current = {'a': {'median_ms': 3.0}, 'b': {'median_ms': 1.0}, 'new': {'median_ms': 1.0}}
+    baseline = {'a': {'median_ms': 2.0}, 'b': {'median_ms': 1.0}}
+    cmp = suite.compare(current, baseline, threshold=1.25)
+    assert set(cmp) == {'a', 'b'}
+    assert cmp['a']['regressed'] and not cmp['b']['regressed']
+    out = tmp_path / 'out.json'
+    base = tmp_path / 'base.json'
+    assert suite.main(['--scale', '8,1,3', '--case', 'entities_with', '--repeat', '1', '--save-baseline', str(base)]) == 0
+    assert suite.main(['--scale', '8,1,3', '--case', 'entities_with', '--repeat', '1', '--baseline', str(base), '--out', str(out)]) == 0
+    doc = json.loads(out.read_text())
+    assert set(doc) == {'meta', 'results', 'comparison'}
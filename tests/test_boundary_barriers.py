@@ -1,5 +1,5 @@
 from ecs.world import World
-from ecs.components import Position, RenderCube, DieFaces, DieSide, TurnState, Barrier
+from ecs.components import Position, RenderCube, DieFaces, DieSide, Barrier
 from ecs.systems import movement_request_system, movement_progress_system, orientation_system
 from ecs.events import Event as ECSEvent, MOVE_REQUEST
 
@@ -47,3 +47,32 @@ def test_edge_movement_blocked():
     world.emit(ECSEvent(type=MOVE_REQUEST, entity=die, data={'di': 0, 'dj': -1}))
     world.update(0.05)
     assert pos_store[die].i == 0 and pos_store[die].j == 0
+
+
+def test_edge_movement_blocked_by_geometry_bounds():
+    from ecs.components import GridGeometry
+    world = World()
+    world.add_system(movement_request_system)
+    world.add_system(movement_progress_system)
+    world.add_system(orientation_system)
+    world.add_component(world.create_entity(), GridGeometry(4, 10, 20, 0, 0, tuple()))
+    die = create_die(world, 3, 3)
+    pos_store = world.get_component(Position)
+    for di, dj in ((1, 0), (0, 1)):
+        world.emit(ECSEvent(type=MOVE_REQUEST, entity=die, data={'di': di, 'dj': dj}))
+        world.update(0.05)
+        assert (pos_store[die].i, pos_store[die].j) == (3, 3)
+    assert not world.get_component(Barrier)
+    world.emit(ECSEvent(type=MOVE_REQUEST, entity=die, data={'di': -1, 'dj': 0}))
+    for _ in range(10):
+        world.update(0.05)
+    assert (pos_store[die].i, pos_store[die].j) == (2, 3)
+
+
+def test_large_map_spawns_no_boundary_entities():
+    from dicewalk.simulation import Simulation
+    sim = Simulation(grid_size=300, player_start=(299, 299), enemy_starts=((0, 0),), barriers=())
+    assert len(sim.world.get_component(Barrier)) == 1  # the enemy die
+    assert sim.world.spatial.is_blocked(300, 5) and sim.world.spatial.is_blocked(-1, 0)
+    committed, _ = sim.play_turn(1, 0)
+    assert not committed
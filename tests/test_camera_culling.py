@@ -0,0 +1,77 @@
+from dicewalk.simulation import Simulation, HEADLESS_SCREEN
+from ecs.camera import visible_tiles, pan, zoom_by
+from ecs.components import Camera, Renderable, Position
+from ecs.rendering import render_system, RENDER_STATS, visible_grid_lines
+
+
+def _default_camera(w=HEADLESS_SCREEN[0], h=HEADLESS_SCREEN[1]):
+    return Camera(w / 2, h / 2, w, h)
+
+
+def _on_screen(geom, cam, i, j):
+    # Tile diamond (plus a one-tile-tall cube) intersects the viewport rectangle
+    xs = []; ys = []
+    for (a, b) in ((i, j), (i + 1, j), (i, j + 1), (i + 1, j + 1)):
+        x, y = geom.iso_point(a, b)
+        xs.append(x); ys.append(y); ys.append(y + geom.tile_height)
+    half_w = cam.viewport_width / (2 * cam.zoom); half_h = cam.viewport_height / (2 * cam.zoom)
+    return (max(xs) >= cam.x - half_w and min(xs) <= cam.x + half_w
+            and max(ys) >= cam.y - half_h and min(ys) <= cam.y + half_h)
+
+
+def test_default_camera_sees_whole_default_grid():
+    sim = Simulation()
+    view = visible_tiles(_default_camera(), sim.geometry, (8, 8))
+    assert sorted(view.cells()) == [(i, j) for i in range(8) for j in range(8)]
+
+
+def test_view_covers_every_on_screen_tile_and_cells_match_contains():
+    sim = Simulation(grid_size=64, enemy_starts=(), barriers=())
+    geom = sim.geometry
+    cam = _default_camera()
+    zoom_by(cam, 4.0)
+    pan(cam, 300, -200)
+    view = visible_tiles(cam, geom, (64, 64))
+    cells = set(view.cells())
+    assert len(cells) == len(list(view.cells()))
+    assert len(cells) <= view.tile_count()
+    on_screen = 0
+    for i in range(64):
+        for j in range(64):
+            if _on_screen(geom, cam, i, j):
+                on_screen += 1
+                assert (i, j) in cells
+            assert ((i, j) in cells) == view.contains(i, j)
+    # Only a padding ring beyond what is actually on screen
+    assert len(cells) < 1.5 * on_screen < 64 * 64
+
+
+def test_entities_in_uses_either_strategy_consistently():
+    sim = Simulation(grid_size=32, enemy_starts=((3, 3), (20, 20), (30, 1)), barriers=((4, 4), (25, 25)))
+    world = sim.world
+    cam = _default_camera()
+    zoom_by(cam, 3.0)
+    view = visible_tiles(cam, sim.geometry, (32, 32))
+    expected = sorted(eid for eid, p in world.get_component(Position).items() if view.contains(p.i, p.j))
+    assert sorted(world.spatial.entities_in(view)) == expected
+
+
+def test_render_system_counts_culled_entities():
+    sim = Simulation(grid_size=32, enemy_starts=((1, 1), (2, 3)), barriers=((4, 4),))
+    cam = _default_camera()
+    pan(cam, 100_000, 100_000)  # far off the map: nothing visible, nothing drawn
+    view = visible_tiles(cam, sim.geometry, (32, 32))
+    RENDER_STATS.reset()
+    render_system(sim.world, None, view)
+    assert RENDER_STATS.culled == len(sim.world.query(Renderable, Position)) == 4
+    assert RENDER_STATS.draw_calls == 0
+    assert visible_grid_lines(sim.geometry, view) == ()
+
+
+def test_visible_grid_lines_clip_to_view():
+    sim = Simulation(grid_size=128, enemy_starts=(), barriers=())
+    cam = _default_camera()
+    zoom_by(cam, 8.0)
+    view = visible_tiles(cam, sim.geometry, (128, 128))
+    lines = visible_grid_lines(sim.geometry, view)
+    assert 0 < len(lines) < len(sim.geometry.grid_lines)
@@ -0,0 +1,45 @@
+from ecs.world import World
+from ecs.events import EventBus, Event as ECSEvent, MOVE_REQUEST, MOVE_COMPLETE, MOVE_STARTED
+from ecs.components import TileOccupancy, HP
+from ecs.die_factory import create_player_die, create_enemy_die
+from ecs.systems import movement_request_system, movement_progress_system, orientation_system, attack_effect_system, tile_occupancy_system
+
+
+def test_each_subscriber_reads_each_event_once_in_order():
+    bus = EventBus()
+    bus.subscribe(MOVE_COMPLETE, 'a')
+    bus.subscribe(MOVE_COMPLETE, 'b')
+    e1 = bus.publish(ECSEvent(type=MOVE_COMPLETE, entity=1))
+    bus.publish(ECSEvent(type=MOVE_REQUEST, entity=9))
+    e2 = bus.publish(ECSEvent(type=MOVE_COMPLETE, entity=2))
+    assert bus.read(MOVE_COMPLETE, 'a') == [e1, e2]
+    assert bus.read(MOVE_COMPLETE, 'a') == []
+    # Not consumed until the last subscriber has read it
+    assert bus.pending(MOVE_COMPLETE) == [e1, e2]
+    assert bus.read(MOVE_COMPLETE, 'b') == [e1, e2]
+    assert bus.pending(MOVE_COMPLETE) == []
+    # Other types are untouched by reads of MOVE_COMPLETE
+    assert [ev.entity for ev in bus.pending(MOVE_REQUEST)] == [9]
+    assert e1.seq < e2.seq
+
+
+def test_move_complete_handoff_orientation_attack_occupancy():
+    w = World()
+    for sys in [movement_request_system, movement_progress_system, orientation_system, attack_effect_system, tile_occupancy_system]:
+        w.add_system(sys)
+    assert w.events.subscribers(MOVE_COMPLETE) == [orientation_system, attack_effect_system, tile_occupancy_system]
+    occ_eid = w.create_entity(); w.add_component(occ_eid, TileOccupancy())
+    attacker = create_player_die(w, 2, 2)
+    target = create_enemy_die(w, 2, 4, ai=False)
+    w.update(0.01)  # occupancy initialised from positions
+    w.emit(ECSEvent(type=MOVE_REQUEST, entity=attacker, data={'di': 0, 'dj': 1}))
+    w.update(0.36)
+    # Attack saw the rotated die and occupancy saw the same completion
+    assert w.get_component(HP)[target].current == 4
+    occ = w.get_component(TileOccupancy)[occ_eid]
+    assert occ.occupants.get((2, 3)) == {attacker}
+    assert (2, 2) not in occ.occupants
+    # MOVE_COMPLETE consumed by all subscribers; requests consumed too
+    assert w.events.pending(MOVE_COMPLETE) == []
+    assert w.events.pending(MOVE_REQUEST) == []
+    assert all(ev.type == MOVE_STARTED for ev in w.event_queue)
@@ -0,0 +1,45 @@
+from ecs.world import World
+from ecs.events import EventBus, Event as ECSEvent, MOVE_REQUEST, MOVE_STARTED, MOVE_COMPLETE
+from ecs.die_factory import create_player_die
+from ecs.systems import movement_request_system, movement_progress_system, orientation_system, attack_effect_system
+
+
+def test_move_started_does_not_accumulate():
+    w = World()
+    for sys in [movement_request_system, movement_progress_system, orientation_system, attack_effect_system]:
+        w.add_system(sys)
+    die = create_player_die(w, 0, 0)
+    for step in range(20):
+        w.emit(ECSEvent(type=MOVE_REQUEST, entity=die, data={'di': 1 if step % 2 == 0 else -1, 'dj': 0}))
+        w.update(0.36)
+    assert len(w.events) == 0
+    stats = w.event_stats()
+    assert stats[MOVE_STARTED]['emitted'] == 20
+    assert stats[MOVE_STARTED]['expired'] == 20
+    assert stats[MOVE_STARTED]['depth'] == 0
+    assert stats[MOVE_COMPLETE]['consumed'] == 20
+    assert stats[MOVE_REQUEST]['consumed'] == 20
+
+
+def test_lifetime_expires_after_n_frames_and_skips_cursors():
+    bus = EventBus()
+    bus.set_lifetime('Ping', 2)
+    bus.subscribe('Ping', 'slow')
+    bus.publish(ECSEvent(type='Ping'))
+    bus.end_frame()
+    assert len(bus.pending('Ping')) == 1
+    bus.end_frame()
+    assert bus.pending('Ping') == []
+    # Subscriber that never read simply skips the expired event
+    assert bus.read('Ping', 'slow') == []
+    later = bus.publish(ECSEvent(type='Ping'))
+    assert bus.read('Ping', 'slow') == [later]
+    assert bus.stats()['Ping'] == {'depth': 0, 'emitted': 2, 'consumed': 1, 'expired': 1, 'peak_depth': 1}
+
+
+def test_types_without_lifetime_are_retained():
+    bus = EventBus()
+    bus.publish(ECSEvent(type='Custom'))
+    for _ in range(5):
+        bus.end_frame()
+    assert len(bus.pending('Custom')) == 1
@@ -0,0 +1,74 @@
+from dicewalk.simulation import Simulation
+from ecs.components import Position, HP, Patrol
+from ecs.world import World
+from ecs.events import Event as ECSEvent
+
+SCRIPT = [(1, 0), (0, 1), (0, 0), (-1, 0), (0, -1), (1, 0)]
+
+
+def _settle(sim: Simulation, max_frames: int = 100) -> int:
+    frames = 0
+    while not sim.world.is_idle() and frames < max_frames:
+        sim.step()
+        frames += 1
+    return frames
+
+
+def test_version_bumps_on_store_change_emit_and_mark():
+    w = World()
+    v = w.version
+    e = w.create_entity()
+    w.add_component(e, Position(0, 0))
+    assert w.version > v
+    v = w.version
+    w.set_position(e, 1, 1)
+    assert w.version > v
+    v = w.version
+    w.emit(ECSEvent(type='Ping'))
+    assert w.version > v
+    v = w.version
+    w.mark_changed()
+    assert w.version == v + 1
+
+
+def test_world_goes_idle_in_planning_and_wakes_on_intent():
+    sim = Simulation(resolve='animated')
+    frames = _settle(sim)
+    assert sim.world.is_idle()
+    assert frames < 100
+    assert sim.turn.phase == 'planning' and sim.turn.planned
+    # Quiescent update changes nothing
+    v = sim.world.version
+    sim.step()
+    assert sim.world.version == v and sim.world.is_idle()
+    sim.submit_intent(1, 0)
+    assert not sim.world.is_idle()
+    sim.step()
+    assert sim.turn.phase == 'executing'
+    # Animation frames are never idle
+    sim.step()
+    assert not sim.world.is_idle()
+
+
+def test_skipping_idle_updates_matches_stepping_every_frame():
+    always = Simulation(resolve='animated')
+    elided = Simulation(resolve='animated')
+    skipped = 0
+    for di, dj in SCRIPT:
+        for sim in (always, elided):
+            sim.submit_intent(di, dj)
+        for _ in range(120):
+            always.step()
+            if elided.world.is_idle():
+                skipped += 1
+            else:
+                elided.step()
+    assert skipped > 0
+    pos_a = always.world.get_component(Position); pos_e = elided.world.get_component(Position)
+    hp_a = always.world.get_component(HP); hp_e = elided.world.get_component(HP)
+    for e in [always.player_entity] + always.enemy_entities:
+        assert (pos_a[e].i, pos_a[e].j) == (pos_e[e].i, pos_e[e].j)
+        assert hp_a[e].current == hp_e[e].current
+    pat_a = always.world.get_component(Patrol); pat_e = elided.world.get_component(Patrol)
+    for e in always.enemy_entities:
+        assert (pat_a[e].di, pat_a[e].dj) == (pat_e[e].di, pat_e[e].dj)
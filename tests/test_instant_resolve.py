@@ -0,0 +1,58 @@
+from dicewalk.simulation import Simulation
+from ecs.components import Position, DieFaces, HP, Patrol, TumbleAnim, GridMove
+
+SCRIPT = [(1, 0), (0, 1), (0, 0), (-1, 0), (0, -1), (1, 0), (1, 0), (0, 1), (0, 0), (0, 1)] * 3
+
+
+def _state(sim: Simulation):
+    w = sim.world
+    pos = w.get_component(Position); faces = w.get_component(DieFaces)
+    hp = w.get_component(HP); patrol = w.get_component(Patrol)
+    dice = [sim.player_entity] + sim.enemy_entities
+    return (
+        [(pos[e].i, pos[e].j) for e in dice],
+        [tuple(side.face_id for side in faces[e].sides.values()) for e in dice],
+        [hp[e].current for e in dice],
+        [(patrol[e].di, patrol[e].dj) for e in sim.enemy_entities],
+        [dict(p) for p in sim.turn.planned],
+    )
+
+
+def test_instant_resolve_matches_animated_path():
+    starts = dict(player_start=(2, 2), enemy_starts=((1, 1), (3, 4), (6, 6)))
+    animated = Simulation(resolve='animated', **starts)
+    instant = Simulation(resolve='instant', **starts)
+    for di, dj in SCRIPT:
+        a_committed, _ = animated.play_turn(di, dj)
+        i_committed, _ = instant.play_turn(di, dj)
+        assert a_committed == i_committed
+        assert _state(animated) == _state(instant)
+
+
+def test_instant_turn_executes_in_one_update():
+    sim = Simulation(resolve='instant')
+    sim.submit_intent(1, 0)
+    turn = sim.turn
+    while turn.phase == 'planning':
+        sim.step()
+    # The commit frame queued the requests; one more update resolves everything
+    sim.step()
+    assert turn.phase == 'planning'
+    assert not sim.world.get_component(GridMove)
+    assert not sim.world.get_component(TumbleAnim)
+    p = sim.world.get_component(Position)[sim.player_entity]
+    assert (p.i, p.j) == (3, 2)
+
+
+def test_ai_instant_only_skips_pass_turns():
+    sim = Simulation(resolve='ai_instant')
+    sim.submit_intent(0, 0)
+    while sim.turn.phase == 'planning':
+        sim.step()
+    sim.step()
+    assert sim.turn.phase == 'planning'  # enemies resolved instantly
+    sim.submit_intent(0, 1)
+    while sim.turn.phase == 'planning':
+        sim.step()
+    sim.step()
+    assert sim.world.get_component(TumbleAnim)  # player move still animates
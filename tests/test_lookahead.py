@@ -0,0 +1,81 @@
+from dicewalk.simulation import Simulation
+from ecs.components import DieFaces, LookaheadPlanner, Patrol, Position
+from ecs.lookahead import _Search, orientation_effects
+from ecs.orientation import DIRECTIONS
+from ecs.systems import enemy_planning_system
+
+
+def _plans(sim: Simulation):
+    sim.step()
+    return {p['entity']: (p['di'], p['dj']) for p in sim.turn.planned}
+
+
+def test_enemy_moves_to_threaten_player_instead_of_patrolling():
+    planner = LookaheadPlanner(max_depth=1)
+    sim = Simulation(player_start=(4, 4), enemy_starts=((4, 2),), barriers=(), resolve='instant', planner=planner)
+    enemy = sim.enemy_entities[0]
+    # Patrol (1, 0) would step to (5, 2), out of reach; stepping north puts (4, 4) ahead.
+    assert _plans(sim)[enemy] == (0, 1)
+    assert planner.last_depth == 1 and planner.misses > 0
+
+
+def test_far_enemies_keep_patrol_plans():
+    starts = ((0, 0), (7, 7), (0, 7))
+    plain = Simulation(player_start=(4, 3), enemy_starts=starts, barriers=(), resolve='instant')
+    searched = Simulation(player_start=(4, 3), enemy_starts=starts, barriers=(), resolve='instant',
+                          planner=LookaheadPlanner(max_depth=1))
+    assert _plans(plain) == _plans(searched)
+    patrol_a = plain.world.get_component(Patrol); patrol_b = searched.world.get_component(Patrol)
+    for e in plain.enemy_entities:
+        assert (patrol_a[e].di, patrol_a[e].dj) == (patrol_b[e].di, patrol_b[e].dj)
+
+
+def test_transposition_table_hits_and_stays_bounded():
+    planner = LookaheadPlanner(max_depth=2)
+    sim = Simulation(player_start=(4, 4), enemy_starts=((4, 2), (2, 4), (6, 5)), barriers=(), resolve='instant',
+                     planner=planner)
+    first = _plans(sim)
+    misses = planner.misses
+    sim.turn.planned.clear()
+    enemy_planning_system(sim.world, 0.0)
+    assert planner.hits > 0 and planner.misses == misses  # same state: all root lookups hit
+    assert {p['entity']: (p['di'], p['dj']) for p in sim.turn.planned} == first
+    planner.table.clear()
+    planner.table_size = 40
+    sim.turn.planned.clear()
+    enemy_planning_system(sim.world, 0.0)
+    assert 0 < len(planner.table) <= 40
+
+
+def test_many_enemies_respect_budget_and_keep_playing():
+    starts = [(i, j) for i in range(2, 14) for j in range(2, 14) if (i + j) % 2 == 0 and (i, j) != (8, 8)][:50]
+    planner = LookaheadPlanner(max_depth=4, budget_ms=5.0)
+    sim = Simulation(grid_size=16, player_start=(8, 9), enemy_starts=starts, barriers=(), resolve='instant',
+                     planner=planner)
+    _plans(sim)
+    assert len(sim.enemy_entities) == 50
+    assert planner.last_depth >= 1
+    # Depth 1 always completes and is not cut by the budget, so this guards the 16 ms frame for 50 enemies.
+    assert planner.last_ms < 16
+    assert sim.turn.planned
+
+
+def _root_value(sim: Simulation, planner: LookaheadPlanner, depth: int):
+    world = sim.world
+    enemy, player = sim.enemy_entities[0], sim.player_entity
+    faces = world.get_component(DieFaces)
+    search = _Search(planner, world.spatial.is_blocked, orientation_effects(world, enemy),
+                     orientation_effects(world, player))
+    pos = world.get_component(Position)
+    return search.best((pos[enemy].i, pos[enemy].j), faces[enemy].orientation,
+                       (pos[player].i, pos[player].j), faces[player].orientation, depth, DIRECTIONS)
+
+
+def test_cached_values_follow_blocker_changes():
+    for depth in (1, 2):
+        sim = Simulation(grid_size=12, player_start=(7, 5), enemy_starts=((5, 5),), barriers=((8, 5),),
+                         resolve='instant')
+        warm = LookaheadPlanner(max_depth=depth)
+        _root_value(sim, warm, depth)  # fills the table with (8, 5) blocked
+        sim.world.destroy_entity(sim.world.spatial.occupants_at(8, 5)[0])
+        assert _root_value(sim, warm, depth) == _root_value(sim, LookaheadPlanner(max_depth=depth), depth)
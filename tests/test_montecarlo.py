@@ -0,0 +1,32 @@
+from dicewalk.montecarlo import MonteCarloRunner, ResultColumns, Scenario, play, run_seed
+
+SCENARIO = Scenario(enemies=((1, 1, 1, 0), (6, 6, 0, -1)), policy='random', max_turns=25)
+
+
+def test_runs_are_deterministic_per_seed():
+    a = play(SCENARIO, 3, seed=11)
+    b = play(SCENARIO, 3, seed=11)
+    assert a == b
+    assert run_seed(11, 3) != run_seed(11, 4) != run_seed(12, 3)
+    assert a.turns <= SCENARIO.max_turns
+    assert a.damage_taken == 10 - a.player_hp
+
+
+def test_pool_results_match_serial_and_stream_in_chunks(tmp_path):
+    with MonteCarloRunner(workers=1, chunk=4) as serial:
+        expected = serial.collect(SCENARIO, runs=10, seed=5).arrays()
+    chunks = []
+    with MonteCarloRunner(workers=2, chunk=4) as runner:
+        columns = runner.collect(SCENARIO, runs=10, seed=5, on_chunk=chunks.append)
+        pool = runner._pool
+        runner.collect(SCENARIO, runs=4, seed=6)
+        assert runner._pool is pool  # workers reused across sweeps
+    assert sorted(len(c) for c in chunks) == [2, 4, 4]
+    path = tmp_path / 'sweep.npz'
+    columns.save(str(path))
+    loaded = ResultColumns.load(str(path))
+    assert set(loaded) == set(expected)
+    for name, col in expected.items():
+        assert loaded[name].tolist() == col.tolist()
+    assert loaded['run'].tolist() == list(range(10))
+    assert loaded['survived'].dtype == bool
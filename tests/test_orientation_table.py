@@ -0,0 +1,71 @@
+import random
+from ecs.orientation import ORIENTATION_COUNT, TRANSITIONS, FACE_AT, TOP_FACE, POSITIONS, DIRECTIONS, IDENTITY, roll
+from ecs.world import World
+from ecs.components import DieFaces
+from ecs.die_factory import create_player_die
+from ecs.systems import movement_request_system, movement_progress_system, orientation_system
+from ecs.events import Event as ECSEvent, MOVE_REQUEST
+
+
+def _legacy_roll(faces, di, dj):
+    # Dict permutation previously done in orientation_system
+    if di == 1:
+        faces['top'], faces['east'], faces['bottom'], faces['west'] = faces['west'], faces['top'], faces['east'], faces['bottom']
+    elif di == -1:
+        faces['top'], faces['west'], faces['bottom'], faces['east'] = faces['east'], faces['top'], faces['west'], faces['bottom']
+    elif dj == 1:
+        faces['top'], faces['north'], faces['bottom'], faces['south'] = faces['south'], faces['top'], faces['north'], faces['bottom']
+    elif dj == -1:
+        faces['top'], faces['south'], faces['bottom'], faces['north'] = faces['north'], faces['top'], faces['south'], faces['bottom']
+
+
+def test_table_covers_24_rotations_and_inverses():
+    assert ORIENTATION_COUNT == 24
+    assert len({tuple(sorted(f.items())) for f in FACE_AT}) == 24
+    for o in range(ORIENTATION_COUNT):
+        assert sorted(FACE_AT[o].values()) == sorted(POSITIONS)
+        for (di, dj) in DIRECTIONS:
+            assert roll(roll(o, di, dj), -di, -dj) == o
+    assert all(FACE_AT[IDENTITY][p] == p for p in POSITIONS)
+
+
+def test_transitions_cycle_in_four_and_cancel_in_reverse():
+    assert len(TRANSITIONS) == ORIENTATION_COUNT
+    for o, row in enumerate(TRANSITIONS):
+        assert len(row) == len(DIRECTIONS)
+        for d, (di, dj) in enumerate(DIRECTIONS):
+            assert row[d] == roll(o, di, dj)
+            back = DIRECTIONS.index((-di, -dj))
+            assert TRANSITIONS[row[d]][back] == o
+            cur = o
+            for _ in range(4):
+                cur = TRANSITIONS[cur][d]
+            assert cur == o
+
+
+def test_table_matches_legacy_dict_permutation():
+    rng = random.Random(7)
+    legacy = {p: p for p in POSITIONS}
+    o = IDENTITY
+    for _ in range(500):
+        di, dj = rng.choice(DIRECTIONS)
+        _legacy_roll(legacy, di, dj)
+        o = roll(o, di, dj)
+        assert FACE_AT[o] == legacy
+        assert TOP_FACE[o] == legacy['top']
+
+
+def test_orientation_system_rolls_die_east_then_north():
+    w = World()
+    for sys in [movement_request_system, movement_progress_system, orientation_system]:
+        w.add_system(sys)
+    die = create_player_die(w, 2, 2)
+    faces = w.get_component(DieFaces)[die]
+    start_west = faces.sides['west']; start_south = faces.sides['south']
+    w.emit(ECSEvent(type=MOVE_REQUEST, entity=die, data={'di': 1, 'dj': 0}))
+    w.update(0.36)
+    assert faces.sides['top'] is start_west
+    w.emit(ECSEvent(type=MOVE_REQUEST, entity=die, data={'di': 0, 'dj': 1}))
+    w.update(0.36)
+    assert faces.top() is start_south
+    assert faces.base['top'].face_id == 'top'  # base layout never mutated
@@ -0,0 +1,51 @@
+import json
+from dicewalk.simulation import Simulation
+from ecs.profiling import Profiler, ProfileEntry
+from ecs.systems import movement_request_system, orientation_system
+
+
+def test_profiler_disabled_by_default():
+    sim = Simulation(resolve='instant')
+    assert sim.world.profiler is None
+    sim.play_turn(1, 0)
+    assert sim.world.profiler is None
+
+
+def test_profiler_records_systems_and_events():
+    sim = Simulation(resolve='instant', enemy_starts=((1, 1), (6, 6)))
+    prof = sim.world.enable_profiling(window=64)
+    for intent in [(1, 0), (0, 1), (0, 0), (-1, 0)]:
+        sim.play_turn(*intent)
+    snap = prof.snapshot()
+    entries = snap['entries']
+    for fn in sim.world.systems:
+        assert entries[fn.__name__]['calls'] == snap['frames']
+    # 4 turns: player moved 3 times, both enemies every turn
+    moves = entries[movement_request_system.__name__]
+    assert moves['events_seen'] == 3 + 4 * 2
+    assert moves['events_consumed'] == moves['events_seen']
+    assert entries[orientation_system.__name__]['events_seen'] == 11
+    assert entries['World.update']['calls'] == snap['frames']
+    assert 0 <= entries['World.update']['p50_ms'] <= entries['World.update']['p99_ms'] <= entries['World.update']['max_ms']
+    assert json.loads(prof.to_json()) == json.loads(json.dumps(snap))
+    assert sim.world.disable_profiling() is prof
+    assert sim.world.profiler is None
+
+
+def test_percentiles_use_ring_buffer_window():
+    entry = ProfileEntry(window=100)
+    for n in range(1, 201):
+        entry.add(float(n))
+    # Only the last 100 samples (101..200) are kept
+    assert entry.percentile(50) == 150.0
+    assert entry.percentile(95) == 195.0
+    assert entry.percentile(99) == 199.0
+    assert entry.calls == 200 and entry.max == 200.0
+
+
+def test_call_times_arbitrary_helpers():
+    ticks = iter([0.0, 0.25])
+    prof = Profiler(clock=lambda: next(ticks))
+    assert prof.call('render_system', lambda a, b: a + b, 1, 2) == 3
+    snap = prof.snapshot()['entries']['render_system']
+    assert snap['calls'] == 1 and snap['total_ms'] == 250.0
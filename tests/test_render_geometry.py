@@ -0,0 +1,61 @@
+from ecs.components import GridGeometry
+from ecs.rendering import cube_screen_corners, cube_face_polygons, RenderStats
+
+
+def _geom():
+    return GridGeometry(8, 10, 20, 0, 0, tuple())
+
+
+def test_resting_faces_in_painter_order():
+    order = [position for position, _ in cube_face_polygons(_geom(), 2, 3, 0.8)]
+    assert order == ['bottom', 'east', 'north', 'south', 'west', 'top']
+
+
+def test_cube_corners_match_iso_projection():
+    geom = _geom()
+    corners = cube_screen_corners(geom, 2, 3, 1.0)
+    # Corner 0 is the bottom (-i,-j) corner; corner 4 is directly above it
+    assert corners[0] == geom.iso_point(2, 3)
+    x, y = geom.iso_point(2, 3)
+    assert corners[4] == (x, y + geom.tile_height)
+
+
+def test_render_stats_totals():
+    stats = RenderStats(immediate=5, batched=3, rebuilt=1)
+    assert stats.draw_calls == 8
+    stats.reset()
+    assert stats.draw_calls == 0 and stats.rebuilt == 0
+
+
+def test_hp_bar_geometry_fill_and_label():
+    from ecs.components import HP
+    from ecs.rendering import hp_bar_geometry
+    full = hp_bar_geometry(_geom(), 1, 1, 0.8, HP(current=4, max=4))
+    half = hp_bar_geometry(_geom(), 1, 1, 0.8, HP(current=2, max=4))
+    empty = hp_bar_geometry(_geom(), 1, 1, 0.8, HP(current=0, max=4))
+    assert full.label == "4/4" and half.label == "2/4"
+    bar_w = full.bg_poly[1][0] - full.bg_poly[0][0]
+    assert half.fill_poly[1][0] - half.fill_poly[0][0] == bar_w / 2
+    assert empty.fill_poly is None
+    assert full.bg_poly == empty.bg_poly
+
+
+def test_cube_projection_cached_until_invalidated():
+    geom = _geom()
+    corners = geom.cube_corners(2, 3, 0.8)
+    assert geom.cube_corners(2, 3, 0.8) is corners
+    assert geom.cube_faces(2, 3, 0.8)[0][1] == tuple(corners[n] for n in (0, 1, 3, 2))
+    geom.origin_x = 100
+    geom.invalidate()
+    moved = geom.cube_corners(2, 3, 0.8)
+    assert moved[0][0] == corners[0][0] + 100
+
+
+def test_simulation_resize_refits_geometry():
+    from dicewalk.simulation import Simulation
+    sim = Simulation()
+    before = sim.geometry.cube_corners(1, 1, 0.8)
+    sim.resize(800, 600)
+    after = sim.geometry.cube_corners(1, 1, 0.8)
+    assert after != before
+    assert sim.geometry.tile_height == 0.7 * 600 / (sim.grid_size - 1)
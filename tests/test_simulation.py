@@ -0,0 +1,49 @@
+import subprocess
+import sys
+from pathlib import Path
+from dicewalk.simulation import Simulation
+from ecs.components import Position, Tile, Barrier
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+
+
+def test_simulation_imports_without_arcade():
+    code = (
+        "import sys; sys.path.insert(0, %r); import dicewalk.simulation; "
+        "assert 'arcade' not in sys.modules, 'arcade imported'" % str(SRC_DIR)
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_simulation_builds_game_world():
+    sim = Simulation()
+    # Terrain is one dense layer, not 64 tile entities
+    assert not sim.world.get_component(Tile)
+    assert len(sim.tiles) == 8 * 8 and sim.tiles.walkable(7, 7)
+    pos = sim.world.get_component(Position)
+    assert (pos[sim.player_entity].i, pos[sim.player_entity].j) == (2, 2)
+    assert (pos[sim.enemy_entity].i, pos[sim.enemy_entity].j) == (1, 1)
+    # 3 sample barriers + enemy die (grid edges are bounds, not entities)
+    assert len(sim.world.get_component(Barrier)) == 3 + 1
+
+
+def test_play_turn_commits_and_blocks():
+    sim = Simulation()
+    committed, _ = sim.play_turn(1, 0)
+    assert committed
+    pos = sim.world.get_component(Position)[sim.player_entity]
+    assert (pos.i, pos.j) == (3, 2)
+    assert sim.turn.phase == 'planning'
+    # (4,2)->(5,2) is a sample barrier: walk east once more then bump into it
+    sim.play_turn(1, 0)
+    committed, _ = sim.play_turn(1, 0)
+    assert not committed
+    assert (pos.i, pos.j) == (4, 2)
+
+
+def test_run_reports_turns_per_second():
+    sim = Simulation()
+    report = sim.run([(0, 1), (0, -1)] * 5)
+    assert report.turns == 10
+    assert report.committed >= 1
+    assert report.turns_per_second > 0
@@ -0,0 +1,59 @@
+from ecs.world import World
+from ecs.components import Position, Barrier
+from ecs.die_factory import create_player_die, create_enemy_die
+from ecs.spatial import LAYER_BARRIER, LAYER_DIE, LAYER_TILE
+from ecs.systems import movement_request_system, movement_progress_system, orientation_system
+from ecs.events import Event as ECSEvent, MOVE_REQUEST
+
+
+def test_index_tracks_component_adds_and_removes():
+    world = World()
+    b = world.create_entity()
+    world.add_component(b, Barrier())  # layer first, position later
+    world.add_component(b, Position(4, 4))
+    assert world.spatial.is_blocked(4, 4)
+    assert world.spatial.occupants_at(4, 4, LAYER_BARRIER) == [b]
+    world.remove_component(b, Barrier)
+    assert not world.spatial.is_blocked(4, 4)
+    assert world.spatial.occupants_at(4, 4) == [b]
+    world.destroy_entity(b)
+    assert world.spatial.occupants_at(4, 4) == []
+
+
+def test_layer_masks_for_dice():
+    world = World()
+    player = create_player_die(world, 1, 1)
+    enemy = create_enemy_die(world, 2, 1, ai=False)
+    assert world.spatial.mask_at(1, 1) == LAYER_DIE
+    assert world.spatial.mask_at(2, 1) == LAYER_DIE | LAYER_BARRIER
+    assert world.spatial.occupants_at(2, 1, LAYER_TILE) == []
+    assert not world.spatial.is_blocked(1, 1)
+    assert world.spatial.is_blocked(2, 1)
+
+
+def test_index_follows_completed_moves():
+    world = World()
+    for sys in [movement_request_system, movement_progress_system, orientation_system]:
+        world.add_system(sys)
+    die = create_player_die(world, 2, 2)
+    world.emit(ECSEvent(type=MOVE_REQUEST, entity=die, data={'di': 1, 'dj': 0}))
+    world.update(0.36)
+    assert world.get_component(Position)[die].i == 3
+    assert world.spatial.occupants_at(3, 2) == [die]
+    assert world.spatial.occupants_at(2, 2) == []
+    # Replacing the Position component also re-indexes
+    world.add_component(die, Position(0, 0))
+    assert world.spatial.cell_of(die) == (0, 0)
+
+
+def test_bounds_follow_grid_geometry():
+    from ecs.components import GridGeometry
+    w = World()
+    assert w.spatial.in_bounds(-5, 100) and not w.spatial.is_blocked(-1, 0)
+    gid = w.create_entity()
+    w.add_component(gid, GridGeometry(5, 10, 20, 0, 0, tuple()))
+    assert w.spatial.in_bounds(4, 4) and not w.spatial.in_bounds(5, 0)
+    assert w.spatial.is_blocked(-1, 2) and w.spatial.is_blocked(2, 5)
+    assert not w.spatial.is_blocked(0, 0)
+    w.remove_component(gid, GridGeometry)
+    assert not w.spatial.is_blocked(-1, 2)
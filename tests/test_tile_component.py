@@ -1,12 +1,14 @@
 from dicewalk.main import DiceWalkGame
-from ecs.components import Tile, Position
+from ecs.components import Tile, TileLayer, Position
 
 def test_tile_component_count():
     game = DiceWalkGame()
-    tile_store = game.world.get_component(Tile)
-    pos_store = game.world.get_component(Position)
-    # Every tile entity should have Position and Tile but not DieFaces
-    assert len(tile_store) == 8*8  # GRID_SIZE^2
-    # Verify sample positions exist
-    any_tile_positions = {(pos_store[eid].i, pos_store[eid].j) for eid in tile_store.keys() if eid in pos_store}
-    assert (0,0) in any_tile_positions and (7,7) in any_tile_positions
+    # Tiles live in one dense TileLayer on the grid entity, not as Position + Tile entities
+    assert not game.world.get_component(Tile)
+    layers = game.world.get_component(TileLayer)
+    assert list(layers) == [game.grid_entity]
+    layer = layers[game.grid_entity]
+    assert len(layer) == 8*8  # GRID_SIZE^2
+    assert (0,0) in layer and (7,7) in layer
+    # Only dice and barriers carry Position now
+    assert len(game.world.get_component(Position)) == 1 + 1 + 3
@@ -0,0 +1,47 @@
+import pytest
+from dicewalk.simulation import Simulation
+from ecs.components import TileLayer, Tile, Position
+
+
+def test_layer_is_dense_and_indexed_by_tile():
+    layer = TileLayer(512, 512)
+    assert len(layer) == 512 * 512
+    assert layer.nbytes == 2 * 512 * 512  # two bytes per tile
+    layer.set_kind(3, 7, 5)
+    assert layer.kind(3, 7) == 5 and layer.kinds[7 * 512 + 3] == 5
+    assert layer.walkable(0, 0) and not layer.walkable(512, 0)
+    layer.set_walkable(1, 1, False)
+    assert not layer.walkable(1, 1)
+    with pytest.raises(IndexError):
+        layer.kind(-1, 0)
+    with pytest.raises(ValueError):
+        TileLayer(2, 2, kinds=bytearray(3))
+
+
+def test_unwalkable_terrain_blocks_movement_and_sets_bounds():
+    sim = Simulation(player_start=(2, 2), enemy_starts=((6, 6),), barriers=())
+    sim.tiles.set_walkable(3, 2, False)
+    committed, _ = sim.play_turn(1, 0)
+    assert not committed
+    pos = sim.world.get_component(Position)[sim.player_entity]
+    assert (pos.i, pos.j) == (2, 2)
+    assert sim.world.spatial.is_blocked(8, 0)
+    sim.tiles.set_walkable(3, 2, True)
+    committed, _ = sim.play_turn(1, 0)
+    assert committed and (pos.i, pos.j) == (3, 2)
+
+
+def test_large_map_adds_no_tile_entities():
+    sim = Simulation(grid_size=512, enemy_starts=((0, 0),), barriers=())
+    assert not sim.world.get_component(Tile)
+    assert len(sim.world.get_component(Position)) == 2
+    assert len(sim.world.spatial) == 2
+
+
+def test_removing_layer_falls_back_to_geometry_bounds():
+    sim = Simulation(grid_size=6, enemy_starts=(), barriers=())
+    sim.tiles.set_walkable(0, 0, False)
+    w = sim.world
+    assert w.spatial.is_blocked(0, 0)
+    w.remove_component(sim.grid_entity, TileLayer)
+    assert not w.spatial.is_blocked(0, 0) and w.spatial.is_blocked(6, 0)
@@ -0,0 +1,66 @@
+from ecs.world import World
+from ecs.components import Position, TileOccupancy, DieFaces, Barrier
+from ecs.die_factory import create_player_die, create_enemy_die
+
+
+def _world():
+    w = World()
+    occ = TileOccupancy()
+    w.add_component(w.create_entity(), occ)
+    return w, occ
+
+
+def test_move_updates_both_maps():
+    occ = TileOccupancy()
+    assert occ.add(1, 0, 0)
+    occ.add(2, 0, 0)
+    assert occ.at(0, 0) == {1, 2}
+    assert occ.move(1, 3, 4)
+    assert not occ.move(1, 3, 4)
+    assert occ.tile_of(1) == (3, 4)
+    assert occ.at(0, 0) == {2} and occ.at(3, 4) == {1}
+    assert occ.remove(2) and not occ.remove(2)
+    assert (0, 0) not in occ.occupants
+    assert len(occ) == 1 and 1 in occ and 2 not in occ
+    assert occ.at(9, 9) == set()
+
+
+def test_rebuild_replaces_contents():
+    occ = TileOccupancy()
+    occ.add(7, 1, 1)
+    occ.rebuild([(1, 0, 0), (2, 0, 0), (3, 5, 5), (2, 6, 6)])
+    assert occ.occupants == {(0, 0): {1}, (5, 5): {3}, (6, 6): {2}}
+    assert occ.where == {1: (0, 0), 2: (6, 6), 3: (5, 5)}
+
+
+def test_world_tracks_dice_spawn_move_despawn():
+    w, occ = _world()
+    die = create_player_die(w, 2, 2)
+    barrier = w.create_entity()
+    w.add_component(barrier, Position(3, 3))
+    w.add_component(barrier, Barrier())
+    assert occ.where == {die: (2, 2)}
+    w.set_position(die, 2, 3)
+    assert occ.at(2, 3) == {die} and not occ.at(2, 2)
+    w.add_component(die, Position(5, 5))  # replacing the Position re-homes too
+    assert occ.tile_of(die) == (5, 5)
+    w.destroy_entity(die)
+    assert not occ.occupants and not occ.where
+
+
+def test_attaching_occupancy_indexes_existing_dice():
+    w = World()
+    dice = [create_enemy_die(w, i, 0, ai=False) for i in range(4)]
+    occ = w.add_component(w.create_entity(), TileOccupancy())
+    assert w.occupancy is occ
+    assert occ.where == {eid: (n, 0) for n, eid in enumerate(dice)}
+    w.remove_component(dice[0], DieFaces)
+    assert dice[0] not in occ
+    # Bulk rebuild after writing positions directly (e.g. a level load)
+    pos = w.get_component(Position)
+    for eid in dice:
+        pos[eid].j = 7
+    w.rebuild_occupancy()
+    assert set(occ.occupants) == {(1, 7), (2, 7), (3, 7)}
+    w.remove_component(next(iter(w.get_component(TileOccupancy))), TileOccupancy)
+    assert w.occupancy is None
@@ -0,0 +1,73 @@
+import gc
+import json
+from dicewalk.simulation import Simulation
+from ecs import tracing
+from ecs.tracing import TraceRecorder
+from ecs.world import World
+
+
+def test_trace_covers_frames_systems_events_and_phases(tmp_path):
+    sim = Simulation(resolve='animated')
+    tracer = sim.world.enable_tracing()
+    sim.play_turn(1, 0)
+    path = tmp_path / 'run.trace.json'
+    tracer.dump(str(path))
+    data = json.loads(path.read_text())
+    events = data['traceEvents']
+    frames = [e for e in events if e['name'] == 'World.update']
+    assert frames and all(e['ph'] == 'X' and e['dur'] >= 0 for e in frames)
+    assert data['otherData']['frames'] == len(frames)
+    names = {e['name'] for e in events if e.get('cat') == 'system'}
+    assert {fn.__name__ for fn in sim.world.systems} <= names
+    fired = [e['name'] for e in events if e.get('cat') == 'event']
+    assert 'PlayerMoveIntent' in fired and 'MoveRequest' in fired and 'MoveComplete' in fired
+    phases = [e['args']['to'] for e in events if e.get('cat') == 'turn']
+    assert phases == ['executing', 'planning']
+    # Systems nest inside their frame span
+    first = frames[0]
+    inner = [e for e in events if e.get('cat') == 'system' and first['ts'] <= e['ts'] <= first['ts'] + first['dur']]
+    assert len(inner) == len(sim.world.systems)
+
+
+def test_buffer_is_bounded():
+    tracer = TraceRecorder(capacity=10)
+    for n in range(25):
+        tracer.instant(f'e{n}', 'test')
+    assert len(tracer.events) == 10 and tracer.dropped == 15
+    assert tracer.events[0]['name'] == 'e15'
+    assert tracer.trace()['otherData']['dropped'] == 15
+
+
+def test_call_instrumented_traces_draw_helpers_and_combines_with_profiler():
+    world = World()
+    tracer = world.enable_tracing()
+    prof = world.enable_profiling()
+    assert world.call_instrumented('render_system', lambda w: 7, world) == 7
+    assert [e['name'] for e in tracer.events] == ['render_system']
+    assert prof.snapshot()['entries']['render_system']['calls'] == 1
+    world.disable_tracing(); world.disable_profiling()
+    assert world.call_instrumented('render_system', lambda w: 8, world) == 8
+
+
+def test_global_recorder_attaches_to_new_worlds():
+    recorder = TraceRecorder()
+    tracing.install_global(recorder)
+    try:
+        assert World().tracer is recorder
+    finally:
+        tracing.install_global(None)
+    assert World().tracer is None
+
+
+def test_phase_tracking_forgets_finished_worlds():
+    recorder = TraceRecorder()
+    for _ in range(2):
+        sim = Simulation(resolve='animated')
+        sim.world.tracer = recorder
+        sim.play_turn(1, 0)
+        del sim
+        gc.collect()
+        assert len(recorder._phases) == 0
+    # Every world's first transition is recorded, even if a new World reuses an old id.
+    phases = [e['args']['to'] for e in recorder.events if e.get('cat') == 'turn']
+    assert phases == ['executing', 'planning'] * 2
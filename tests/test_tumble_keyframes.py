@@ -0,0 +1,78 @@
+import math
+from dicewalk.simulation import Simulation
+from ecs.components import GridGeometry, RenderCube, TumbleAnim
+from ecs.die_factory import create_enemy_die, PLAYER_CUBE_SCALE, ENEMY_CUBE_SCALE
+from ecs.orientation import DIRECTIONS
+from ecs.tumble import tumble_keyframes, tumble_vertices, tumble_face_polygons, face_order, build_world_tables, TUMBLE_SAMPLES
+
+
+def _geom():
+    return GridGeometry(8, 10, 20, 0, 0, tuple())
+
+
+def _exact_screen(geom, si, sj, di, dj, scale, t):
+    cx, cy = geom.iso_point(si + 0.5, sj + 0.5)
+    out = []
+    for vi, vj, vz in tumble_vertices(di, dj, scale, t):
+        out.append((cx + (vi - vj) * geom.tile_width / 2, cy + (vi + vj) * geom.tile_height / 2 + vz * geom.tile_height))
+    return out
+
+
+def test_keyframes_match_exact_rotation_at_samples():
+    geom = _geom()
+    for di, dj in DIRECTIONS:
+        for n in range(TUMBLE_SAMPLES):
+            t = n / (TUMBLE_SAMPLES - 1)
+            exact = _exact_screen(geom, 2, 3, di, dj, 0.8, t)
+            polys = tumble_face_polygons(geom, 2, 3, di, dj, 0.8, t)
+            for (face, position), (pos2, poly) in zip(face_order(di, dj), polys):
+                assert position == pos2
+                for idx, (x, y) in zip(face, poly):
+                    assert math.isclose(x, exact[idx][0], abs_tol=1e-9)
+                    assert math.isclose(y, exact[idx][1], abs_tol=1e-9)
+
+
+def test_interpolation_stays_close_between_samples():
+    geom = _geom()
+    table = tumble_keyframes(1, 0, 0.8)
+    worst = 0.0
+    for n in range(TUMBLE_SAMPLES - 1):
+        t = (n + 0.5) / (TUMBLE_SAMPLES - 1)
+        exact = _exact_screen(geom, 0, 0, 1, 0, 0.8, t)
+        cx, cy = geom.iso_point(0.5, 0.5)
+        for (u, v), (x, y) in zip(table.offsets(t), exact):
+            worst = max(worst, abs(cx + u * geom.tile_width - x), abs(cy + v * geom.tile_height - y))
+    # Under 1% of a tile height for a 10px tile
+    assert worst < 0.1
+
+
+def test_tables_are_shared_and_end_on_neighbour_tile():
+    assert tumble_keyframes(0, 1, 0.8) is tumble_keyframes(0, 1, 0.8)
+    geom = _geom()
+    end = {(round(x, 6), round(y, 6)) for _, poly in tumble_face_polygons(geom, 2, 2, 0, 1, 0.8, 1.0) for x, y in poly}
+    # A full north roll leaves the cube where a resting cube on (2, 3) would be drawn
+    rest = {(round(x, 6), round(y, 6)) for x, y in geom.cube_corners(2, 3, 0.8)}
+    assert end == rest
+
+
+def test_no_table_is_built_during_a_tumble():
+    sim = Simulation(enemy_starts=((1, 1), (6, 6)), resolve='animated')
+    odd = create_enemy_die(sim.world, 0, 7, ai=False)
+    sim.world.add_component(odd, RenderCube(scale=0.55))
+    build_world_tables(sim.world)
+    built = tumble_keyframes.cache_info().misses
+    geom = sim.geometry
+    anims = sim.world.get_component(TumbleAnim)
+    sim.submit_intent(1, 0)
+    seen = set()
+    for _ in range(120):
+        sim.step()
+        for anim in anims.values():
+            t = anim.elapsed / anim.duration if anim.duration else 1.0
+            tumble_face_polygons(geom, anim.start_i, anim.start_j, anim.di, anim.dj, anim.scale, t)
+            seen.add(anim.scale)
+    assert seen == {PLAYER_CUBE_SCALE, ENEMY_CUBE_SCALE}
+    assert tumble_keyframes.cache_info().misses == built
+    for di, dj in DIRECTIONS:
+        tumble_face_polygons(geom, 0, 7, di, dj, 0.55, 0.5)
+    assert tumble_keyframes.cache_info().misses == built
@@ -0,0 +1,156 @@
+import itertools
+import time
+
+import pytest
+
+from dicewalk.simulation import Simulation
+from ecs.components import HP, Position, TileOccupancy, DieFaces, TurnState
+from ecs.die_factory import create_enemy_die
+from ecs.storage import BorrowedStore, clone_component
+from ecs.world import World
+from ecs.zobrist import compute
+
+
+def _snapshot(world):
+    pos = world.components[Position]
+    faces = world.components[DieFaces]
+    hp = world.components[HP]
+    return ({eid: (p.i, p.j) for eid, p in pos.items()},
+            {eid: f.orientation for eid, f in faces.items()},
+            {eid: h.current for eid, h in hp.items()})
+
+
+def test_fork_isolates_writes_and_shares_untouched_stores():
+    w = World()
+    w.add_component(w.create_entity(), TileOccupancy())
+    dice = [create_enemy_die(w, i, 0, ai=False) for i in range(3)]
+    w.enable_hashing()
+    before = (_snapshot(w), dict(w.occupancy.where), w.state_hash, w.spatial.occupants_at(0, 0))
+    child = w.fork()
+    hp = child.get_component(HP)
+    assert isinstance(hp, BorrowedStore) and hp[dice[1]] is w.components[HP][dice[1]]
+    assert child.components[HP] is w.components[HP]  # reads never copy
+    child.set_position(dice[0], 5, 5)
+    child.edit_component(dice[1], HP).current = 0
+    child.zobrist.hp(dice[1], 0)
+    assert hp[dice[1]].current == 0  # the view follows the fork's own copy
+    child.destroy_entity(dice[2])
+    extra = child.create_entity()
+    child.add_component(extra, Position(7, 7))
+    assert child.components[HP] is not w.components[HP]
+    assert child.components[DieFaces] is not w.components[DieFaces]
+    # Only the edited components were cloned; the rest are still the parent's objects.
+    assert child.components[HP][dice[0]] is w.components[HP][dice[0]]
+    assert child.components[Position][dice[1]] is w.components[Position][dice[1]]
+    assert (_snapshot(w), dict(w.occupancy.where), w.state_hash, w.spatial.occupants_at(0, 0)) == before
+    assert child.occupancy.tile_of(dice[0]) == (5, 5) and dice[2] not in child.occupancy
+    assert child.spatial.occupants_at(5, 5) == [dice[0]] and w.spatial.occupants_at(5, 5) == []
+    assert child.state_hash == compute(child) != w.state_hash
+    assert list(child.query(Position, DieFaces)) == dice[:2]
+    assert list(w.query(Position, DieFaces)) == dice
+    with pytest.raises(RuntimeError):
+        w.update(0.0)
+    child.discard()
+    w.update(0.0)
+    with pytest.raises(RuntimeError):
+        child.commit()
+
+
+def test_commit_adopts_fork_state_and_refreshes_queries():
+    w = World()
+    dice = [create_enemy_die(w, i, 0, ai=False) for i in range(3)]
+    q = w.query(Position, DieFaces)
+    child = w.fork()
+    sibling = w.fork()
+    child.set_position(dice[0], 4, 4)
+    child.destroy_entity(dice[1])
+    assert child.commit() is w
+    assert w.get_component(Position)[dice[0]].i == 4
+    assert list(q) == [dice[0], dice[2]]
+    assert w.spatial.occupants_at(4, 4) == [dice[0]]
+    assert w.get_component(Position)._world is w
+    with pytest.raises(RuntimeError):  # stale after the first commit
+        sibling.commit()
+    sibling.discard()
+    w.update(0.0)
+
+
+def test_forked_simulation_replays_like_the_original():
+    sim = Simulation(enemy_starts=((1, 1), (6, 6)), resolve='instant')
+    sim.world.enable_hashing(verify=True)
+    script = list(itertools.islice(itertools.cycle([(1, 0), (0, 1), (0, 0), (-1, 0)]), 12))
+    for intent in script[:4]:
+        sim.play_turn(*intent)
+    start = (_snapshot(sim.world), sim.world.state_hash)
+    hashes = []
+    for _ in range(2):
+        fork = sim.fork()
+        for intent in script[4:]:
+            fork.play_turn(*intent)
+        hashes.append((_snapshot(fork.world), fork.world.state_hash))
+        fork.world.discard()
+        assert (_snapshot(sim.world), sim.world.state_hash) == start
+    assert hashes[0] == hashes[1] and hashes[0][1] != start[1]
+    fork = sim.fork()
+    for intent in script[4:]:
+        fork.play_turn(*intent)
+    fork.world.commit()
+    assert (_snapshot(sim.world), sim.world.state_hash) == hashes[0]
+    sim.play_turn(1, 0)  # the parent keeps running after a commit
+
+
+def test_clone_component_copies_mutable_fields():
+    occ = TileOccupancy()
+    occ.add(1, 0, 0)
+    occ.add(2, 0, 0)
+    twin = clone_component(occ)
+    assert twin.occupants[(0, 0)] is occ.occupants[(0, 0)]  # tile sets copied on write
+    twin.move(1, 2, 2)
+    assert occ.tile_of(1) == (0, 0) and occ.at(0, 0) == {1, 2}
+    assert twin.at(0, 0) == {2} and twin.at(2, 2) == {1}
+    sim = Simulation(resolve='instant')
+    turn = sim.turn
+    copy = clone_component(turn)
+    copy.planned.append({'entity': 1})
+    assert turn.planned == [] and copy.phase == turn.phase
+
+
+def test_stepping_a_fork_copies_only_what_changes():
+    starts = [(n % 100, 3 + n // 100) for n in range(5000)]
+    sim = Simulation(grid_size=128, player_start=(120, 120), enemy_starts=starts, barriers=(), resolve='instant')
+    sim.world.enable_hashing()
+    for _ in range(3):
+        sim.step()
+    parent = sim.world
+    shared = {T: store for T, store in parent.components.items()}
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        fork = sim.fork()
+        fork.step()
+        best = min(best, time.perf_counter() - start)
+        owned = [T for T in fork.world.components if T not in fork.world._borrowed]
+        fork.world.discard()
+    assert owned == [TurnState]  # planning_elapsed ticks; every dice store stays shared
+    assert best < 5e-3  # a full copy of this world costs tens of ms
+    fork = sim.fork()
+    fork.play_turn(0, 0)
+    moved = [e for e in sim.enemy_entities if fork.world.components[Position][e] is not shared[Position][e]]
+    assert 0 < len(moved) <= len(sim.enemy_entities)
+    assert shared[Position][moved[0]].i == starts[sim.enemy_entities.index(moved[0])][0]
+    fork.world.discard()
+
+
+def test_fork_cost_is_independent_of_entity_count():
+    w = World()
+    w.add_component(w.create_entity(), TileOccupancy())
+    for n in range(10_000):
+        create_enemy_die(w, n % 100, n // 100, ai=False)
+    w.enable_hashing()
+    best = float('inf')
+    for _ in range(20):
+        start = time.perf_counter()
+        child = w.fork()
+        best = min(best, time.perf_counter() - start)
+        child.discard()
+    assert best < 1e-3  # microseconds in practice; a full copy takes tens of ms
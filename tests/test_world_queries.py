@@ -0,0 +1,48 @@
+from ecs.world import World
+from ecs.components import Position, Barrier, HP
+
+
+def test_query_updates_incrementally():
+    world = World()
+    a = world.create_entity(); world.add_component(a, Position(0, 0)); world.add_component(a, Barrier())
+    b = world.create_entity(); world.add_component(b, Position(1, 0))
+    q = world.query(Position, Barrier)
+    assert list(q) == [a]
+    # Adding the missing component makes b match without rebuilding the query
+    world.add_component(b, Barrier())
+    assert list(q) == [a, b]
+    assert world.query(Position, Barrier) is q
+    # Removal through any dict-style path drops the entity
+    world.get_component(Barrier).pop(a)
+    assert list(q) == [b]
+    del world.get_component(Position)[b]
+    assert len(q) == 0
+
+
+def test_entities_with_matches_query_and_allows_mutation():
+    world = World()
+    ids = []
+    for n in range(5):
+        eid = world.create_entity()
+        world.add_component(eid, Position(n, 0))
+        if n % 2 == 0:
+            world.add_component(eid, HP(current=1, max=1))
+            ids.append(eid)
+    # Removing components while iterating must not break iteration
+    seen = []
+    for eid in world.entities_with(Position, HP):
+        seen.append(eid)
+        world.remove_component(eid, HP)
+    assert seen == ids
+    assert list(world.entities_with(Position, HP)) == []
+
+
+def test_destroy_entity_clears_all_stores():
+    world = World()
+    eid = world.create_entity()
+    world.add_component(eid, Position(2, 2))
+    world.add_component(eid, HP(current=3, max=3))
+    q = world.query(HP)
+    world.destroy_entity(eid)
+    assert eid not in world.get_component(Position)
+    assert eid not in q
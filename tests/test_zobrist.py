@@ -0,0 +1,54 @@
+import itertools
+
+import pytest
+
+from dicewalk.simulation import Simulation
+from ecs.components import HP, Patrol, Position
+from ecs.world import World
+from ecs.die_factory import create_enemy_die
+from ecs.zobrist import ZobristMismatch, compute
+
+
+def test_incremental_hash_matches_recompute_through_turns():
+    for resolve in ('instant', 'animated'):
+        sim = Simulation(enemy_starts=((1, 1), (6, 6)), resolve=resolve)
+        zh = sim.world.enable_hashing(verify=True)
+        script = itertools.cycle([(1, 0), (0, 1), (0, 0), (-1, 0), (0, -1)])
+        seen = set()
+        for _ in range(20):
+            sim.play_turn(*next(script))
+            seen.add(sim.world.state_hash)
+        assert zh.checks > 20
+        assert len(seen) > 1
+        assert sim.world.state_hash == compute(sim.world)
+
+
+def test_equal_states_hash_equal_and_fields_matter():
+    a = Simulation(resolve='instant'); b = Simulation(resolve='instant')
+    for sim in (a, b):
+        sim.world.enable_hashing()
+    assert a.world.state_hash == b.world.state_hash
+    a.play_turn(1, 0); b.play_turn(1, 0)
+    assert a.world.state_hash == b.world.state_hash
+    before = b.world.state_hash
+    hp = b.world.get_component(HP)[b.player_entity]
+    hp.current -= 1
+    b.world.zobrist.hp(b.player_entity, hp.current)
+    assert b.world.state_hash != before == a.world.state_hash
+
+
+def test_store_changes_are_tracked_and_unreported_writes_caught():
+    w = World()
+    zh = w.enable_hashing(verify=True)
+    e = create_enemy_die(w, 3, 3)
+    assert zh.value == compute(w) != 0
+    w.set_position(e, 4, 3)
+    w.add_component(e, Patrol(0, 1))  # replacement
+    assert zh.value == compute(w)
+    w.destroy_entity(e)
+    assert zh.value == 0
+    e = create_enemy_die(w, 1, 1)
+    w.get_component(Position)[e].i = 2  # bypasses set_position
+    with pytest.raises(ZobristMismatch):
+        w.update(0.016)
+    assert w.disable_hashing() is zh and w.state_hash is None